@@ -0,0 +1,5 @@
+"""
+Benchmarks of the theorem prover components which are run as modules from the root of the repository, e.g.
+
+$ python -m benchmarks.unification_benchmark
+"""
@@ -0,0 +1,195 @@
+"""
+Benchmark suite running the prover, unification, subsumption and parsing separately on the synthetic problems of
+`benchmarks.problem_generators` and emitting the measurements as JSON, so results of different versions can be compared
+
+$ python -m benchmarks.benchmark_suite -o results.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from io import StringIO
+
+from benchmarks.problem_generators import GENERATORS, subsumption_pair
+from benchmarks.unification_benchmark import UNIFIERS, nested_expressions
+from src.autonomous_theorem_prover import AutonomousTheoremProver
+from src.entity import children_entity_parser
+from src.entity.clause import Clause
+from src.entity.predicate import Predicate
+from src.input_parser import InputParser
+from src.knowledge_base_session import KnowledgeBaseSession
+from src.proof_result import ProofResult
+from src.resource_limits import ResourceLimits
+
+PROVER_SIZES = {
+    'implication_chain': [10, 20, 40],
+    'pigeonhole': [2, 3, 4],
+    'nested_terms': [8, 32, 128],
+    'ground_fact_base': [10, 50, 100],
+}
+UNIFICATION_DEPTHS = [0, 10, 100, 400]
+SUBSUMPTION_SIZES = [1, 2, 4, 8]
+PARSER_SIZES = [100, 1000, 10000]
+SESSION_SIZES = [10, 50, 100]
+SESSION_QUERIES = 20
+BENCHMARKS = ['prover', 'unify', 'subsumption', 'parser', 'session']
+
+
+def peak_memory_kb(function) -> float:
+    """
+    Peak memory allocated by Python objects while running the function, measured in a separate run since tracing
+    slows down the execution
+    """
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def prover_benchmark(limits: ResourceLimits):
+    def prove(problem_input, strategy, set_of_support):
+        prover = AutonomousTheoremProver(InputParser.parse(StringIO(problem_input)), search_strategy=strategy,
+                                         limits=limits, set_of_support=set_of_support)
+        return prover, prover.prove()
+
+    results = []
+    for generator, sizes in PROVER_SIZES.items():
+        for size in sizes:
+            problem_input = json.dumps(GENERATORS[generator](size))
+            for strategy in AutonomousTheoremProver.SEARCH_STRATEGIES:
+                for set_of_support in (False, True):
+                    # Memory is measured first, so interning of the terms is counted as well
+                    memory = peak_memory_kb(lambda: prove(problem_input, strategy, set_of_support))
+                    start = time.perf_counter()
+                    prover, result = prove(problem_input, strategy, set_of_support)
+                    results.append({'benchmark': 'prover', 'generator': generator, 'size': size,
+                                    'strategy': strategy, 'set_of_support': set_of_support,
+                                    'time_s': time.perf_counter() - start, 'peak_memory_kb': memory,
+                                    'generated_clauses': prover.monitor.generated_clauses,
+                                    'kept_clauses': len(prover.clauses), 'status': str(result)})
+    return results
+
+
+def unification_benchmark(number: int):
+    results = []
+    for depth in UNIFICATION_DEPTHS:
+        expression1, expression2 = nested_expressions(depth)
+        for name, unifier in UNIFIERS:
+            elapsed = min(timeit.repeat(lambda: unifier.unify(expression1, expression2), number=number, repeat=3))
+            results.append({'benchmark': 'unify', 'generator': 'nested_expressions', 'size': depth,
+                            'unifier': name, 'time_s': elapsed / number,
+                            'peak_memory_kb': peak_memory_kb(lambda: unifier.unify(expression1, expression2))})
+    return results
+
+
+def subsumption_benchmark(number: int):
+    def clause(predicates):
+        return Clause([Predicate.build(predicate) for predicate in children_entity_parser(predicates)])
+
+    results = []
+    for size in SUBSUMPTION_SIZES:
+        subsuming_clause, subsumed_clause = map(clause, subsumption_pair(size))
+        elapsed = min(timeit.repeat(lambda: subsuming_clause.does_subsume(subsumed_clause), number=number, repeat=3))
+        results.append({'benchmark': 'subsumption', 'generator': 'subsumption_pair', 'size': size,
+                        'time_s': elapsed / number,
+                        'peak_memory_kb': peak_memory_kb(lambda: subsuming_clause.does_subsume(subsumed_clause)),
+                        'result': subsuming_clause.does_subsume(subsumed_clause)})
+    return results
+
+
+def parser_benchmark():
+    results = []
+    for size in PARSER_SIZES:
+        problem_input = json.dumps(GENERATORS['ground_fact_base'](size))
+        memory = peak_memory_kb(lambda: InputParser.parse(StringIO(problem_input)))
+        start = time.perf_counter()
+        problem_state = InputParser.parse(StringIO(problem_input))
+        results.append({'benchmark': 'parser', 'generator': 'ground_fact_base', 'size': size,
+                        'time_s': time.perf_counter() - start, 'peak_memory_kb': memory,
+                        'clauses': len(problem_state.clauses)})
+    return results
+
+
+def session_benchmark(limits: ResourceLimits):
+    """
+    Answer the same queries on a ground fact base with a new prover per query and with a single knowledge base
+    session, where session creation is measured separately from the queries
+    """
+    results = []
+    for size in SESSION_SIZES:
+        problem = GENERATORS['ground_fact_base'](size)
+        knowledge_base = problem[InputParser.KNOWLEDGE_BASE_LABEL]
+        queries = [['~r(C{0})'.format(index * size // SESSION_QUERIES)] for index in range(SESSION_QUERIES)]
+
+        start = time.perf_counter()
+        for query in queries:
+            problem_input = json.dumps({InputParser.KNOWLEDGE_BASE_LABEL: knowledge_base,
+                                        InputParser.NEGATED_THEOREM_PREDICATES_LABEL: query})
+            AutonomousTheoremProver(InputParser.parse(StringIO(problem_input)), limits=limits).prove()
+        prover_time = (time.perf_counter() - start) / len(queries)
+
+        problem_states = [InputParser.parse(StringIO(json.dumps({
+            InputParser.KNOWLEDGE_BASE_LABEL: [] if index else knowledge_base,
+            InputParser.NEGATED_THEOREM_PREDICATES_LABEL: query}))) for index, query in enumerate(queries)]
+        start = time.perf_counter()
+        session = KnowledgeBaseSession(problem_states[0].knowledge_base_clauses)
+        setup_time = time.perf_counter() - start
+        start = time.perf_counter()
+        statuses = [str(session.query(problem_state.negated_theorem_clauses, limits=limits)) for problem_state in
+                    problem_states]
+        session_time = (time.perf_counter() - start) / len(queries)
+        results.append({'benchmark': 'session', 'generator': 'ground_fact_base', 'size': size,
+                        'queries': len(queries), 'prover_time_per_query_s': prover_time,
+                        'session_setup_s': setup_time, 'session_time_per_query_s': session_time,
+                        'proved_queries': statuses.count(ProofResult.PROVED)})
+    return results
+
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(benchmarks, number: int, limits: ResourceLimits) -> dict:
+    results = []
+    if 'prover' in benchmarks:
+        results.extend(prover_benchmark(limits))
+    if 'unify' in benchmarks:
+        results.extend(unification_benchmark(number))
+    if 'subsumption' in benchmarks:
+        results.extend(subsumption_benchmark(number))
+    if 'parser' in benchmarks:
+        results.extend(parser_benchmark())
+    if 'session' in benchmarks:
+        results.extend(session_benchmark(limits))
+    return {'commit': current_commit(), 'python': platform.python_version(), 'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'results': results}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the benchmark suite on synthetic problems and emit JSON')
+    parser.add_argument('-b', '--benchmarks', help='Benchmarks to run', nargs='+', choices=BENCHMARKS,
+                        default=BENCHMARKS)
+    parser.add_argument('-n', '--number', help='Number of calls per measurement of unify and subsumption', type=int,
+                        default=200)
+    parser.add_argument('--timeout', help='Wall-clock time limit of each proof in seconds', type=float, default=60)
+    parser.add_argument('--max-clauses', help='Maximum number of resolvents generated in each proof', type=int,
+                        default=100000)
+    parser.add_argument('-o', '--output', help='File to write JSON results, standard output if not given',
+                        type=argparse.FileType('w'), default=sys.stdout)
+    args = parser.parse_args()
+
+    report = run(args.benchmarks, args.number,
+                 ResourceLimits(timeout=args.timeout, max_generated_clauses=args.max_clauses))
+    json.dump(report, args.output, indent=2)
+    args.output.write('\n')
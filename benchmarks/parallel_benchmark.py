@@ -0,0 +1,58 @@
+import argparse
+import json
+import os
+import re
+import time
+from io import StringIO
+
+from src.autonomous_theorem_prover import AutonomousTheoremProver
+from src.input_parser import InputParser
+
+
+def scaled_sample_input(path: str, copies: int) -> str:
+    """
+    Scale up a sample input by repeating its clauses with predicate names suffixed by the copy index, the negated
+    theorem of the last copy is kept only, so the search has to saturate the other copies as well
+    :param path: Path of the sample input
+    :param copies: Number of copies
+    :return: Scaled input as JSON text
+    """
+    with open(path) as file:
+        problem = json.load(file)
+
+    def rename(clause, index):
+        return re.sub(r'(^|[,~\s])([a-z]\w*)\(', lambda m: '{0}{1}{2}('.format(m.group(1), m.group(2), index), clause)
+
+    knowledge_base = [rename(clause, index) for index in range(copies) for clause in problem['knowledge_base']]
+    negated_theorem_predicates = [rename(clause, copies - 1) for clause in problem['negated_theorem_predicates']]
+    return json.dumps({InputParser.KNOWLEDGE_BASE_LABEL: knowledge_base,
+                       InputParser.NEGATED_THEOREM_PREDICATES_LABEL: negated_theorem_predicates})
+
+
+def run(path: str, copies: int, workers_list, strategy: str):
+    problem_input = scaled_sample_input(path, copies)
+    results = []
+    for workers in workers_list:
+        problem_state = InputParser.parse(StringIO(problem_input))
+        start = time.perf_counter()
+        AutonomousTheoremProver(problem_state, search_strategy=strategy, workers=workers).prove()
+        results.append((workers, time.perf_counter() - start))
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure scaling of parallel resolution on scaled sample inputs')
+    parser.add_argument('-f', '--file', help='Sample input to scale up', default='sample_inputs/input2.inp')
+    parser.add_argument('-c', '--copies', help='Number of copies of the sample input', type=int, default=200)
+    parser.add_argument('-w', '--workers', help='Worker counts to measure', type=int, nargs='+',
+                        default=sorted({1, 2, 4, 8, os.cpu_count() or 1}))
+    parser.add_argument('-s', '--strategy', choices=AutonomousTheoremProver.SEARCH_STRATEGIES,
+                        default=AutonomousTheoremProver.BREADTH_FIRST_STRATEGY)
+    args = parser.parse_args()
+
+    print('Available CPUs: {0}'.format(os.cpu_count()))
+    print('{0:>8} | {1:>10} | {2:>8}'.format('workers', 'time (s)', 'speedup'))
+    measurements = run(args.file, args.copies, args.workers, args.strategy)
+    baseline = measurements[0][1]
+    for workers, elapsed in measurements:
+        print('{0:>8} | {1:>10.3f} | {2:>7.2f}x'.format(workers, elapsed, baseline / elapsed))
@@ -0,0 +1,51 @@
+import argparse
+import json
+import time
+from io import StringIO
+
+from benchmarks.problem_generators import ground_fact_base
+from src.input_parser import InputParser
+
+
+def nested_clause(depth: int) -> str:
+    """
+    Clause of two predicates where each of them has a term of `depth` many nested functions
+    """
+    term = 'x'
+    for index in range(depth):
+        term = 'f{0}({1}, A)'.format(index % 3, term)
+    return 'p({0}), ~q(B, {0})'.format(term)
+
+
+def run(depths, sizes):
+    nested_results = []
+    for depth in depths:
+        clause = nested_clause(depth)
+        start = time.perf_counter()
+        InputParser.parse_clause(clause)
+        nested_results.append((depth, time.perf_counter() - start))
+
+    knowledge_base_results = []
+    for size in sizes:
+        problem_input = json.dumps(ground_fact_base(size // 2))
+        start = time.perf_counter()
+        problem_state = InputParser.parse(StringIO(problem_input))
+        knowledge_base_results.append((len(problem_state.clauses), time.perf_counter() - start))
+    return nested_results, knowledge_base_results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure parsing of deeply nested terms and large knowledge bases')
+    parser.add_argument('-d', '--depths', help='Nesting depths of the terms', type=int, nargs='+',
+                        default=[10, 100, 200, 400])
+    parser.add_argument('-c', '--clauses', help='Number of clauses of the knowledge bases', type=int, nargs='+',
+                        default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    nested_measurements, knowledge_base_measurements = run(args.depths, args.clauses)
+    print('{0:>8} | {1:>10}'.format('depth', 'time (ms)'))
+    for depth, elapsed in nested_measurements:
+        print('{0:>8} | {1:>10.3f}'.format(depth, elapsed * 1e3))
+    print('{0:>8} | {1:>10}'.format('clauses', 'time (s)'))
+    for clauses, elapsed in knowledge_base_measurements:
+        print('{0:>8} | {1:>10.3f}'.format(clauses, elapsed))
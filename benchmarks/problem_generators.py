@@ -0,0 +1,113 @@
+"""
+Parametric generators of synthetic problems whose size grows with a single parameter, each generator returns the problem
+in the input format of `InputParser`, i.e. a dictionary of knowledge base and negated theorem clauses
+"""
+import json
+import unittest
+from io import StringIO
+
+from src.input_parser import InputParser
+
+
+def _problem(knowledge_base, negated_theorem_predicates) -> dict:
+    return {InputParser.KNOWLEDGE_BASE_LABEL: knowledge_base,
+            InputParser.NEGATED_THEOREM_PREDICATES_LABEL: negated_theorem_predicates}
+
+
+def implication_chain(length: int) -> dict:
+    """
+    Chain of implications p0(x) -> p1(x) -> ... -> pN(x) with the fact p0(A), where pN(A) is the theorem
+    Proof requires `length` resolution steps and the number of resolvents grows quadratically with the length
+    """
+    knowledge_base = ['p0(A)']
+    knowledge_base.extend('~p{0}(x{0}),p{1}(x{0})'.format(index, index + 1) for index in range(length))
+    return _problem(knowledge_base, ['~p{0}(A)'.format(length)])
+
+
+def pigeonhole(holes: int) -> dict:
+    """
+    Pigeonhole principle of `holes + 1` pigeons and `holes` holes in terms of ground literals in(Pi, Hj), which is
+    unsatisfiable and well known to be exponentially hard for resolution
+    Clause of the last pigeon is given as the negated theorem
+    """
+    pigeons = holes + 1
+    clauses = [','.join('in(P{0},H{1})'.format(pigeon, hole) for hole in range(holes)) for pigeon in range(pigeons)]
+    knowledge_base = ['~in(P{0},H{2}),~in(P{1},H{2})'.format(pigeon1, pigeon2, hole) for hole in range(holes) for
+                      pigeon1 in range(pigeons) for pigeon2 in range(pigeon1 + 1, pigeons)]
+    return _problem(clauses[:-1] + knowledge_base, clauses[-1:])
+
+
+def nested_terms(depth: int) -> dict:
+    """
+    Fact p(f(f(...f(A)...))) with `depth` many function applications and the rule p(f(x)) -> p(x), where p(A) is the
+    theorem, so unification works on terms of decreasing depth while the rule resolves with its own resolvents
+    """
+    term = 'A'
+    for _ in range(depth):
+        term = 'f({0})'.format(term)
+    return _problem(['p({0})'.format(term), '~p(f(x)),p(x)'], ['~p(A)'])
+
+
+def ground_fact_base(facts: int) -> dict:
+    """
+    Large base of ground facts p(Ci) and q(Ci) with the rule p(x), q(x) -> r(x), where r of the last constant is the
+    theorem, so most of the clauses are irrelevant to the proof
+    """
+    knowledge_base = ['p(C{0})'.format(index) for index in range(facts)]
+    knowledge_base.extend('q(C{0})'.format(index) for index in range(facts))
+    knowledge_base.append('~p(x),~q(x),r(x)')
+    return _problem(knowledge_base, ['~r(C{0})'.format(facts - 1)])
+
+
+def subsumption_pair(size: int) -> tuple:
+    """
+    Pair of clauses where the first one subsumes the second one, the first clause has `size` literals sharing the
+    variable y and the second clause has two ground instances of each literal and an extra literal
+    """
+    subsuming_clause = ','.join('p{0}(x{0},f(y))'.format(index) for index in range(size))
+    subsumed_clause = ','.join('p{0}(C{0},f(D)),p{0}(C{0},g(D))'.format(index) for index in range(size))
+    return subsuming_clause, subsumed_clause + ',q(D)'
+
+
+GENERATORS = {
+    'implication_chain': implication_chain,
+    'pigeonhole': pigeonhole,
+    'nested_terms': nested_terms,
+    'ground_fact_base': ground_fact_base,
+}
+
+
+class ProblemGeneratorsUnitTest(unittest.TestCase):
+
+    @staticmethod
+    def _prove(problem: dict, **kwargs):
+        from src.autonomous_theorem_prover import AutonomousTheoremProver
+        return AutonomousTheoremProver(InputParser.parse(StringIO(json.dumps(problem))), **kwargs).prove()
+
+    def test_generators(self):
+        from src.autonomous_theorem_prover import AutonomousTheoremProver
+        from src.proof_result import ProofResult
+
+        for name, generator in GENERATORS.items():
+            problem = generator(2)
+            for strategy in (AutonomousTheoremProver.BREADTH_FIRST_STRATEGY,
+                             AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY):
+                for set_of_support in (False, True):
+                    with self.subTest(generator=name, strategy=strategy, set_of_support=set_of_support):
+                        self.assertEqual(ProofResult(ProofResult.PROVED), ProblemGeneratorsUnitTest._prove(
+                            problem, search_strategy=strategy, set_of_support=set_of_support))
+            # Knowledge base alone is consistent, but the rule of nested terms resolves with its own resolvents forever
+            if name != 'nested_terms':
+                with self.subTest(generator=name):
+                    self.assertEqual(ProofResult(ProofResult.SATURATED), ProblemGeneratorsUnitTest._prove(
+                        dict(problem, **{InputParser.NEGATED_THEOREM_PREDICATES_LABEL: []}),
+                        search_strategy=AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY))
+
+    def test_subsumption_pair(self):
+        from src.entity.clause import Clause
+
+        subsuming_clause, subsumed_clause = (Clause(InputParser.parse_clause(clause)) for clause in subsumption_pair(3))
+        self.assertEqual(3, subsuming_clause.get_clause_length())
+        self.assertEqual(7, subsumed_clause.get_clause_length())
+        self.assertTrue(subsuming_clause.does_subsume(subsumed_clause))
+        self.assertFalse(subsumed_clause.does_subsume(subsuming_clause))
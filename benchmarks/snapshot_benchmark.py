@@ -0,0 +1,50 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+from io import StringIO
+
+from benchmarks.problem_generators import ground_fact_base
+from src.autonomous_theorem_prover import AutonomousTheoremProver
+from src.input_parser import InputParser
+from src.snapshot import ProblemSnapshot
+
+
+def run(sizes):
+    """
+    Compare parsing and preprocessing of the JSON input with loading the snapshot of the preprocessed problem
+    :return: Number of clauses, parse time, snapshot load time and sizes of the input and the snapshot for each size
+    """
+    results = []
+    for size in sizes:
+        problem_input = json.dumps(ground_fact_base(size // 2))
+        start = time.perf_counter()
+        problem_state = AutonomousTheoremProver.preprocess(InputParser.parse(StringIO(problem_input)))
+        parse_time = time.perf_counter() - start
+
+        file_descriptor, path = tempfile.mkstemp(suffix='.snap')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                ProblemSnapshot.write(problem_state, file)
+            start = time.perf_counter()
+            ProblemSnapshot.read(path)
+            load_time = time.perf_counter() - start
+            snapshot_size = os.path.getsize(path)
+        finally:
+            os.remove(path)
+        results.append((len(problem_state.clauses), parse_time, load_time, len(problem_input), snapshot_size))
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure cold start from JSON input and from binary snapshot')
+    parser.add_argument('-c', '--clauses', help='Number of clauses of the knowledge bases', type=int, nargs='+',
+                        default=[250, 500, 1000, 2000])
+    args = parser.parse_args()
+
+    print('{0:>8} | {1:>10} | {2:>10} | {3:>10} | {4:>10}'.format('clauses', 'parse (s)', 'load (s)', 'json (kB)',
+                                                                  'snap (kB)'))
+    for clauses, parse_time, load_time, input_size, snapshot_size in run(args.clauses):
+        print('{0:>8} | {1:>10.3f} | {2:>10.3f} | {3:>10.1f} | {4:>10.1f}'.format(
+            clauses, parse_time, load_time, input_size / 1024, snapshot_size / 1024))
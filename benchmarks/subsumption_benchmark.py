@@ -0,0 +1,95 @@
+import argparse
+import itertools
+import timeit
+
+from benchmarks.problem_generators import subsumption_pair
+from src.entity import children_entity_parser
+from src.entity.clause import Clause
+from src.entity.predicate import Predicate
+
+
+def product_subsumption(clause1: Clause, clause2: Clause) -> bool:
+    """
+    Former subsumption check of `Clause.does_subsume` which enumerates the product of a single literal of each
+    (name, negation) group of both clauses and checks each pair of literals independently
+    """
+    if not Clause._fast_check_by_negation_and_name(clause1, clause2):
+        return False
+    first_group = {key: list(group) for key, group in
+                   itertools.groupby(clause1.predicates, lambda p: (p.get_name(), p.is_negated))}
+    second_group = {key: list(group) for key, group in
+                    itertools.groupby(clause2.predicates, lambda p: (p.get_name(), p.is_negated))}
+    common_keys = first_group.keys() & second_group.keys()
+    filtered_first_group = [first_group[key] for key in common_keys]
+    filtered_second_group = [second_group[key] for key in common_keys]
+    for multiplication in itertools.product(itertools.product(*filtered_first_group),
+                                            itertools.product(*filtered_second_group)):
+        if all(child == other_child or child.is_less_specific(other_child)
+               for child, other_child in zip(multiplication[0], multiplication[1])):
+            return True
+    return False
+
+
+def clause(predicates: str) -> Clause:
+    return Clause([Predicate.build(predicate) for predicate in children_entity_parser(predicates)])
+
+
+def path_pair(size: int) -> tuple:
+    """
+    Pair of clauses where the first one is a path p(x0, x1), ..., p(xN-1, xN) of `size` edges and the second one is a
+    ground cycle of `size` edges plus a dangling edge, so only a consistent binding of the shared variables subsumes
+    """
+    subsuming_clause = ','.join('p(x{0},x{1})'.format(index, index + 1) for index in range(size))
+    subsumed_clause = ','.join('p(C{0},C{1})'.format(index, (index + 1) % size) for index in range(size))
+    return subsuming_clause, subsumed_clause + ',p(D,C0)'
+
+
+def missing_literal_pair(size: int) -> tuple:
+    """
+    Pair of `subsumption_pair` where the subsuming clause has an extra literal q(E) which does not exist in the other
+    clause, so no combination of the other literals subsumes
+    """
+    subsuming_clause, subsumed_clause = subsumption_pair(size)
+    return subsuming_clause + ',q(E)', subsumed_clause
+
+
+def disjoint_path_pair(size: int) -> tuple:
+    """
+    Pair of clauses where the first one is the path of `path_pair` and the second one has `size` disjoint ground
+    edges, so the first clause does not subsume the second one for sizes greater than one
+    """
+    subsuming_clause = ','.join('p(x{0},x{1})'.format(index, index + 1) for index in range(size))
+    return subsuming_clause, ','.join('p(C{0},D{0})'.format(index) for index in range(size))
+
+
+PAIRS = [('subsumption_pair', subsumption_pair), ('missing_literal_pair', missing_literal_pair),
+         ('path_pair', path_pair), ('disjoint_path_pair', disjoint_path_pair)]
+
+
+def run(sizes, number: int):
+    results = []
+    for name, generator in PAIRS:
+        for size in sizes:
+            subsuming_clause, subsumed_clause = map(clause, generator(size))
+            timings, answers = {}, {}
+            for method, function in [('product', product_subsumption), ('matcher', Clause.does_subsume)]:
+                timings[method] = min(timeit.repeat(lambda: function(subsuming_clause, subsumed_clause),
+                                                    number=number, repeat=3)) / number
+                answers[method] = function(subsuming_clause, subsumed_clause)
+            results.append((name, size, timings, answers))
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare the product enumeration and matching based subsumption')
+    parser.add_argument('-s', '--sizes', help='Number of literals of the subsuming clauses', type=int, nargs='+',
+                        default=[1, 2, 4, 8, 12])
+    parser.add_argument('-n', '--number', help='Number of subsumption checks per measurement', type=int, default=20)
+    args = parser.parse_args()
+
+    print('{0:>20} | {1:>6} | {2:>14} | {3:>14} | {4:>8} | {5}'.format('pair', 'size', 'product (us)',
+                                                                       'matcher (us)', 'speedup', 'results'))
+    for name, size, timings, answers in run(args.sizes, args.number):
+        old, new = timings['product'] * 1e6, timings['matcher'] * 1e6
+        print('{0:>20} | {1:>6} | {2:>14.2f} | {3:>14.2f} | {4:>7.2f}x | {5} / {6}'.format(
+            name, size, old, new, old / new, answers['product'], answers['matcher']))
@@ -0,0 +1,51 @@
+import argparse
+import timeit
+
+from src.entity.function import Function
+from src.entity.variable import Variable
+from src.most_general_unifier import MostGeneralUnifier, TriangularUnifier
+
+UNIFIERS = [('MostGeneralUnifier', MostGeneralUnifier), ('TriangularUnifier', TriangularUnifier)]
+
+
+def nested_expressions(depth: int):
+    """
+    Deeply nested version of the README example `p(f(h(w)), y, g(k(f(h(w))), x))` and `p(u, k(f(h(w))), g(z, h(w)))`
+    where `f(h(w))` is wrapped into `depth` many `f` functions
+    :param depth: Number of extra function nestings
+    :return: Children of both expressions
+    """
+    nested = Function.build('f(h(w))')
+    for _ in range(depth):
+        nested = Function('f', [nested])
+    expression1 = Function('p', [nested, Variable.build('y'),
+                                 Function('g', [Function('k', [nested]), Variable.build('x')])])
+    expression2 = Function('p', [Variable.build('u'), Function('k', [nested]),
+                                 Function('g', [Variable.build('z'), Function.build('h(w)')])])
+    return expression1.get_child(), expression2.get_child()
+
+
+def run(depths, repeat: int):
+    results = []
+    for depth in depths:
+        expression1, expression2 = nested_expressions(depth)
+        timings = {}
+        for name, unifier in UNIFIERS:
+            timings[name] = min(timeit.repeat(lambda: unifier.unify(expression1, expression2), number=repeat,
+                                              repeat=3)) / repeat
+        results.append((depth, timings))
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare unifier implementations on deeply nested functions')
+    parser.add_argument('-d', '--depths', help='Nesting depths to benchmark', type=int, nargs='+',
+                        default=[0, 10, 50, 100, 200, 400])
+    parser.add_argument('-n', '--number', help='Number of unifications per measurement', type=int, default=200)
+    args = parser.parse_args()
+
+    print('{0:>8} | {1:>22} | {2:>22} | {3:>8}'.format('depth', *[name + ' (us)' for name, _ in UNIFIERS],
+                                                       'speedup'))
+    for depth, timings in run(args.depths, args.number):
+        old, new = timings['MostGeneralUnifier'] * 1e6, timings['TriangularUnifier'] * 1e6
+        print('{0:>8} | {1:>22.2f} | {2:>22.2f} | {3:>7.2f}x'.format(depth, old, new, old / new))
@@ -20,11 +20,15 @@ class ProblemState(object):
     """
 
     def __init__(self, knowledge_base: List[List[Predicate]],
-                 negated_theorem_clauses: List[List[Predicate]]):
-        # Combine all the clauses into a single clause list
+                 negated_theorem_clauses: List[List[Predicate]], is_preprocessed: bool = False):
         from src.entity.clause import Clause
-        self.clauses = [Clause(clause) for clause in knowledge_base]
-        self.clauses.extend([Clause(clause) for clause in negated_theorem_clauses])
+        # Whether tautologies and subsumed clauses are already removed, so that prover does not repeat it
+        self.is_preprocessed = is_preprocessed
+        # Clauses of both groups are kept separately so that clauses descending from the negated theorem are known
+        self.knowledge_base_clauses = [Clause(clause) for clause in knowledge_base]
+        self.negated_theorem_clauses = [Clause(clause) for clause in negated_theorem_clauses]
+        # Combine all the clauses into a single clause list
+        self.clauses = self.knowledge_base_clauses + self.negated_theorem_clauses
 
 
 class ProblemStateUnitTest(unittest.TestCase):
@@ -45,3 +49,5 @@ class ProblemStateUnitTest(unittest.TestCase):
                                      negated_theorem_clauses=negated_theorem_clauses)
 
         self.assertEqual(5, len(problem_state.clauses))
+        self.assertEqual(2, len(problem_state.knowledge_base_clauses))
+        self.assertEqual(3, len(problem_state.negated_theorem_clauses))
@@ -1,27 +1,125 @@
 import argparse
+import json
 import logging
-from collections import deque
-from typing import Set
+import sys
+import time
+import unittest
+from contextlib import nullcontext
+from typing import List, Optional, Set, Tuple
 
 from . import ProblemState
+from .clause_index import LiteralIndex, SubsumptionIndex
 from .entity.clause import Clause
 from .input_parser import InputParser
-
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)-8s : %(message)s',
-                    datefmt='%Y-%m-%d %H:%M:%S')
+from .literal_selection import LiteralSelector
+from .most_general_unifier import Substitution
+from .parallel_resolution import ParallelResolver
+from .passive_queue import PassiveQueue
+from .proof_graph import ProofGraph
+from .proof_renderer import ProofRenderer
+from .proof_result import ProofResult, ProofStep
+from .resource_limits import CancellationToken, ResourceLimitExceeded, ResourceLimits, ResourceMonitor
+from .search_profiler import SearchProfiler, StackSampler
+from .search_statistics import SearchStatistics
+from .snapshot import ProblemSnapshot
+from .term_ordering import TERM_ORDERINGS
+from .unit_resulting_resolution import UnitResultingResolver
 
 
 class AutonomousTheoremProver(object):
+    BREADTH_FIRST_STRATEGY = 'bfs'
+    GIVEN_CLAUSE_STRATEGY = 'given-clause'
+    ITERATIVE_DEEPENING_STRATEGY = 'iterative-deepening'
+    SEARCH_STRATEGIES = [BREADTH_FIRST_STRATEGY, GIVEN_CLAUSE_STRATEGY, ITERATIVE_DEEPENING_STRATEGY]
+    # Reason of the unknown result when iterative deepening reaches its maximum depth
+    MAX_DEPTH = 'max_depth'
+    # Number of clause pairs resolved between two checks of the resource limits in a level of breadth first search
+    RESOLUTION_BATCH_SIZE = 1024
 
-    def __init__(self, _problem_state: ProblemState):
+    def __init__(self, _problem_state: ProblemState, search_strategy: str = BREADTH_FIRST_STRATEGY, workers: int = 1,
+                 limits: Optional[ResourceLimits] = None, cancellation_token: Optional[CancellationToken] = None,
+                 statistics: Optional[SearchStatistics] = None, profiler: Optional[SearchProfiler] = None,
+                 set_of_support: bool = False, unit_preference: bool = False,
+                 unit_resulting_resolution: bool = False, literal_selector: Optional[LiteralSelector] = None,
+                 age_weight_ratio: Optional[Tuple[int, int]] = None, goal_distance_bonus: int = 0,
+                 max_depth: Optional[int] = None, usable_index: Optional[LiteralIndex] = None,
+                 usable_subsumption_index: Optional[SubsumptionIndex] = None):
+        if search_strategy not in AutonomousTheoremProver.SEARCH_STRATEGIES:
+            raise ValueError('Unknown search strategy: {0}'.format(search_strategy))
+        if (unit_preference or unit_resulting_resolution or age_weight_ratio is not None) and \
+                search_strategy != AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY:
+            raise ValueError('Unit preference, UR resolution and best first selection are supported only by given '
+                             'clause strategy')
+        if goal_distance_bonus and age_weight_ratio is None:
+            raise ValueError('Goal distance bonus is supported only by best first selection')
+        if max_depth is not None and search_strategy != AutonomousTheoremProver.ITERATIVE_DEEPENING_STRATEGY:
+            raise ValueError('Maximum depth is supported only by iterative deepening strategy')
+        if max_depth is not None and max_depth < 1:
+            raise ValueError('Maximum depth should be positive: {0}'.format(max_depth))
+        if literal_selector is not None and search_strategy == AutonomousTheoremProver.ITERATIVE_DEEPENING_STRATEGY:
+            raise ValueError('Ordered resolution is not supported by iterative deepening strategy')
+        if (usable_index is None) != (usable_subsumption_index is None):
+            raise ValueError('Literal and subsumption indices of the usable clauses should be given together')
+        if usable_index is not None and search_strategy != AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY:
+            raise ValueError('Usable clauses are supported only by given clause strategy')
+        if workers < 1:
+            raise ValueError('Number of workers should be positive: {0}'.format(workers))
         self.problem_state = _problem_state
-        self.clauses = set(self.problem_state.clauses)
+        self.search_strategy = search_strategy
+        # Number of processes resolving clause pairs, resolution is done in the current process if it is one
+        self.workers = workers
+        # Resource limits and cancellation are checked regularly while searching
+        self.monitor = ResourceMonitor(limits, cancellation_token)
+        # Search statistics are collected only if they are given, they are counted by the components of the search
+        self.statistics = statistics
+        # Phases of the search are recorded only if profiler is given
+        self.profiler = profiler
+        # Given clause search selects unit clauses first and infers unit clauses with UR resolution if they are used
+        self.unit_preference = unit_preference
+        self.unit_resulting_resolution = unit_resulting_resolution
+        # Only the eligible literals of the clauses are resolved upon if ordered resolution is used
+        self.literal_selector = literal_selector
+        # Given clause search selects light clauses derived from the goal first if best first selection is used
+        self.age_weight_ratio = age_weight_ratio
+        self.goal_distance_bonus = goal_distance_bonus
+        # Iterative deepening stops with unknown result after the round of the maximum depth if it is given
+        self.max_depth = max_depth
+        # Indices of the usable clauses which are shared with other searches, e.g. the knowledge base of a session,
+        # given clause search resolves with them and subsumes by them but never changes them
+        self.usable_index = usable_index
+        self.usable_subsumption_index = usable_subsumption_index
+
+        # Remove tautologies and subsumptions unless they are already removed, e.g. in a snapshot
+        if self.problem_state.is_preprocessed:
+            preprocessed_state = self.problem_state
+        else:
+            with self._phase('preprocess', clauses=len(self.problem_state.clauses)):
+                preprocessed_state = AutonomousTheoremProver.preprocess(self.problem_state)
+        self.clauses = set(preprocessed_state.clauses)
+        # Set of support consists of the negated theorem clauses, every resolvent descends from them if it is used
+        self.set_of_support = set_of_support
+        self.support_clauses = set(preprocessed_state.negated_theorem_clauses) if set_of_support else self.clauses
+        # Goal distances of the clauses are measured from the negated theorem clauses in best first selection
+        self.negated_theorem_clauses = set(preprocessed_state.negated_theorem_clauses)
+        # Resolvents of the first level descend from the set of support only if it is used
+        self.last_generated_resolvent = self.support_clauses
+        # Provenance of the resolvents of the last search, e.g. to show them with ProofRenderer
+        self.proof_graph = ProofGraph()
 
+    @staticmethod
+    def preprocess(problem_state: ProblemState) -> ProblemState:
+        """
+        Removal of tautologies and subsumed clauses of the problem where order of the kept clauses is preserved
+        :param problem_state: Problem state to preprocess
+        :return: Preprocessed problem state
+        """
         # Remove tautologies
-        self.clauses = set(clause for clause in self.clauses if not clause.has_tautology())
+        clauses = set(clause for clause in problem_state.clauses if not clause.has_tautology())
         # Remove subsumptions
-        self.clauses = self.remove_subsumptions(self.clauses)
-        self.last_generated_resolvent = self.clauses
+        clauses = AutonomousTheoremProver.remove_subsumptions(clauses)
+        return ProblemState([clause.predicates for clause in problem_state.knowledge_base_clauses if clause in clauses],
+                            [clause.predicates for clause in problem_state.negated_theorem_clauses if
+                             clause in clauses], is_preprocessed=True)
 
     def prove(self):
         """
@@ -44,142 +142,1038 @@ class AutonomousTheoremProver(object):
             * CLAUSES <- CLAUSES + {r_ij}
         * end while
         * return satisfaction
+
+        Clauses are selected either level by level (breadth first), one given clause at a time, see
+        :meth:`given_clause_search`, or depth first along linear derivations of increasing depth, see
+        :meth:`iterative_deepening_search`. Search stops with unknown result if any of the resource limits is exceeded
+        or search is cancelled.
+
+        If set of support strategy is used, at least one parent of each resolvent descends from the negated theorem
+        clauses, i.e. clauses of the knowledge base are never resolved with each other. Set of support is complete as
+        long as the knowledge base is consistent.
+
+        If ordered resolution is used, two clauses are resolved only upon their eligible literals, i.e. selected
+        literals or maximal literals with respect to a term ordering, see :class:`LiteralSelector`. Resolvents are never
+        factored, so ordered resolution may saturate on an unsatisfiable set of clauses, e.g. with selection.
+
+        Nothing is logged while proving, see :class:`ProofRenderer` to show the result.
+
+        :return: Result of the search which is truthy only if EMPTY_CLAUSE is reached, resolution steps are given only
+        if the theorem is proved
+        """
+        start_time = time.perf_counter()
+        self.monitor.start()
+        with ParallelResolver(self.workers, self.statistics) as resolver:
+            if self.search_strategy == AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY:
+                result, self.proof_graph = self.given_clause_search(resolver, self.monitor)
+            elif self.search_strategy == AutonomousTheoremProver.ITERATIVE_DEEPENING_STRATEGY:
+                result, self.proof_graph = self.iterative_deepening_search(resolver, self.monitor)
+            else:
+                result, self.proof_graph = self.breadth_first_search(resolver, self.monitor)
+
+        # Proof is reconstructed only if EMPTY_CLAUSE is reached
+        if result:
+            with self._phase('proof reconstruction'):
+                result.steps = self.proof_graph.proof_steps(Clause([]))
+        result.stats = {'generated_clauses': self.monitor.generated_clauses, 'kept_clauses': len(self.clauses),
+                        'elapsed_s': time.perf_counter() - start_time}
+        return result
+
+    def _eligible_literals(self):
+        """
+        Eligible literals function of the literal indices, every literal is eligible without ordered resolution
+        """
+        return self.literal_selector.eligible_literals if self.literal_selector is not None else None
+
+    def _phase(self, name: str, **args):
+        """
+        Context of a search phase which is recorded only if profiler is given
+        """
+        return self.profiler.span(name, **args) if self.profiler is not None else nullcontext(args)
+
+    def breadth_first_search(self, resolver: Optional[ParallelResolver] = None,
+                             monitor: Optional[ResourceMonitor] = None) -> Tuple[ProofResult, ProofGraph]:
+        """
+        Level-wise generation of resolvents where each level resolves the clauses generated in the previous level with
+        all the known clauses and with each other
+        :param resolver: Resolver of clause pairs, clause pairs are resolved in the current process if not given
+        :param monitor: Monitor of the resource limits, search is not limited if not given
+        :return: Result and proof graph of the generated resolvents
         """
+        if monitor is None:
+            monitor = ResourceMonitor()
         # Result of founding empty clause or not which represents contradiction in knowledge base
         result = False
-        # Dictionary to keep track of which clauses resulted into key clause
-        resolvent_dictionary = {}
+        # Graph to keep track of which clauses resulted into each resolvent
+        proof_graph = ProofGraph()
+        # Literal index of the known clauses which is updated as known clauses grow
+        clause_index = LiteralIndex(self.clauses, self._eligible_literals())
+        # Subsumption index of the known clauses and the clauses generated in the last level
+        subsumption_index = SubsumptionIndex(self.clauses, self.statistics)
         level = 1
 
         while len(self.last_generated_resolvent) != 0:
-            new_resolvent_set = set(
-                self.generate_next_level_resolvent(self.clauses, self.last_generated_resolvent, resolvent_dictionary,
-                                                   level))
-
-            if any(resolvent for resolvent in new_resolvent_set if resolvent.get_clause_length() == 0):
-                # Collect all the clauses, we found the result
-                result = True
-                self.clauses = self.clauses.union(new_resolvent_set)
-                self.clauses = self.clauses.union(self.last_generated_resolvent)
-                break
+            with self._phase('level {0}'.format(level), level=level,
+                             new_clauses=len(self.last_generated_resolvent)):
+                if self.statistics is not None:
+                    level_start_time, generated_clauses = time.perf_counter(), monitor.generated_clauses
+                # Clauses of the last level are also resolved with each other, which ordered resolution relies on
+                for clause in self.last_generated_resolvent - self.clauses:
+                    clause_index.add(clause)
+                try:
+                    new_resolvent_set = set(
+                        self.generate_next_level_resolvent(self.clauses, self.last_generated_resolvent,
+                                                           proof_graph, level, clause_index, resolver, monitor))
+                except ResourceLimitExceeded as exception:
+                    self.clauses = self.clauses.union(self.last_generated_resolvent)
+                    return ProofResult(ProofResult.UNKNOWN, exception.reason), proof_graph
 
-            # Check any new clause is generated or not, if so we do not need to iterate over and over again
-            if len(self.clauses.intersection(new_resolvent_set)) == len(new_resolvent_set):
-                # Collect all the clauses
-                self.clauses = self.clauses.union(new_resolvent_set)
-                self.clauses = self.clauses.union(self.last_generated_resolvent)
-                break
+                if any(resolvent for resolvent in new_resolvent_set if resolvent.get_clause_length() == 0):
+                    # Collect all the clauses, we found the result
+                    result = True
+                    self.clauses = self.clauses.union(new_resolvent_set)
+                    self.clauses = self.clauses.union(self.last_generated_resolvent)
+                    if self.statistics is not None:
+                        self.statistics.record_iteration(level, time.perf_counter() - level_start_time,
+                                                         len(self.clauses), monitor.generated_clauses -
+                                                         generated_clauses, len(new_resolvent_set))
+                    break
+
+                # Discard new resolvents subsumed by known clauses and retire known clauses subsumed by new resolvents
+                with self._phase('subsumption', resolvents=len(new_resolvent_set)):
+                    new_resolvent_set, retired_clauses = self.apply_subsumption(new_resolvent_set, subsumption_index)
+                for clause in retired_clauses:
+                    clause_index.remove(clause)
+                self.clauses = self.clauses.difference(retired_clauses)
+                self.last_generated_resolvent = self.last_generated_resolvent.difference(retired_clauses)
+
+                if self.statistics is not None:
+                    self.statistics.record_iteration(
+                        level, time.perf_counter() - level_start_time,
+                        len(self.clauses | self.last_generated_resolvent | new_resolvent_set),
+                        monitor.generated_clauses - generated_clauses, len(new_resolvent_set - self.clauses))
 
-            self.clauses = self.clauses.union(self.last_generated_resolvent)
-            self.last_generated_resolvent = new_resolvent_set
+                # Check any new clause is generated or not, if so we do not need to iterate over and over again
+                if len(self.clauses.intersection(new_resolvent_set)) == len(new_resolvent_set):
+                    # Collect all the clauses
+                    self.clauses = self.clauses.union(new_resolvent_set)
+                    self.clauses = self.clauses.union(self.last_generated_resolvent)
+                    break
+
+                self.clauses = self.clauses.union(self.last_generated_resolvent)
+                self.last_generated_resolvent = new_resolvent_set
 
             # Increment level of BFS
             level += 1
 
-        self.show_results(result, resolvent_dictionary, level + 1)
+        return AutonomousTheoremProver._search_result(result, monitor), proof_graph
+
+    def given_clause_search(self, resolver: Optional[ParallelResolver] = None,
+                            monitor: Optional[ResourceMonitor] = None) -> Tuple[ProofResult, ProofGraph]:
+        """
+        Given Clause Algorithm
+        ======================
+        Saturation procedure in the style of Otter/DISCOUNT where clauses are kept in two sets
+
+        * Passive: Clauses waiting to be selected, processed in first in first out order unless best first selection is
+          used
+        * Active: Clauses already selected, every pair of them is already resolved, kept in a literal index
+
+        At each iteration single clause is selected from passive set, moved into active set and resolved with all the
+        active clauses. New resolvents which are neither tautologies nor already known are appended to passive set.
+        Every new resolvent is discarded if a kept clause subsumes it (forward subsumption), otherwise kept clauses
+        subsumed by it are retired from both sets (backward subsumption). Search ends when EMPTY_CLAUSE is generated
+        or passive set becomes empty.
+
+        If set of support strategy is used, only the clauses of the set of support are put into passive set, clauses of
+        the knowledge base are active from the beginning, so they are resolved only with the given clauses.
+
+        If indices of usable clauses are given, every given clause is resolved with the usable clauses as well and they
+        subsume the initial clauses and the resolvents, but they are never given, retired or inserted into, so the
+        indices can be shared among searches, see :class:`KnowledgeBaseSession`.
+
+        If unit preference is used, unit clauses of passive set are selected before the others, see
+        :class:`PassiveQueue`. If best first selection is used, light clauses close to the goal are selected first
+        while the oldest clause is still selected regularly with the age to weight ratio, see :class:`BestFirstQueue`.
+        If UR resolution is used, each given clause is also resolved with the active unit
+        clauses into unit clauses, see :class:`UnitResultingResolver`, where a unit given clause is the first electron
+        of its binary resolvents with the active clauses.
+
+        :param resolver: Resolver of clause pairs, clause pairs are resolved in the current process if not given
+        :param monitor: Monitor of the resource limits, search is not limited if not given
+        :return: Result and proof graph of the generated resolvents
+        """
+        if resolver is None:
+            resolver = ParallelResolver(statistics=self.statistics)
+        if monitor is None:
+            monitor = ResourceMonitor()
+
+        if Clause([]) in self.clauses:
+            return ProofResult(ProofResult.PROVED), ProofGraph()
+        initial_clauses = self.support_clauses
+        if self.usable_subsumption_index is not None:
+            # Initial clauses subsumed by the usable clauses are redundant
+            initial_clauses = [clause for clause in initial_clauses if
+                               not self.usable_subsumption_index.is_subsumed(clause)]
+        passive = PassiveQueue(sorted(initial_clauses, key=Clause.get_sort_key),
+                               self.unit_preference, self.age_weight_ratio, self.negated_theorem_clauses,
+                               self.goal_distance_bonus)
+        # Active clauses are kept in a literal index so that only complementary literals are visited
+        active = LiteralIndex(self.clauses - self.support_clauses, self._eligible_literals())
+        # Active unit clauses are the electrons of UR resolution
+        unit_resolver = UnitResultingResolver(self.clauses - self.support_clauses, self.statistics) \
+            if self.unit_resulting_resolution else None
+        # Subsumption index of the kept clauses, i.e. active and passive clauses which are not retired
+        subsumption_index = SubsumptionIndex(self.clauses, self.statistics)
+        retired_clauses = set()
+        known_clauses = set(self.clauses)
+        # Graph to keep track of which clauses resulted into each resolvent
+        proof_graph = ProofGraph()
+        iteration = 1
+        # Given clause iterations are recorded by the profiler in batches
+        batch_start_iteration, batch_start_time = iteration, time.perf_counter()
+
+        try:
+            while passive:
+                monitor.check()
+                given_clause = passive.popleft()
+                # Retired clauses are removed lazily from passive set
+                if given_clause in retired_clauses:
+                    continue
+
+                if self.statistics is not None:
+                    iteration_start_time, generated_clauses = time.perf_counter(), monitor.generated_clauses
+                    passive_size = len(passive)
+                is_proved = AutonomousTheoremProver._resolve_given_clause(given_clause, passive, active,
+                                                                          subsumption_index, retired_clauses,
+                                                                          known_clauses, proof_graph, iteration,
+                                                                          resolver, monitor, unit_resolver,
+                                                                          self.statistics, self.usable_index,
+                                                                          self.usable_subsumption_index)
+                if self.statistics is not None:
+                    # Kept resolvents are appended to passive set, EMPTY_CLAUSE is the only exception
+                    self.statistics.record_iteration(iteration, time.perf_counter() - iteration_start_time,
+                                                     len(subsumption_index), monitor.generated_clauses -
+                                                     generated_clauses, len(passive) - passive_size + is_proved)
+                iteration += 1
+                if is_proved:
+                    self.clauses = known_clauses
+                    return ProofResult(ProofResult.PROVED), proof_graph
+
+                batch_size = iteration - batch_start_iteration
+                if self.profiler is not None and batch_size == SearchProfiler.ITERATION_BATCH_SIZE:
+                    self._record_iteration_batch(batch_start_iteration, iteration, batch_start_time, len(passive))
+                    batch_start_iteration, batch_start_time = iteration, time.perf_counter()
+        except ResourceLimitExceeded as exception:
+            self.clauses = known_clauses
+            return ProofResult(ProofResult.UNKNOWN, exception.reason), proof_graph
+        finally:
+            if self.profiler is not None and iteration > batch_start_iteration:
+                self._record_iteration_batch(batch_start_iteration, iteration, batch_start_time, len(passive))
+
+        self.clauses = known_clauses
+        return AutonomousTheoremProver._search_result(False, monitor), proof_graph
+
+    def _record_iteration_batch(self, start_iteration: int, end_iteration: int, start_time: float, passive_size: int):
+        """
+        Record given clause iterations from the start iteration up to the end iteration (exclusive) as a single phase
+        """
+        self.profiler.add_span('iterations {0}-{1}'.format(start_iteration, end_iteration - 1), start_time,
+                               time.perf_counter(), iterations=end_iteration - start_iteration,
+                               passive_clauses=passive_size)
 
     @staticmethod
-    def generate_next_level_resolvent(known_clauses: Set[Clause], new_clauses: Set[Clause], clause_dictionary: dict,
-                                      level: int) -> Set[Clause]:
+    def _resolve_given_clause(given_clause: Clause, passive: PassiveQueue, active: LiteralIndex,
+                              subsumption_index: SubsumptionIndex, retired_clauses: Set[Clause],
+                              known_clauses: Set[Clause], proof_graph: ProofGraph, iteration: int,
+                              resolver: ParallelResolver, monitor: ResourceMonitor,
+                              unit_resolver: Optional[UnitResultingResolver] = None,
+                              statistics: Optional[SearchStatistics] = None,
+                              usable_index: Optional[LiteralIndex] = None,
+                              usable_subsumption_index: Optional[SubsumptionIndex] = None) -> bool:
+        """
+        Single iteration of given clause algorithm which moves the given clause into active set and resolves it with
+        all the active and usable clauses, kept resolvents are appended to passive set
+        :return: Boolean flag representing whether EMPTY_CLAUSE is reached or not
+        :raise ResourceLimitExceeded: If maximum number of generated clauses is exceeded
+        """
+        active.add(given_clause)
+        # Chains of resolution steps to be completed by UR resolution, starting from the given clause itself
+        nuclei = [[]]
+        if unit_resolver is not None:
+            unit_resolver.add(given_clause)
+
+        indices = (active,) if usable_index is None else (usable_index, active)
+        tasks = [(given_clause, predicate, active_clause, active_predicate) for index in indices for
+                 predicate, active_clause, active_predicate in index.find_resolution_candidates(given_clause)]
+        for (_, _, active_clause, _), (resolvent, substitutions) in zip(tasks, resolver.resolve(tasks)):
+            if active_clause in retired_clauses or resolvent is None:
+                continue
+            steps = [(given_clause, active_clause, resolvent, substitutions)]
+            if unit_resolver is not None and given_clause.get_clause_length() == 1 and \
+                    resolvent.get_clause_length() > 1:
+                nuclei.append(steps)
+            if AutonomousTheoremProver._keep_resolvent(steps, passive, active, subsumption_index, retired_clauses,
+                                                       known_clauses, proof_graph, iteration, monitor, unit_resolver,
+                                                       statistics, usable_subsumption_index):
+                return True
+
+        if unit_resolver is None:
+            return False
+        # Electrons are collected first, since keeping the resolvents may retire some of the electrons
+        chains = [steps + ur_steps for steps in nuclei for ur_steps in
+                  unit_resolver.resolve(steps[-1][2] if steps else given_clause)]
+        for steps in chains:
+            if AutonomousTheoremProver._keep_resolvent(steps, passive, active, subsumption_index, retired_clauses,
+                                                       known_clauses, proof_graph, iteration, monitor, unit_resolver,
+                                                       statistics, usable_subsumption_index):
+                return True
+        return False
+
+    @staticmethod
+    def _keep_resolvent(steps: List[ProofStep], passive: PassiveQueue, active: LiteralIndex,
+                        subsumption_index: SubsumptionIndex, retired_clauses: Set[Clause], known_clauses: Set[Clause],
+                        proof_graph: ProofGraph, iteration: int, monitor: ResourceMonitor,
+                        unit_resolver: Optional[UnitResultingResolver],
+                        statistics: Optional[SearchStatistics] = None,
+                        usable_subsumption_index: Optional[SubsumptionIndex] = None) -> bool:
+        """
+        Append the resolvent of the last resolution step to passive set unless it is redundant, intermediate clauses
+        of the steps are recorded only in the proof graph
+        :return: Boolean flag representing whether the resolvent is EMPTY_CLAUSE or not
+        :raise ResourceLimitExceeded: If maximum number of generated clauses is exceeded
+        """
+        resolvent = steps[-1][2]
+        if resolvent in known_clauses:
+            return False
+        if not monitor.accept_resolvent(resolvent) or AutonomousTheoremProver._has_tautology(resolvent, statistics):
+            return False
+
+        known_clauses.add(resolvent)
+        # Forward subsumption by both kept and usable clauses
+        if subsumption_index.is_subsumed(resolvent) or \
+                (usable_subsumption_index is not None and usable_subsumption_index.is_subsumed(resolvent)):
+            return False
+
+        # Will be used while showing results
+        for first_parent, second_parent, step_resolvent, substitutions in steps:
+            proof_graph.add_resolvent(step_resolvent, first_parent, second_parent, substitutions, iteration)
+
+        if resolvent.get_clause_length() == 0:
+            return True
+
+        # Backward subsumption
+        for subsumed_clause in list(subsumption_index.find_subsumed_clauses(resolvent)):
+            subsumption_index.remove(subsumed_clause)
+            active.remove(subsumed_clause)
+            retired_clauses.add(subsumed_clause)
+            if unit_resolver is not None:
+                unit_resolver.remove(subsumed_clause)
+        subsumption_index.add(resolvent)
+        passive.append(resolvent, [parent for first_parent, second_parent, _, _ in steps for parent in
+                                    (first_parent, second_parent)])
+        return False
+
+    def iterative_deepening_search(self, resolver: Optional[ParallelResolver] = None,
+                                   monitor: Optional[ResourceMonitor] = None) -> Tuple[ProofResult, ProofGraph]:
+        """
+        Iterative Deepening
+        ===================
+        Depth first search of linear derivations in rounds of increasing depth, where each derivation starts from a
+        clause of the set of support and each resolvent is resolved further with an input clause or with one of its
+        ancestors in the derivation
+
+        Round of depth d discards the resolvents derived in more than d steps and the resolvents whose terms are more
+        than d deeper than the deepest input term, so each round is finite and a proof of any depth is found in a
+        later round. Since each step removes at most one literal, a resolvent of n literals is discarded if the
+        derivation cannot reach EMPTY_CLAUSE in d steps. Search ends when EMPTY_CLAUSE is generated or a round
+        completes without discarding any resolvent due to its depth.
+
+        Nothing but the current derivation and the resolvents of its clauses are kept, so memory grows linearly with
+        the depth instead of the number of generated clauses, at the cost of generating the shallow resolvents again
+        in each round. Resolvents which are subsumed by an ancestor are not resolved further. Only the steps of the
+        proof are recorded in the proof graph.
+
+        :param resolver: Resolver of clause pairs, clause pairs are resolved in the current process if not given
+        :param monitor: Monitor of the resource limits, search is not limited if not given
+        :return: Result and proof graph of the proof steps
+        """
+        if resolver is None:
+            resolver = ParallelResolver(statistics=self.statistics)
+        if monitor is None:
+            monitor = ResourceMonitor()
+
+        # Graph to keep track of the steps of the proof
+        proof_graph = ProofGraph()
+        # Input clauses are the side clauses of the derivations
+        side_index = LiteralIndex(self.clauses)
+        top_clauses = sorted(self.support_clauses, key=Clause.get_sort_key)
+        input_term_depth = max((clause.get_term_depth() for clause in self.clauses), default=0)
+        depth = 1
+
+        try:
+            while self.max_depth is None or depth <= self.max_depth:
+                with self._phase('depth {0}'.format(depth), depth=depth):
+                    round_start_time, generated_clauses = time.perf_counter(), monitor.generated_clauses
+                    is_bounded, steps, derivation_length, expanded_clauses = False, None, 0, 0
+                    for top_clause in top_clauses:
+                        steps, is_top_bounded, top_derivation_length, top_expanded_clauses = \
+                            self._depth_bounded_search(top_clause, depth, input_term_depth + depth, side_index,
+                                                       resolver, monitor)
+                        is_bounded = is_bounded or is_top_bounded
+                        derivation_length = max(derivation_length, top_derivation_length)
+                        expanded_clauses += top_expanded_clauses
+                        if steps is not None:
+                            break
+                    if self.statistics is not None:
+                        # Clauses kept by a round are the input clauses and the longest derivation of the round
+                        self.statistics.record_iteration(depth, time.perf_counter() - round_start_time,
+                                                         len(self.clauses) + derivation_length,
+                                                         monitor.generated_clauses - generated_clauses,
+                                                         expanded_clauses)
+
+                if steps is not None:
+                    for level, (first_parent, second_parent, resolvent, substitutions) in enumerate(steps, 1):
+                        proof_graph.add_resolvent(resolvent, first_parent, second_parent, substitutions, level)
+                    return ProofResult(ProofResult.PROVED), proof_graph
+                if not is_bounded:
+                    return AutonomousTheoremProver._search_result(False, monitor), proof_graph
+                depth += 1
+        except ResourceLimitExceeded as exception:
+            return ProofResult(ProofResult.UNKNOWN, exception.reason), proof_graph
+
+        return ProofResult(ProofResult.UNKNOWN, AutonomousTheoremProver.MAX_DEPTH), proof_graph
+
+    def _depth_bounded_search(self, top_clause: Clause, depth: int, term_depth: int, side_index: LiteralIndex,
+                              resolver: ParallelResolver, monitor: ResourceMonitor) -> \
+            Tuple[Optional[List[ProofStep]], bool, int, int]:
+        """
+        Depth first search of the linear derivations of EMPTY_CLAUSE from the top clause in at most the given number
+        of steps, where the resolvents of each clause of the derivation are generated only when it is reached
+        :param top_clause: First clause of the derivations
+        :param depth: Maximum number of steps of a derivation
+        :param term_depth: Maximum term depth of the resolvents
+        :param side_index: Literal index of the input clauses
+        :param resolver: Resolver of clause pairs
+        :param monitor: Monitor of the resource limits
+        :return: Steps of the derivation of EMPTY_CLAUSE if it is found, whether any resolvent is discarded due to
+        the bounds, length of the longest derivation and number of resolvents resolved further
+        :raise ResourceLimitExceeded: If any of the resource limits is exceeded
+        """
+        # Clauses of the current derivation, steps between them and the remaining resolvents of each of them
+        derivation, steps = [top_clause], []
+        # Subsumption index of the clauses of the current derivation
+        ancestors = SubsumptionIndex(derivation, self.statistics)
+        pending = [self._linear_resolvents(derivation, side_index, resolver)]
+        is_bounded, longest_derivation, expanded_clauses = False, 0, 0
+
+        while pending:
+            monitor.check()
+            if not pending[-1]:
+                pending.pop()
+                ancestors.remove(derivation.pop())
+                if steps:
+                    steps.pop()
+                continue
+            side_clause, resolvent, substitutions = pending[-1].pop()
+            if not monitor.accept_resolvent(resolvent) or \
+                    AutonomousTheoremProver._has_tautology(resolvent, self.statistics):
+                continue
+            step = (derivation[-1], side_clause, resolvent, substitutions)
+            if resolvent.get_clause_length() == 0:
+                return steps + [step], is_bounded, max(longest_derivation, len(steps) + 1), expanded_clauses
+            if len(steps) + 1 + resolvent.get_clause_length() > depth or resolvent.get_term_depth() > term_depth:
+                is_bounded = True
+                continue
+            if ancestors.is_subsumed(resolvent):
+                continue
+
+            ancestors.add(resolvent)
+            derivation.append(resolvent)
+            steps.append(step)
+            longest_derivation = max(longest_derivation, len(steps))
+            expanded_clauses += 1
+            pending.append(self._linear_resolvents(derivation, side_index, resolver))
+        return None, is_bounded, longest_derivation, expanded_clauses
+
+    def _linear_resolvents(self, derivation: List[Clause], side_index: LiteralIndex,
+                           resolver: ParallelResolver) -> List[Tuple[Clause, Clause, List[Substitution]]]:
+        """
+        Resolvents of the last clause of the derivation with the input clauses and with its ancestors
+        :return: Side clause, resolvent and substitutions of each resolvent in reverse order, so that popping them
+        gives the resolvents of the input clauses first
+        """
+        clause = derivation[-1]
+        tasks = [(clause, predicate, side_clause, side_predicate) for
+                 predicate, side_clause, side_predicate in side_index.find_resolution_candidates(clause)]
+        for ancestor in derivation[:-1]:
+            tasks.extend((clause, predicate, ancestor, ancestor_predicate) for predicate in clause.predicates for
+                         ancestor_predicate in ancestor.predicates if
+                         predicate.get_name() == ancestor_predicate.get_name() and
+                         predicate.is_negated != ancestor_predicate.is_negated)
+        return [(side_clause, resolvent, substitutions) for (_, _, side_clause, _), (resolvent, substitutions) in
+                zip(reversed(tasks), reversed(resolver.resolve(tasks))) if resolvent is not None]
+
+    @staticmethod
+    def _has_tautology(clause: Clause, statistics: Optional[SearchStatistics]) -> bool:
+        """
+        Tautology check of a resolvent which is counted if statistics are given
+        """
+        if statistics is None:
+            return clause.has_tautology()
+        return statistics.count(SearchStatistics.TAUTOLOGY_CHECKS, SearchStatistics.TAUTOLOGIES, clause.has_tautology())
+
+    @staticmethod
+    def _search_result(result: bool, monitor: ResourceMonitor) -> ProofResult:
+        """
+        Result of a completed search, saturation does not show that the theorem is unprovable if any resolvent is
+        discarded due to the resource limits
+        """
+        if result:
+            return ProofResult(ProofResult.PROVED)
+        if monitor.is_incomplete:
+            return ProofResult(ProofResult.UNKNOWN, ResourceLimits.MAX_TERM_DEPTH)
+        return ProofResult(ProofResult.SATURATED)
+
+    @staticmethod
+    def generate_next_level_resolvent(known_clauses: Set[Clause], new_clauses: Set[Clause], proof_graph: ProofGraph,
+                                      level: int, known_clause_index: Optional[LiteralIndex] = None,
+                                      resolver: Optional[ParallelResolver] = None,
+                                      monitor: Optional[ResourceMonitor] = None) -> Set[Clause]:
         """
         Generate new set of resolvent with known clauses and last level of resolvent
+        Only the literal pairs retrieved from the literal index of known clauses are tried to be resolved, so the pairs
+        of clauses which do not have any complementary literal are never visited
         :param known_clauses: Known resolvent set up to now
         :param new_clauses: New clauses from the last level of breath first search
-        :param clause_dictionary: Dictionary storage to keep track of resolvent pairs
+        :param proof_graph: Graph to keep track of the resolved clause pairs of each resolvent
         :param level: Generated clauses' level information in breadth first search
+        :param known_clause_index: Literal index of known clauses, it is built from known clauses if not given
+        :param resolver: Resolver of clause pairs, clause pairs are resolved in the current process if not given
+        :param monitor: Monitor of the resource limits which is checked between batches of clause pairs
         :return: Newly generated resolvent sey
+        :raise ResourceLimitExceeded: If any of the resource limits is exceeded
         """
-        from itertools import product
+        if known_clause_index is None:
+            known_clause_index = LiteralIndex(known_clauses)
+        if resolver is None:
+            resolver = ParallelResolver()
+        if monitor is None:
+            monitor = ResourceMonitor()
+
+        tasks = [(clause1, predicate1, clause2, predicate2) for clause2 in new_clauses for
+                 predicate2, clause1, predicate1 in known_clause_index.find_resolution_candidates(clause2)]
 
+        # Results are in the order of tasks, so merging does not depend on how tasks are distributed to workers
         new_resolvent_set = set()
-        for clause1, clause2 in product(known_clauses, new_clauses):
-            resolvent, substitutions = clause1.resolve_with(clause2)
-            if resolvent is not None:
+        for start in range(0, len(tasks), AutonomousTheoremProver.RESOLUTION_BATCH_SIZE):
+            monitor.check()
+            batch = tasks[start: start + AutonomousTheoremProver.RESOLUTION_BATCH_SIZE]
+            for (clause1, _, clause2, _), (resolvent, substitutions) in zip(batch, resolver.resolve(batch)):
+                if resolvent is None or not monitor.accept_resolvent(resolvent):
+                    continue
                 new_resolvent_set.add(resolvent)
 
-                # Will be used while showing results
-                if resolvent not in clause_dictionary:
-                    clause_dictionary[str(resolvent)] = (str(clause1), str(clause2), substitutions, level)
+                # Will be used while showing results, first derivation of the resolvent is kept
+                proof_graph.add_resolvent(resolvent, clause1, clause2, substitutions, level)
         return new_resolvent_set
 
     @staticmethod
     def remove_subsumptions(clauses: Set[Clause]) -> Set[Clause]:
         """
-        Removal of subsumptions by checking each pair of clauses
+        Removal of subsumptions among the given clauses
         :param clauses: Clauses to check whether subsumption exists or not
         :return: Set of clauses where subsumptions are removed
         """
-        from itertools import combinations
+        kept_clauses, _ = AutonomousTheoremProver.apply_subsumption(clauses, SubsumptionIndex())
+        return kept_clauses
 
-        remove_set = set()
-        for clause1, clause2 in combinations(clauses, 2):
-            # For each combination, check whether subsumption holds or not
-            if clause1.does_subsume(clause2):
-                remove_set.add(clause2)
-            elif clause2.does_subsume(clause1):
-                remove_set.add(clause1)
-            else:
-                # Do nothing
-                pass
-        # At the end, remove subsumed clauses from original list
-        return set(clause for clause in clauses if clause not in remove_set)
-
-    def show_results(self, result: bool, clause_dictionary: dict, max_level: int):
-        """
-        Functionality to show result where if we reach aim then show resolvent set of the EMPTY_CLAUSE, otherwise show
-        all the generated resolvent set
-        :param result: Boolean flag whether we reach EMPTY_CLAUSE or not
-        :param clause_dictionary: Generated clause dictionary
-        :param max_level: Maximum reached level in BFS
-        :return: None
-        """
-        # Initial knowledge base
-        logging.info('Initial knowledge base clauses are:')
-        for index, clause in enumerate(self.problem_state.clauses):
-            logging.info('Clause {0} \t| {1}'.format(index, clause))
-
-        # Level-wise generation of clauses
-        for level in range(1, max_level):
-            logging.debug('Level {0} generated clauses:'.format(level))
-            for resolvent, (
-                    first_resolver, second_resolver, substitution, resolution_level) in clause_dictionary.items():
-                if resolution_level == level:
-                    logging.debug('{0} | {1} -> {2}'.format(first_resolver, second_resolver, resolvent))
-
-        # If EMPTY_CLAUSE is reached, show path to resolution
-        if result:
-            logging.info('Knowledge base contradicts, so inverse of the negated target clause is provable.')
-            generation_stack = []
-            process_queue = deque(['[]'])
-            while process_queue:
-                for clause_index in range(len(process_queue)):
-                    clause = process_queue.popleft()
-                    if clause in clause_dictionary:
-                        first_resolver, second_resolver, substitution, _ = clause_dictionary[clause]
-                        generation_stack.append((first_resolver, second_resolver, clause, substitution))
-                        process_queue.append(first_resolver)
-                        process_queue.append(second_resolver)
-
-            logging.info('Prove by refutation resolution order will be shown.')
-            while generation_stack:
-                first_resolver, second_resolver, resolvent, substitution = generation_stack.pop()
-                logging.info('{0} | {1} -> {2} with substitution {3}'.format(first_resolver, second_resolver, resolvent,
-                                                                             substitution))
-        else:
-            logging.warning(
-                'Knowledge base does not have contradiction resulting into the fact that we cannot prove the negated target clause.')
+    @staticmethod
+    def apply_subsumption(clauses: Set[Clause], subsumption_index: SubsumptionIndex) -> Tuple[Set[Clause], Set[Clause]]:
+        """
+        Forward and backward subsumption of the given clauses with respect to the indexed clauses where clauses are
+        processed one by one and each of them is compared to the indexed clauses and previously processed clauses
+        * Forward: Clause is discarded if any indexed clause subsumes it
+        * Backward: Otherwise, indexed clauses which are subsumed by the clause are retired from the index
+        Kept clauses are inserted into the given index
+        :param clauses: Clauses to check subsumption
+        :param subsumption_index: Index of clauses which are already known
+        :return: Kept clauses among the given clauses and retired clauses among the indexed clauses
+        """
+        kept_clauses, retired_clauses = set(), set()
+        # Shorter clauses are more likely to subsume others, so they are processed first
+        for clause in sorted(clauses, key=lambda c: c.get_clause_length()):
+            if subsumption_index.is_subsumed(clause):
+                continue
+            for subsumed_clause in list(subsumption_index.find_subsumed_clauses(clause)):
+                subsumption_index.remove(subsumed_clause)
+                if subsumed_clause in kept_clauses:
+                    kept_clauses.remove(subsumed_clause)
+                else:
+                    retired_clauses.add(subsumed_clause)
+            subsumption_index.add(clause)
+            kept_clauses.add(clause)
+        return kept_clauses, retired_clauses
+
+
+class AutonomousTheoremProverUnitTest(unittest.TestCase):
+
+    @staticmethod
+    def _problem_state(knowledge_base, negated_theorem_predicates):
+        import json
+        from io import StringIO
+        return InputParser.parse(StringIO(json.dumps({
+            InputParser.KNOWLEDGE_BASE_LABEL: knowledge_base,
+            InputParser.NEGATED_THEOREM_PREDICATES_LABEL: negated_theorem_predicates
+        })))
+
+    @staticmethod
+    def _prove(knowledge_base, negated_theorem_predicates, **kwargs):
+        problem_state = AutonomousTheoremProverUnitTest._problem_state(knowledge_base, negated_theorem_predicates)
+        return AutonomousTheoremProver(problem_state, **kwargs).prove()
+
+    def test_unknown_search_strategy(self):
+        problem_state = AutonomousTheoremProverUnitTest._problem_state(['p(x)'], ['~p(A)'])
+        with self.assertRaises(ValueError):
+            _ = AutonomousTheoremProver(problem_state, search_strategy='dfs')
+
+    def test_breadth_first_search(self):
+        self.assertTrue(self._prove(['~p(x),q(x)', 'p(y),r(y)', '~q(z),s(z)', '~r(t),s(t)'], ['~s(A)']))
+        self.assertFalse(self._prove(['p(A)', 'q(z),~p(z)'], ['~q(B)']))
+
+    def test_given_clause_search(self):
+        strategy = AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY
+        self.assertTrue(self._prove(['~p(x),q(x)', 'p(y),r(y)', '~q(z),s(z)', '~r(t),s(t)'], ['~s(A)'],
+                                    search_strategy=strategy))
+        self.assertTrue(self._prove(['p(A,f(t))', 'q(z),~p(z,f(B))', '~q(y),r(y)'], ['~r(A)'],
+                                    search_strategy=strategy))
+        self.assertFalse(self._prove(['p(A)', 'q(z),~p(z)'], ['~q(B)'], search_strategy=strategy))
+
+    def test_tautology_deletion(self):
+        # Clause p(x), ~p(A) is not a tautology, p(x) is derived from it
+        for strategy in (AutonomousTheoremProver.BREADTH_FIRST_STRATEGY, AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY):
+            self.assertTrue(self._prove(['p(x),~p(A)', 'p(A)'], ['~p(B)'], search_strategy=strategy))
+            self.assertTrue(self._prove(['p(x),~p(A)', 'p(A)'], ['~p(B)'], search_strategy=strategy,
+                                        set_of_support=True))
+        # Resolvent p(x), ~p(x) is a tautology
+        statistics = SearchStatistics()
+        self.assertFalse(self._prove(['~p(x),q(x)', '~q(y),p(y)'], ['~r(A)'],
+                                     search_strategy=AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY,
+                                     statistics=statistics))
+        self.assertLess(0, statistics.counters[SearchStatistics.TAUTOLOGIES])
+
+    def test_parallel_resolution(self):
+        knowledge_base = ['~p(x),q(x)', 'p(y),r(y)', '~q(z),s(z)', '~r(t),s(t)']
+        for strategy in AutonomousTheoremProver.SEARCH_STRATEGIES:
+            self.assertTrue(self._prove(knowledge_base, ['~s(A)'], search_strategy=strategy, workers=2))
+            self.assertFalse(self._prove(knowledge_base, ['~t(A)'], search_strategy=strategy, workers=2))
+
+        problem_state = AutonomousTheoremProverUnitTest._problem_state(knowledge_base, ['~s(A)'])
+        with self.assertRaises(ValueError):
+            _ = AutonomousTheoremProver(problem_state, workers=0)
+
+    def test_proof_result(self):
+        records = []
+        handler = logging.Handler(level=logging.DEBUG)
+        handler.emit = records.append
+        logger = logging.getLogger()
+        level = logger.level
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        try:
+            for strategy in AutonomousTheoremProver.SEARCH_STRATEGIES:
+                result = self._prove(['p(A,f(t))', 'q(z),~p(z,f(B))', '~q(y),r(y)'], ['~r(A)'],
+                                     search_strategy=strategy)
+                self.assertEqual(3, len(result.steps))
+                self.assertEqual(Clause([]), result.steps[-1][2])
+                self.assertGreater(result.stats['generated_clauses'], 0)
+                self.assertEqual([], self._prove(['p(A)'], ['~q(A)'], search_strategy=strategy).steps)
+        finally:
+            logger.removeHandler(handler)
+            logger.setLevel(level)
+        # Proving does not write any log
+        self.assertEqual([], records)
+
+    def test_search_statistics(self):
+        for strategy in AutonomousTheoremProver.SEARCH_STRATEGIES:
+            statistics = SearchStatistics()
+            result = self._prove(['~p(x),q(x)', 'p(y),r(y)', '~q(z),s(z)', '~r(t),s(t)'], ['~s(A)'],
+                                 search_strategy=strategy, statistics=statistics)
+            self.assertTrue(result)
+            counters = statistics.counters
+            self.assertEqual(result.stats['generated_clauses'], counters[SearchStatistics.RESOLVENTS_GENERATED])
+            self.assertGreaterEqual(counters[SearchStatistics.RESOLUTION_ATTEMPTS],
+                                    counters[SearchStatistics.RESOLVENTS_GENERATED])
+            self.assertGreater(counters[SearchStatistics.UNIFICATION_SUCCESSES], 0)
+            # Iterative deepening checks only the ancestors of the derivation, which the subsumption index filters out
+            if strategy != AutonomousTheoremProver.ITERATIVE_DEEPENING_STRATEGY:
+                self.assertGreater(counters[SearchStatistics.SUBSUMPTION_CHECKS], 0)
+            self.assertGreater(len(statistics.iterations), 1)
+            self.assertGreater(statistics.max_clause_store_size, 0)
+
+        # Resolutions of the worker processes are counted as well
+        knowledge_base = ['p(A{0})'.format(index) for index in range(3 * ParallelResolver.MIN_TASKS_PER_CHUNK)]
+        for strategy in AutonomousTheoremProver.SEARCH_STRATEGIES:
+            counters = []
+            for workers in (1, 2):
+                statistics = SearchStatistics()
+                self.assertFalse(self._prove(knowledge_base + ['~p(x),q(x)'], ['~q(B)'], search_strategy=strategy,
+                                             workers=workers, statistics=statistics))
+                counters.append(statistics.counters)
+            self.assertGreaterEqual(counters[0][SearchStatistics.UNIFICATION_SUCCESSES],
+                                    3 * ParallelResolver.MIN_TASKS_PER_CHUNK)
+            self.assertEqual(counters[0], counters[1])
+
+    def test_search_profiler(self):
+        for strategy in AutonomousTheoremProver.SEARCH_STRATEGIES:
+            profiler = SearchProfiler()
+            self.assertTrue(self._prove(['~p(x),q(x)', 'p(y),r(y)', '~q(z),s(z)', '~r(t),s(t)'], ['~s(A)'],
+                                        search_strategy=strategy, profiler=profiler))
+            names = [event['name'] for event in profiler.to_chrome_trace()['traceEvents']]
+            self.assertEqual('preprocess', names[0])
+            self.assertEqual('proof reconstruction', names[-1])
+            self.assertTrue(names[1].startswith({AutonomousTheoremProver.BREADTH_FIRST_STRATEGY: 'level 1',
+                                                 AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY: 'iterations 1-',
+                                                 AutonomousTheoremProver.ITERATIVE_DEEPENING_STRATEGY: 'depth 1'}
+                                                [strategy]))
+
+    def test_set_of_support(self):
+        knowledge_base = ['~p(x),q(x)', 'p(y),r(y)', '~q(z),s(z)', '~r(t),s(t)', 'u(A)', '~u(x),v(x)', '~v(B),w(B)']
+        for strategy in AutonomousTheoremProver.SEARCH_STRATEGIES:
+            result = self._prove(knowledge_base, ['~s(A)'], search_strategy=strategy, set_of_support=True)
+            self.assertTrue(result)
+            self.assertLess(result.stats['generated_clauses'],
+                            self._prove(knowledge_base, ['~s(A)'], search_strategy=strategy).stats['generated_clauses'])
+            # Every resolvent descends from the negated theorem clauses
+            problem_state = AutonomousTheoremProverUnitTest._problem_state(knowledge_base, ['~t(A)'])
+            prover = AutonomousTheoremProver(problem_state, search_strategy=strategy, set_of_support=True)
+            self.assertFalse(prover.prove())
+            self.assertEqual(0, prover.monitor.generated_clauses)
+            self.assertEqual(0, len(prover.proof_graph))
+
+    def test_unit_preference(self):
+        strategy = AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY
+        knowledge_base = ['p0(A)'] + ['~p{0}(x),p{1}(x)'.format(index, index + 1) for index in range(8)]
+        for unit_resulting_resolution in (False, True):
+            result = self._prove(knowledge_base, ['~p8(A)'], search_strategy=strategy, unit_preference=True,
+                                 unit_resulting_resolution=unit_resulting_resolution)
+            self.assertTrue(result)
+            self.assertLess(result.stats['generated_clauses'],
+                            self._prove(knowledge_base, ['~p8(A)'], search_strategy=strategy).stats['generated_clauses'])
+
+        problem_state = AutonomousTheoremProverUnitTest._problem_state(knowledge_base, ['~p8(A)'])
+        with self.assertRaises(ValueError):
+            _ = AutonomousTheoremProver(problem_state, unit_preference=True)
+
+    def test_unit_resulting_resolution(self):
+        strategy = AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY
+        problem_state = AutonomousTheoremProverUnitTest._problem_state(['p(A)', 'q(A)', '~p(x),~q(x),r(x)'],
+                                                                       ['~r(A)'])
+        result = AutonomousTheoremProver(problem_state, search_strategy=strategy,
+                                         unit_resulting_resolution=True).prove()
+        self.assertTrue(result)
+        # Intermediate clauses of UR resolution are derived within the proof before they are used
+        derived_clauses = set(problem_state.clauses)
+        for first_parent, second_parent, resolvent, _ in result.steps:
+            self.assertIn(first_parent, derived_clauses)
+            self.assertIn(second_parent, derived_clauses)
+            derived_clauses.add(resolvent)
+        self.assertFalse(self._prove(['p(A)', 'q(B)', '~p(x),~q(x),r(x)'], ['~r(A)'], search_strategy=strategy,
+                                     unit_preference=True, unit_resulting_resolution=True))
+        self.assertTrue(self._prove(['p(A)', 'q(B)', '~p(x),~q(x),r(x)', 'q(y),~s(y)', 's(A)'], ['~r(A)'],
+                                    search_strategy=strategy, unit_preference=True, unit_resulting_resolution=True,
+                                    set_of_support=True))
+
+    def test_ordered_resolution(self):
+        from .term_ordering import KnuthBendixOrdering, LexicographicPathOrdering
+
+        knowledge_base = ['~p(x),q(x)', 'p(y),r(y)', '~q(z),s(z)', '~r(t),s(t)']
+        for strategy in (AutonomousTheoremProver.BREADTH_FIRST_STRATEGY, AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY):
+            unordered_result = self._prove(knowledge_base, ['~s(A)'], search_strategy=strategy)
+            for ordering in (KnuthBendixOrdering(), LexicographicPathOrdering()):
+                for selection in LiteralSelector.SELECTIONS:
+                    result = self._prove(knowledge_base, ['~s(A)'], search_strategy=strategy,
+                                         literal_selector=LiteralSelector(ordering, selection))
+                    self.assertTrue(result)
+                    self.assertLessEqual(result.stats['generated_clauses'], unordered_result.stats['generated_clauses'])
+
+                self.assertFalse(self._prove(knowledge_base, ['~p(A)'], search_strategy=strategy,
+                                             literal_selector=LiteralSelector(ordering)))
+
+        problem_state = AutonomousTheoremProverUnitTest._problem_state(knowledge_base, ['~s(A)'])
+        with self.assertRaises(ValueError):
+            _ = AutonomousTheoremProver(problem_state,
+                                        search_strategy=AutonomousTheoremProver.ITERATIVE_DEEPENING_STRATEGY,
+                                        literal_selector=LiteralSelector(KnuthBendixOrdering()))
+
+    def test_best_first_selection(self):
+        strategy = AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY
+        # Irrelevant chains of rules are as light as the relevant one, but their resolvents are not selected eagerly
+        knowledge_base = ['p0(A)', 'q0(A)', 'r0(A)'] + \
+                         ['~{0}{1}(x),{0}{2}(x)'.format(name, index, index + 1) for name in 'pqr' for index in range(8)]
+        fifo_result = self._prove(knowledge_base, ['~p8(A)'], search_strategy=strategy)
+        for goal_distance_bonus in (0, 4):
+            result = self._prove(knowledge_base, ['~p8(A)'], search_strategy=strategy, age_weight_ratio=(1, 5),
+                                 goal_distance_bonus=goal_distance_bonus)
+            self.assertTrue(result)
+            self.assertLess(result.stats['generated_clauses'], fifo_result.stats['generated_clauses'])
+        self.assertFalse(self._prove(knowledge_base, ['~p9(A)'], search_strategy=strategy, age_weight_ratio=(1, 5),
+                                     goal_distance_bonus=4))
+
+        problem_state = AutonomousTheoremProverUnitTest._problem_state(knowledge_base, ['~p8(A)'])
+        with self.assertRaises(ValueError):
+            _ = AutonomousTheoremProver(problem_state, age_weight_ratio=(1, 5))
+        with self.assertRaises(ValueError):
+            _ = AutonomousTheoremProver(problem_state, search_strategy=strategy, goal_distance_bonus=4)
+
+    def test_iterative_deepening_search(self):
+        strategy = AutonomousTheoremProver.ITERATIVE_DEEPENING_STRATEGY
+        statistics = SearchStatistics()
+        result = self._prove(['p0(A)'] + ['~p{0}(x),p{1}(x)'.format(index, index + 1) for index in range(8)],
+                             ['~p8(A)'], search_strategy=strategy, set_of_support=True, statistics=statistics)
+        self.assertTrue(result)
+        # Proof of nine steps is found in the round of depth nine, which keeps ten input clauses and a single
+        # derivation at a time
+        self.assertEqual(9, len(result.steps))
+        self.assertEqual(9, len(statistics.iterations))
+        self.assertEqual(10 + 9, statistics.max_clause_store_size)
+
+        # Resolvents of the derivation are resolved with its ancestors as well
+        result = self._prove(['~p(x),q(x)', 'p(y),q(y)'], ['~q(A)'], search_strategy=strategy, set_of_support=True)
+        self.assertTrue(result)
+        self.assertEqual(3, len(result.steps))
+
+        # Rounds grow the term depth as well, so the search ends once every derivation is shorter than the depth
+        self.assertEqual(ProofResult(ProofResult.PROVED),
+                         self._prove(['p(A)', '~p(x),p(f(x))'], ['~p(f(f(f(A))))'], search_strategy=strategy))
+        self.assertEqual(ProofResult(ProofResult.SATURATED),
+                         self._prove(['p(A)', 'q(z),~p(z)'], ['~q(B)'], search_strategy=strategy))
+        # Clauses whose complementary literals are only unifiable are not pruned as tautologies
+        self.assertTrue(self._prove(['p(x),~p(A)', 'p(A)'], ['~p(B)'], search_strategy=strategy))
+        self.assertTrue(self._prove(['~q(x),p(x),r(x)', '~r(y),~p(A)', 'p(A)', '~p(B)'], ['q(z)'],
+                                    search_strategy=strategy, set_of_support=True))
+        self.assertEqual(ProofResult(ProofResult.UNKNOWN, AutonomousTheoremProver.MAX_DEPTH),
+                         self._prove(['p(A)', '~p(x),p(f(x))'], ['~q(A)'], search_strategy=strategy, max_depth=4))
+
+        problem_state = AutonomousTheoremProverUnitTest._problem_state(['p(A)'], ['~p(A)'])
+        with self.assertRaises(ValueError):
+            _ = AutonomousTheoremProver(problem_state, max_depth=4)
+        with self.assertRaises(ValueError):
+            _ = AutonomousTheoremProver(problem_state, search_strategy=strategy, max_depth=0)
+
+    def test_deep_terms(self):
+        from .entity.constant import Constant
+        from .entity.function import Function
+        from .entity.predicate import Predicate
+        from .entity.variable import Variable
+
+        # Terms nested deeper than the recursion limit are ordered, resolved and subsumed without recursion
+        deep_term, deep_ground_term = Variable('x'), Constant('A')
+        for _ in range(1500):
+            deep_term, deep_ground_term = Function('f', [deep_term]), Function('f', [deep_ground_term])
+        knowledge_base = [[Predicate('p', [deep_term])],
+                          [Predicate('p', [Variable('y')], True), Predicate('q', [Variable('y')])]]
+        negated_theorem_predicates = [[Predicate('q', [deep_ground_term], True)]]
+        for strategy in AutonomousTheoremProver.SEARCH_STRATEGIES:
+            result = AutonomousTheoremProver(ProblemState(knowledge_base, negated_theorem_predicates),
+                                             search_strategy=strategy).prove()
+            self.assertTrue(result)
+            self.assertEqual(2, len(result.steps))
+
+    def test_resource_limits(self):
+        knowledge_base = ['~p(x),q(x)', 'p(y),r(y)', '~q(z),s(z)', '~r(t),s(t)']
+        # Resolving p(x) with its own consequences never saturates without bounding term depth
+        infinite_knowledge_base = ['p(A)', '~p(x),p(f(x))']
+        for strategy in AutonomousTheoremProver.SEARCH_STRATEGIES:
+            result = self._prove(knowledge_base, ['~s(A)'], search_strategy=strategy,
+                                 limits=ResourceLimits(max_generated_clauses=1))
+            self.assertEqual(ProofResult(ProofResult.UNKNOWN, ResourceLimits.MAX_GENERATED_CLAUSES), result)
+
+            result = self._prove(knowledge_base, ['~s(A)'], search_strategy=strategy, limits=ResourceLimits(timeout=0))
+            self.assertEqual(ProofResult(ProofResult.UNKNOWN, ResourceLimits.TIMEOUT), result)
+
+            result = self._prove(infinite_knowledge_base, ['~q(A)'], search_strategy=strategy,
+                                 limits=ResourceLimits(max_term_depth=3))
+            self.assertEqual(ProofResult(ProofResult.UNKNOWN, ResourceLimits.MAX_TERM_DEPTH), result)
+
+            result = self._prove(infinite_knowledge_base, ['~p(f(f(A)))'], search_strategy=strategy,
+                                 limits=ResourceLimits(max_term_depth=3))
+            self.assertEqual(ProofResult(ProofResult.PROVED), result)
+
+            result = self._prove(knowledge_base, ['~t(A)'], search_strategy=strategy,
+                                 limits=ResourceLimits(timeout=60, max_generated_clauses=1000, max_term_depth=3))
+            self.assertEqual(ProofResult(ProofResult.SATURATED), result)
+
+    def test_cancellation(self):
+        cancellation_token = CancellationToken()
+        cancellation_token.cancel()
+        for strategy in AutonomousTheoremProver.SEARCH_STRATEGIES:
+            result = self._prove(['p(A)', '~p(x),p(f(x))'], ['~q(A)'], search_strategy=strategy,
+                                 cancellation_token=cancellation_token)
+            self.assertEqual(ProofResult(ProofResult.UNKNOWN, ResourceLimits.CANCELLED), result)
+
+    def test_subsumption_without_factoring(self):
+        from .term_ordering import KnuthBendixOrdering, LexicographicPathOrdering
+
+        # Negated theorems are retired if literals of a subsuming clause are matched onto the same literal, e.g.
+        # p(z), p(z1) subsumes r(x), p(z) that way while its factor p(z) is never derived
+        problems = [(['~r(f(B)),~r(A)', '~p(A),~q(A)', '~q(B),~r(A)', '~p(f(y)),~p(y)'], ['r(x),p(z)']),
+                    (['q(f(x))', 'r(A)', 'p(A),p(A)', 'p(y),p(x)', '~q(B),~p(y)'], ['~p(B),~q(y)'])]
+        for knowledge_base, negated_theorem_predicates in problems:
+            for strategy in AutonomousTheoremProver.SEARCH_STRATEGIES:
+                self.assertTrue(self._prove(knowledge_base, negated_theorem_predicates, search_strategy=strategy))
+            self.assertTrue(self._prove(knowledge_base, negated_theorem_predicates,
+                                        search_strategy=AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY,
+                                        age_weight_ratio=(1, 5)))
+
+        # Similarly p(y), p(x) subsumes p(x), ~q(y) which is derived by ordered resolution
+        knowledge_base, negated_theorem_predicates = problems[1]
+        for strategy in (AutonomousTheoremProver.BREADTH_FIRST_STRATEGY, AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY):
+            for ordering in (KnuthBendixOrdering(), LexicographicPathOrdering()):
+                for selection in LiteralSelector.SELECTIONS:
+                    self.assertTrue(self._prove(knowledge_base, negated_theorem_predicates, search_strategy=strategy,
+                                                literal_selector=LiteralSelector(ordering, selection)))
+
+    def test_apply_subsumption(self):
+        from .clause_index import LiteralIndexUnitTest
+
+        clause1 = LiteralIndexUnitTest._clause('p(x)')
+        clause2 = LiteralIndexUnitTest._clause('p(A), q(y)')
+        clause3 = LiteralIndexUnitTest._clause('q(B)')
+        clause4 = LiteralIndexUnitTest._clause('q(B), r(C)')
+        subsumption_index = SubsumptionIndex([clause2, clause4])
+
+        kept_clauses, retired_clauses = AutonomousTheoremProver.apply_subsumption(
+            {clause1, clause3, LiteralIndexUnitTest._clause('p(B)')}, subsumption_index)
+
+        self.assertEqual({clause1, clause3}, kept_clauses)
+        self.assertEqual({clause2, clause4}, retired_clauses)
+        self.assertEqual(2, len(subsumption_index))
+        self.assertEqual({clause1, clause3}, AutonomousTheoremProver.remove_subsumptions(
+            {clause1, clause2, clause3, clause4}))
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
-    parser.add_argument('-f', '--file', help='File name to parse and create problem base',
-                        type=argparse.FileType('r'), required=True)
+    input_group = parser.add_mutually_exclusive_group(required=True)
+    input_group.add_argument('-f', '--file', help='File name to parse and create problem base',
+                             type=argparse.FileType('r'))
+    input_group.add_argument('--snapshot', help='Snapshot file to load the preprocessed problem base from')
+    parser.add_argument('-s', '--strategy', help='Search strategy used while generating resolvents',
+                        choices=AutonomousTheoremProver.SEARCH_STRATEGIES,
+                        default=AutonomousTheoremProver.BREADTH_FIRST_STRATEGY)
+    parser.add_argument('-w', '--workers', help='Number of processes resolving clause pairs in parallel',
+                        type=int, default=1)
+    parser.add_argument('--timeout', help='Wall-clock time limit of the search in seconds', type=float)
+    parser.add_argument('--max-clauses', help='Maximum number of resolvents generated during the search', type=int)
+    parser.add_argument('--max-term-depth', help='Maximum nesting depth of the terms in the kept resolvents',
+                        type=int)
+    parser.add_argument('--max-memory', help='Maximum resident memory of the process in megabytes', type=float)
+    parser.add_argument('--lines', help='Read the file as JSON-Lines where each line is a problem to prove',
+                        action='store_true')
+    parser.add_argument('--write-snapshot', help='Write the preprocessed problem base into the snapshot file and exit')
+    parser.add_argument('--stats', help='Collect search statistics and write them as a JSON line per problem into the '
+                                        'standard output', action='store_true')
+    parser.add_argument('--profile', help='Write the timeline of the search phases into the file in Chrome trace '
+                                          'format')
+    parser.add_argument('--profile-stacks', help='Sample the call stacks while proving and write them into the file in '
+                                                 'collapsed stack format for flamegraphs')
+    parser.add_argument('--set-of-support', help='Resolve only the pairs where at least one clause descends from the '
+                                                 'negated theorem', action='store_true')
+    parser.add_argument('--unit-preference', help='Select unit clauses before the others in given clause strategy',
+                        action='store_true')
+    parser.add_argument('--ur-resolution', help='Infer unit clauses by resolving all but one literal of the given '
+                                                'clauses with unit clauses in given clause strategy',
+                        action='store_true')
+    parser.add_argument('--ordering', help='Term ordering of ordered resolution where only maximal literals are '
+                                           'resolved upon', choices=sorted(TERM_ORDERINGS))
+    parser.add_argument('--selection', help='Literal selection of ordered resolution where only selected negative '
+                                            'literals are resolved upon if any literal is selected',
+                        choices=sorted(LiteralSelector.SELECTIONS))
+    parser.add_argument('--age-weight-ratio', help='Select clauses best first in given clause strategy, where AGE '
+                                                   'oldest clauses are selected per WEIGHT lightest clauses', type=int,
+                        nargs=2, metavar=('AGE', 'WEIGHT'))
+    parser.add_argument('--goal-distance-bonus', help='Priority bonus of the clauses derived from the negated theorem '
+                                                      'in best first selection, reduced by one for each inference',
+                        type=int, default=0)
+    parser.add_argument('--max-depth', help='Maximum derivation depth of iterative deepening strategy, search is '
+                                            'stopped with unknown result after the round of this depth', type=int)
+    verbosity_group = parser.add_mutually_exclusive_group()
+    verbosity_group.add_argument('-v', '--verbose', help='Show every generated resolvent in addition to the proof',
+                                 action='store_true')
+    verbosity_group.add_argument('-q', '--quiet', help='Show only the warnings, e.g. when the theorem is not proved',
+                                 action='store_true')
     args = parser.parse_args()
 
-    # Get filename
-    _file = args.file
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING if args.quiet else logging.INFO,
+                        format='%(asctime)s - %(levelname)-8s : %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+
+    # Phases are recorded only in profiling mode, stacks are sampled only if collapsed stack file is requested
+    profiler = SearchProfiler() if args.profile is not None else None
+    sampler = StackSampler() if args.profile_stacks is not None else None
+    if sampler is not None:
+        sampler.start()
+
+    if args.snapshot is not None:
+        # Snapshot is loaded without parsing and preprocessing the clauses
+        with profiler.span('load snapshot', 'input') if profiler is not None else nullcontext():
+            problem_states = [ProblemSnapshot.read(args.snapshot)]
+    elif args.lines:
+        # Parse problem states, problems of JSON-Lines file are parsed one at a time
+        problem_states = InputParser.parse_lines(args.file)
+        if profiler is not None:
+            problem_states = profiler.trace_iterator(problem_states, 'parse')
+    else:
+        with profiler.span('parse', 'input') if profiler is not None else nullcontext():
+            problem_states = [InputParser.parse(args.file)]
+
+    if (args.unit_preference or args.ur_resolution or args.age_weight_ratio is not None) and \
+            args.strategy != AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY:
+        parser.error('--unit-preference, --ur-resolution and --age-weight-ratio can be used only with given clause '
+                     'strategy')
+    if args.strategy == AutonomousTheoremProver.ITERATIVE_DEEPENING_STRATEGY and \
+            (args.ordering is not None or args.selection is not None):
+        parser.error('--ordering and --selection cannot be used with iterative deepening strategy')
+    if args.max_depth is not None and args.strategy != AutonomousTheoremProver.ITERATIVE_DEEPENING_STRATEGY:
+        parser.error('--max-depth can be used only with iterative deepening strategy')
+    if args.goal_distance_bonus and args.age_weight_ratio is None:
+        parser.error('--goal-distance-bonus can be used only with --age-weight-ratio')
+
+    if args.write_snapshot is not None:
+        if args.lines:
+            parser.error('--write-snapshot cannot be used with --lines')
+        with open(args.write_snapshot, 'wb') as snapshot_file:
+            ProblemSnapshot.write(AutonomousTheoremProver.preprocess(problem_states[0]), snapshot_file)
+        sys.exit(0)
 
-    # Parse problem state
-    problem_state = InputParser.parse(_file)
-    # Prove the theorem
-    AutonomousTheoremProver(problem_state).prove()
+    resource_limits = ResourceLimits(timeout=args.timeout, max_generated_clauses=args.max_clauses,
+                                     max_term_depth=args.max_term_depth, max_resident_memory_mb=args.max_memory)
+    # Literal selector is kept for all the problems, eligible literals of the clauses are cached in it
+    literal_selector = LiteralSelector(TERM_ORDERINGS[args.ordering]() if args.ordering is not None else None,
+                                       args.selection or LiteralSelector.NO_SELECTION) \
+        if args.ordering is not None or args.selection is not None else None
+    try:
+        for problem_state in problem_states:
+            # Prove the theorem
+            prover = AutonomousTheoremProver(problem_state, search_strategy=args.strategy, workers=args.workers,
+                                             limits=resource_limits,
+                                             statistics=SearchStatistics() if args.stats else None, profiler=profiler,
+                                             set_of_support=args.set_of_support, unit_preference=args.unit_preference,
+                                             unit_resulting_resolution=args.ur_resolution,
+                                             literal_selector=literal_selector,
+                                             age_weight_ratio=tuple(args.age_weight_ratio)
+                                             if args.age_weight_ratio is not None else None,
+                                             goal_distance_bonus=args.goal_distance_bonus, max_depth=args.max_depth)
+            proof_result = prover.prove()
+            ProofRenderer.show(problem_state, proof_result, prover.proof_graph)
+            if args.stats:
+                print(json.dumps(dict(status=str(proof_result), **proof_result.stats, **prover.statistics.to_dict())),
+                      flush=True)
+    finally:
+        if sampler is not None:
+            sampler.stop()
+            with open(args.profile_stacks, 'w') as stacks_file:
+                sampler.write_collapsed_stacks(stacks_file)
+        if profiler is not None:
+            with open(args.profile, 'w') as trace_file:
+                profiler.write_chrome_trace(trace_file)
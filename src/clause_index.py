@@ -0,0 +1,608 @@
+import unittest
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .entity import children_entity_parser
+from .entity.clause import Clause
+from .entity.first_order_predicate_logic_entity import FirstOrderPredicateLogicEntity
+from .entity.predicate import Predicate
+from .entity.variable import Variable
+from .search_statistics import SearchStatistics
+
+
+class _DiscriminationTreeNode(object):
+    """
+    Node of the discrimination tree where each edge is labeled with a symbol key and leaf nodes keep the indexed
+    literals together with their clauses
+    """
+    __slots__ = ('children', 'entries')
+
+    def __init__(self):
+        self.children = {}
+        self.entries = {}
+
+
+class LiteralIndex(object):
+    """
+    Index of the literals of clauses which is used to find complementary literals during resolution
+
+    Literals are grouped by their name, negation and arity. Then, in each group their arguments are stored in a
+    discrimination tree where the path of a literal is the preorder traversal of its arguments and variables are
+    represented with a single wildcard symbol. While retrieving, a variable in the query skips a complete subterm in
+    the tree and a wildcard in the tree skips a complete subterm in the query. Therefore, retrieved literals are the
+    candidates which may be unified with the query, and the rest of the literals can never be unified with it.
+
+    If eligible literals function is given, e.g. :meth:`LiteralSelector.eligible_literals` of ordered resolution, only
+    the eligible literals of the clauses are indexed and queried while finding resolution candidates.
+    """
+    VARIABLE_KEY = '*'
+
+    def __init__(self, clauses: Iterable[Clause] = (),
+                 eligible_literals: Optional[Callable[[Clause], Sequence[Predicate]]] = None):
+        self.roots = {}  # type: Dict[Tuple[str, bool, int], _DiscriminationTreeNode]
+        self.eligible_literals = eligible_literals
+        for clause in clauses:
+            self.add(clause)
+
+    def add(self, clause: Clause):
+        """
+        Insert all the literals of the clause into the index
+        :param clause: Clause to be indexed
+        """
+        for predicate in self._literals(clause):
+            node = self.roots.setdefault(LiteralIndex._group_key(predicate, predicate.is_negated),
+                                         _DiscriminationTreeNode())
+            for key in LiteralIndex._preorder_keys(predicate.get_child()):
+                child = node.children.get(key)
+                if child is None:
+                    child = node.children[key] = _DiscriminationTreeNode()
+                node = child
+            node.entries[(clause, predicate)] = True
+
+    def remove(self, clause: Clause):
+        """
+        Remove all the literals of the clause from the index, empty branches are pruned
+        :param clause: Clause to be removed
+        """
+        for predicate in self._literals(clause):
+            group_key = LiteralIndex._group_key(predicate, predicate.is_negated)
+            path = [self.roots.get(group_key)]
+            keys = LiteralIndex._preorder_keys(predicate.get_child())
+            for key in keys:
+                if path[-1] is None:
+                    break
+                path.append(path[-1].children.get(key))
+            if path[-1] is None:
+                continue
+            path[-1].entries.pop((clause, predicate), None)
+            # Prune branches which do not keep any entry anymore
+            for depth in range(len(keys), 0, -1):
+                if path[depth].entries or path[depth].children:
+                    break
+                del path[depth - 1].children[keys[depth - 1]]
+            if not path[0].entries and not path[0].children:
+                del self.roots[group_key]
+
+    def find_complementary_literals(self, predicate: Predicate) -> Iterator[Tuple[Clause, Predicate]]:
+        """
+        Find indexed literals which have the same name and arity but the opposite negation of the given predicate
+        and whose arguments may be unified with the arguments of the given predicate
+        :param predicate: Query predicate
+        :return: Iterator of candidate clauses and their literals
+        """
+        root = self.roots.get(LiteralIndex._group_key(predicate, not predicate.is_negated))
+        if root is None:
+            return
+        for node in LiteralIndex._retrieve_unifiable(root, predicate.get_child()):
+            yield from list(node.entries)
+
+    def find_resolution_candidates(self, clause: Clause) -> Iterator[Tuple[Predicate, Clause, Predicate]]:
+        """
+        Find all the literal pairs where the first literal belongs to the given clause and the second literal is an
+        indexed literal which may be resolved with the first one
+        :param clause: Query clause
+        :return: Iterator of literal of the query clause, candidate clause and literal of the candidate clause
+        """
+        for predicate in self._literals(clause):
+            for other_clause, other_predicate in self.find_complementary_literals(predicate):
+                yield predicate, other_clause, other_predicate
+
+    def _literals(self, clause: Clause) -> Sequence[Predicate]:
+        return clause.predicates if self.eligible_literals is None else self.eligible_literals(clause)
+
+    @staticmethod
+    def _group_key(predicate: Predicate, is_negated: bool) -> Tuple[str, bool, int]:
+        return predicate.get_name(), is_negated, len(predicate.get_child())
+
+    @staticmethod
+    def _symbol_key(entity: FirstOrderPredicateLogicEntity):
+        if isinstance(entity, Variable):
+            return LiteralIndex.VARIABLE_KEY
+        return entity.get_name(), len(entity.get_child()) if entity.has_child() else 0
+
+    @staticmethod
+    def _preorder_keys(entities: Iterable[FirstOrderPredicateLogicEntity]) -> List:
+        keys = []
+        stack = list(reversed(tuple(entities)))
+        while stack:
+            entity = stack.pop()
+            keys.append(LiteralIndex._symbol_key(entity))
+            if entity.has_child():
+                stack.extend(reversed(entity.get_child()))
+        return keys
+
+    @staticmethod
+    def _skip_subterm(node: _DiscriminationTreeNode) -> Iterator[_DiscriminationTreeNode]:
+        """
+        Nodes which are reached after skipping exactly one complete subterm from the given node
+        """
+        pending = [(node, 1)]
+        while pending:
+            current, remaining = pending.pop()
+            if remaining == 0:
+                yield current
+                continue
+            for key, child in current.children.items():
+                arity = 0 if key == LiteralIndex.VARIABLE_KEY else key[1]
+                pending.append((child, remaining - 1 + arity))
+
+    @staticmethod
+    def _retrieve_unifiable(node: _DiscriminationTreeNode,
+                            query: Sequence[FirstOrderPredicateLogicEntity]) -> Iterator[_DiscriminationTreeNode]:
+        """
+        Leaf nodes whose paths may be unified with the query arguments
+        Query is flattened in preorder, so each pending pair of a tree node and the position of the next query subterm
+        is enough to continue the walk, and a query subterm is skipped by jumping to the end of the subterm
+        """
+        entities = []
+        stack = list(reversed(tuple(query)))
+        while stack:
+            entity = stack.pop()
+            entities.append(entity)
+            if entity.has_child():
+                stack.extend(reversed(entity.get_child()))
+        # End position of the subterm starting at each position, computed from the last subterm to the first one
+        ends = [0] * len(entities)
+        for position in range(len(entities) - 1, -1, -1):
+            end = position + 1
+            if entities[position].has_child():
+                for _ in entities[position].get_child():
+                    end = ends[end]
+            ends[position] = end
+
+        # Pending pairs are pushed in reverse order, so leaves are visited in the order of a recursive walk
+        pending = [(node, 0)]
+        while pending:
+            current, position = pending.pop()
+            if position == len(entities):
+                yield current
+                continue
+            entity = entities[position]
+            if isinstance(entity, Variable):
+                # Query variable can be unified with any subterm in the tree
+                pending.extend((next_node, position + 1) for next_node in
+                               reversed(list(LiteralIndex._skip_subterm(current))))
+                continue
+            # Otherwise, symbols should be the same and their children are compared next
+            symbol_node = current.children.get(LiteralIndex._symbol_key(entity))
+            if symbol_node is not None:
+                pending.append((symbol_node, position + 1))
+            # Indexed variable can be unified with the whole query subterm
+            variable_node = current.children.get(LiteralIndex.VARIABLE_KEY)
+            if variable_node is not None:
+                pending.append((variable_node, ends[position]))
+
+
+class GroundUnitIndex(object):
+    """
+    Hash index of ground unit clauses, i.e. facts, keyed by their only literal
+
+    Entities are hash-consed, so a ground literal is found by a single dictionary lookup of its name, negation and
+    arguments. A ground unit can be resolved only with the literals unifying with its complement and it subsumes
+    exactly the clauses containing its literal, so both of them are found without visiting any other indexed clause.
+    Facts are also grouped by their name and negation for the queries which are not ground.
+    """
+
+    def __init__(self, clauses: Iterable[Clause] = ()):
+        self.units = {}  # type: Dict[Tuple[str, bool, tuple], Clause]
+        self.groups = {}  # type: Dict[Tuple[str, bool], Dict[Clause, bool]]
+        for clause in clauses:
+            self.add(clause)
+
+    def __len__(self):
+        return len(self.units)
+
+    def __contains__(self, clause: Clause) -> bool:
+        return GroundUnitIndex.is_ground_unit(clause) and \
+            self.units.get(GroundUnitIndex._key(clause.predicates[0], clause.predicates[0].is_negated)) == clause
+
+    def add(self, clause: Clause) -> bool:
+        """
+        Insert the clause into the index if it is a ground unit clause
+        :param clause: Clause to be indexed
+        :return: Boolean flag representing whether the clause is inserted or not
+        """
+        if not GroundUnitIndex.is_ground_unit(clause):
+            return False
+        predicate = clause.predicates[0]
+        key = GroundUnitIndex._key(predicate, predicate.is_negated)
+        if key in self.units:
+            return False
+        self.units[key] = clause
+        self.groups.setdefault((predicate.get_name(), predicate.is_negated), {})[clause] = True
+        return True
+
+    def remove(self, clause: Clause) -> bool:
+        """
+        Remove the clause from the index
+        :param clause: Clause to be removed
+        :return: Boolean flag representing whether the clause was indexed or not
+        """
+        if clause not in self:
+            return False
+        predicate = clause.predicates[0]
+        del self.units[GroundUnitIndex._key(predicate, predicate.is_negated)]
+        group_key = (predicate.get_name(), predicate.is_negated)
+        group = self.groups[group_key]
+        del group[clause]
+        if not group:
+            del self.groups[group_key]
+        return True
+
+    def find_unit(self, predicate: Predicate) -> Optional[Clause]:
+        """
+        Ground unit clause whose literal is the given predicate
+        """
+        return self.units.get(GroundUnitIndex._key(predicate, predicate.is_negated))
+
+    def find_complementary_unit(self, predicate: Predicate) -> Optional[Clause]:
+        """
+        Ground unit clause whose literal is the complement of the given predicate, i.e. the only ground unit which can
+        be resolved with a ground predicate
+        """
+        return self.units.get(GroundUnitIndex._key(predicate, not predicate.is_negated))
+
+    def find_group(self, name: str, is_negated: bool) -> Iterable[Clause]:
+        """
+        Ground unit clauses whose literals have the given name and negation
+        """
+        return self.groups.get((name, is_negated), {}).keys()
+
+    def find_subsuming_unit(self, clause: Clause) -> Optional[Clause]:
+        """
+        Ground unit clause subsuming the given clause, i.e. whose literal exists in the clause
+        """
+        for predicate in clause.predicates:
+            unit = self.units.get(GroundUnitIndex._key(predicate, predicate.is_negated))
+            if unit is not None:
+                return unit
+        return None
+
+    @staticmethod
+    def is_ground_unit(clause: Clause) -> bool:
+        return clause.get_clause_length() == 1 and not clause.get_variables()
+
+    @staticmethod
+    def _key(predicate: Predicate, is_negated: bool) -> Tuple[str, bool, tuple]:
+        return predicate.get_name(), is_negated, predicate.get_child()
+
+
+class SubsumptionIndex(object):
+    """
+    Feature vector index of clauses which is used to find subsuming and subsumed clauses
+
+    Each clause is mapped into a fixed length vector of features where each feature can only increase from a clause
+    to the clauses which are subsumed by it. The first feature is the number of distinct (name, negation) pairs of the
+    predicates and each of the remaining features is the maximum of one plus predicate depth among the predicates
+    whose (name, negation) pair is assigned to that feature. Vectors are stored in a trie, so a clause can subsume
+    another clause only if each feature of its vector is less than or equal to that of the other one and the trie is
+    traversed only through such branches.
+
+    Subsumption checks of the candidates are counted if statistics are given.
+
+    Ground unit clauses share the same feature vector with all the other facts of their predicate, so they are kept
+    in a :class:`GroundUnitIndex` instead of the trie and a clause is checked against the facts by hash lookups.
+    """
+    MAX_FEATURE_BUCKETS = 16
+
+    def __init__(self, clauses: Iterable[Clause] = (), statistics: Optional[SearchStatistics] = None):
+        self.root = {}
+        self.feature_buckets = {}  # type: Dict[Tuple[str, bool], int]
+        self.ground_units = GroundUnitIndex()
+        self.size = 0
+        self.statistics = statistics
+        for clause in clauses:
+            self.add(clause)
+
+    def __len__(self):
+        return self.size
+
+    def add(self, clause: Clause):
+        """
+        Insert the clause into the index
+        :param clause: Clause to be indexed
+        """
+        if GroundUnitIndex.is_ground_unit(clause):
+            self.size += self.ground_units.add(clause)
+            return
+        node = self.root
+        for feature in self._feature_vector(clause, True):
+            node = node.setdefault(feature, {})
+        if clause not in node:
+            node[clause] = True
+            self.size += 1
+
+    def remove(self, clause: Clause):
+        """
+        Remove the clause from the index, empty branches are pruned
+        :param clause: Clause to be removed
+        """
+        if GroundUnitIndex.is_ground_unit(clause):
+            self.size -= self.ground_units.remove(clause)
+            return
+        path = [self.root]
+        features = self._feature_vector(clause)
+        for feature in features:
+            node = path[-1].get(feature)
+            if node is None:
+                return
+            path.append(node)
+        if path[-1].pop(clause, None) is None:
+            return
+        self.size -= 1
+        for depth in range(len(features), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][features[depth - 1]]
+
+    def find_subsuming_clauses(self, clause: Clause) -> Iterator[Clause]:
+        """
+        Forward subsumption query which finds indexed clauses subsuming the given clause
+        :param clause: Query clause
+        :return: Iterator of indexed clauses which subsume the query clause
+        """
+        for predicate in clause.predicates:
+            unit = self.ground_units.find_unit(predicate)
+            if unit is not None:
+                yield unit
+        features = self._feature_vector(clause)
+        for candidate in self._retrieve(features, lambda indexed, query: indexed <= query):
+            if self._subsumes(candidate, clause):
+                yield candidate
+
+    def find_subsumed_clauses(self, clause: Clause) -> Iterator[Clause]:
+        """
+        Backward subsumption query which finds indexed clauses subsumed by the given clause
+        :param clause: Query clause
+        :return: Iterator of indexed clauses which are subsumed by the query clause
+        """
+        features = self._feature_vector(clause)
+        for candidate in self._retrieve(features, lambda indexed, query: indexed >= query):
+            if candidate != clause and self._subsumes(clause, candidate):
+                yield candidate
+        # Only the clauses whose literals share a single name and negation can subsume a unit clause, and a ground
+        # unit clause can subsume only itself
+        keys = set((predicate.get_name(), predicate.is_negated) for predicate in clause.predicates)
+        if len(keys) == 1 and not GroundUnitIndex.is_ground_unit(clause):
+            for unit in list(self.ground_units.find_group(*keys.pop())):
+                if self._subsumes(clause, unit):
+                    yield unit
+
+    def is_subsumed(self, clause: Clause) -> bool:
+        """
+        Check whether any indexed clause subsumes the given clause
+        """
+        return next(self.find_subsuming_clauses(clause), None) is not None
+
+    def _subsumes(self, clause: Clause, other: Clause) -> bool:
+        if self.statistics is None:
+            return clause.does_subsume(other)
+        return self.statistics.count(SearchStatistics.SUBSUMPTION_CHECKS, SearchStatistics.SUBSUMPTIONS,
+                                     clause.does_subsume(other))
+
+    def _retrieve(self, features: List[int], is_compatible) -> List[Clause]:
+        candidates = []
+        pending = [(self.root, 0)]
+        while pending:
+            node, depth = pending.pop()
+            if depth == len(features):
+                candidates.extend(node)
+                continue
+            for feature, child in node.items():
+                if is_compatible(feature, features[depth]):
+                    pending.append((child, depth + 1))
+        return candidates
+
+    def _feature_vector(self, clause: Clause, is_inserted: bool = False) -> List[int]:
+        """
+        Feature vector of the clause where buckets are assigned to new (name, negation) pairs only if the clause is
+        inserted, so queries never change the index. No indexed clause has a pair without any bucket, so such pairs
+        are skipped in the vectors of the queries without losing any subsuming or subsumed clause
+        """
+        features = [0] * (SubsumptionIndex.MAX_FEATURE_BUCKETS + 1)
+        keys = set()
+        for predicate in clause.predicates:
+            key = (predicate.get_name(), predicate.is_negated)
+            keys.add(key)
+            bucket = self.feature_buckets.get(key)
+            if bucket is None:
+                if not is_inserted:
+                    continue
+                bucket = self.feature_buckets[key] = len(self.feature_buckets) % SubsumptionIndex.MAX_FEATURE_BUCKETS
+            features[bucket + 1] = max(features[bucket + 1], 1 + predicate.get_depth())
+        features[0] = len(keys)
+        return features
+
+
+class LiteralIndexUnitTest(unittest.TestCase):
+
+    @staticmethod
+    def _clause(predicates):
+        return Clause([Predicate.build(predicate) for predicate in children_entity_parser(predicates)])
+
+    @staticmethod
+    def _candidates(index, predicate):
+        return [(str(clause), str(literal)) for clause, literal in
+                index.find_complementary_literals(Predicate.build(predicate))]
+
+    def test_complementary_literal_lookup(self):
+        clause1 = LiteralIndexUnitTest._clause('p(A), q(x)')
+        clause2 = LiteralIndexUnitTest._clause('~p(B)')
+        clause3 = LiteralIndexUnitTest._clause('~p(x), r(x)')
+        clause4 = LiteralIndexUnitTest._clause('~p(x, y)')
+        index = LiteralIndex([clause1, clause2, clause3, clause4])
+
+        self.assertEqual([('[~p(x), r(x)]', '~p(x)')], LiteralIndexUnitTest._candidates(index, 'p(A)'))
+        self.assertCountEqual([('[~p(B)]', '~p(B)'), ('[~p(x), r(x)]', '~p(x)')],
+                         LiteralIndexUnitTest._candidates(index, 'p(z)'))
+        self.assertEqual([('[p(A), q(x)]', 'p(A)')], LiteralIndexUnitTest._candidates(index, '~p(A)'))
+        self.assertEqual([], LiteralIndexUnitTest._candidates(index, '~p(C)'))
+        self.assertEqual([], LiteralIndexUnitTest._candidates(index, 'q(A)'))
+
+    def test_function_lookup(self):
+        clause1 = LiteralIndexUnitTest._clause('p(f(A, g(x)), B)')
+        clause2 = LiteralIndexUnitTest._clause('p(f(y, h(x)), B)')
+        clause3 = LiteralIndexUnitTest._clause('p(z, C)')
+        clause4 = LiteralIndexUnitTest._clause('p(f(y, z), C)')
+        index = LiteralIndex([clause1, clause2, clause3, clause4])
+
+        self.assertEqual([('[p(f(A,g(x)),B)]', 'p(f(A,g(x)),B)')],
+                         LiteralIndexUnitTest._candidates(index, '~p(f(w, g(C)), B)'))
+        self.assertCountEqual([('[p(z,C)]', 'p(z,C)'), ('[p(f(y,z),C)]', 'p(f(y,z),C)')],
+                         LiteralIndexUnitTest._candidates(index, '~p(f(B, k(D)), C)'))
+        self.assertEqual(4, len(LiteralIndexUnitTest._candidates(index, '~p(u, v)')))
+        self.assertEqual(2, len(LiteralIndexUnitTest._candidates(index, '~p(f(u, v), B)')))
+
+    def test_wide_literal_lookup(self):
+        from .entity.constant import Constant
+
+        arity = 1200
+        clause1 = Clause([Predicate('p', [Constant('C{0}'.format(index)) for index in range(arity)], False)])
+        clause2 = Clause([Predicate('p', [Variable('x{0}'.format(index)) for index in range(arity)], False)])
+        index = LiteralIndex([clause1, clause2])
+
+        # Walk does not grow the call stack with the number of query symbols
+        query = Predicate('p', [Constant('C{0}'.format(index)) for index in range(arity)], True)
+        self.assertCountEqual([clause1, clause2], [clause for clause, _ in index.find_complementary_literals(query)])
+        query = Predicate('p', [Variable('y')] + [Constant('D')] * (arity - 1), True)
+        self.assertEqual([clause2], [clause for clause, _ in index.find_complementary_literals(query)])
+
+    def test_remove(self):
+        clause1 = LiteralIndexUnitTest._clause('p(f(A)), q(x)')
+        clause2 = LiteralIndexUnitTest._clause('p(f(x))')
+        index = LiteralIndex([clause1, clause2])
+
+        index.remove(clause1)
+        self.assertEqual([('[p(f(x))]', 'p(f(x))')], LiteralIndexUnitTest._candidates(index, '~p(y)'))
+        self.assertEqual([], LiteralIndexUnitTest._candidates(index, '~q(y)'))
+
+        index.remove(clause2)
+        self.assertEqual({}, index.roots)
+
+    def test_resolution_candidates(self):
+        clause1 = LiteralIndexUnitTest._clause('p(A), ~q(x)')
+        clause2 = LiteralIndexUnitTest._clause('q(B), ~p(B)')
+        index = LiteralIndex([clause2])
+
+        candidates = [(str(predicate), str(other_clause), str(other_predicate)) for
+                      predicate, other_clause, other_predicate in index.find_resolution_candidates(clause1)]
+        self.assertEqual([('~q(x)', '[~p(B), q(B)]', 'q(B)')], candidates)
+
+
+class GroundUnitIndexUnitTest(unittest.TestCase):
+
+    def test_lookup(self):
+        facts = [LiteralIndexUnitTest._clause(text) for text in ['p(A, f(B))', '~p(A, B)', 'q(C)']]
+        index = GroundUnitIndex(facts + [LiteralIndexUnitTest._clause(text) for text in ['p(x, B)', 'p(A), q(C)']])
+
+        self.assertEqual(3, len(index))
+        self.assertIn(facts[0], index)
+        self.assertEqual(facts[0], index.find_unit(facts[0].predicates[0]))
+        self.assertEqual(facts[1], index.find_complementary_unit(LiteralIndexUnitTest._clause('p(A, B)').predicates[0]))
+        self.assertIsNone(index.find_complementary_unit(facts[2].predicates[0]))
+        self.assertEqual(facts[2], index.find_subsuming_unit(LiteralIndexUnitTest._clause('~r(x), q(C)')))
+        self.assertEqual([facts[0]], list(index.find_group('p', False)))
+
+        self.assertTrue(index.remove(facts[0]))
+        self.assertFalse(index.remove(facts[0]))
+        self.assertEqual([], list(index.find_group('p', False)))
+        self.assertEqual(2, len(index))
+
+    def test_subsumption_index(self):
+        facts = [LiteralIndexUnitTest._clause('p(C{0})'.format(index)) for index in range(3)]
+        index = SubsumptionIndex(facts + [LiteralIndexUnitTest._clause('q(x), r(x)')])
+
+        # Facts are not kept in the feature vector trie
+        self.assertEqual(4, len(index))
+        self.assertEqual(3, len(index.ground_units))
+        self.assertEqual([facts[1]], list(index.find_subsuming_clauses(LiteralIndexUnitTest._clause('p(C1), r(A)'))))
+        self.assertCountEqual(facts, index.find_subsumed_clauses(LiteralIndexUnitTest._clause('p(x)')))
+        self.assertEqual([], list(index.find_subsumed_clauses(facts[0])))
+        index.remove(facts[1])
+        self.assertFalse(index.is_subsumed(facts[1]))
+        self.assertEqual(3, len(index))
+
+
+class SubsumptionIndexUnitTest(unittest.TestCase):
+
+    @staticmethod
+    def _clause(predicates):
+        return LiteralIndexUnitTest._clause(predicates)
+
+    def test_forward_subsumption(self):
+        clause1 = SubsumptionIndexUnitTest._clause('p(x)')
+        clause2 = SubsumptionIndexUnitTest._clause('q(A), r(y)')
+        clause3 = SubsumptionIndexUnitTest._clause('~p(f(x))')
+        index = SubsumptionIndex([clause1, clause2, clause3])
+
+        self.assertEqual(3, len(index))
+        self.assertEqual([clause1], list(index.find_subsuming_clauses(
+            SubsumptionIndexUnitTest._clause('p(A), q(B)'))))
+        self.assertEqual([clause2], list(index.find_subsuming_clauses(
+            SubsumptionIndexUnitTest._clause('q(A), r(B), s(C)'))))
+        self.assertEqual([clause3], list(index.find_subsuming_clauses(
+            SubsumptionIndexUnitTest._clause('~p(f(g(A)))'))))
+        self.assertTrue(index.is_subsumed(clause1))
+        self.assertFalse(index.is_subsumed(SubsumptionIndexUnitTest._clause('~p(A)')))
+        self.assertFalse(index.is_subsumed(SubsumptionIndexUnitTest._clause('q(B), r(B)')))
+
+    def test_backward_subsumption(self):
+        clause1 = SubsumptionIndexUnitTest._clause('p(A), q(B)')
+        clause2 = SubsumptionIndexUnitTest._clause('p(f(A))')
+        clause3 = SubsumptionIndexUnitTest._clause('~p(A)')
+        clause4 = SubsumptionIndexUnitTest._clause('p(x)')
+        index = SubsumptionIndex([clause1, clause2, clause3, clause4])
+
+        self.assertCountEqual([clause1, clause2], index.find_subsumed_clauses(clause4))
+        self.assertEqual([], list(index.find_subsumed_clauses(SubsumptionIndexUnitTest._clause('p(B)'))))
+
+    def test_remove(self):
+        clause1 = SubsumptionIndexUnitTest._clause('p(x)')
+        clause2 = SubsumptionIndexUnitTest._clause('p(x), q(y)')
+        index = SubsumptionIndex([clause1, clause2])
+
+        index.remove(clause1)
+        self.assertEqual(1, len(index))
+        self.assertFalse(index.is_subsumed(SubsumptionIndexUnitTest._clause('p(A)')))
+        self.assertTrue(index.is_subsumed(SubsumptionIndexUnitTest._clause('p(A), q(B)')))
+
+        index.remove(clause2)
+        index.remove(clause2)
+        self.assertEqual(0, len(index))
+        self.assertEqual({}, index.root)
+
+    def test_feature_buckets(self):
+        index = SubsumptionIndex()
+        clauses = [SubsumptionIndexUnitTest._clause('p{0}(x{0})'.format(i)) for i in
+                   range(2 * SubsumptionIndex.MAX_FEATURE_BUCKETS)]
+        for clause in clauses:
+            index.add(clause)
+
+        for clause in clauses:
+            self.assertEqual([clause], list(index.find_subsuming_clauses(clause)))
+
+        # Queries with unknown predicates do not assign any bucket
+        feature_buckets = dict(index.feature_buckets)
+        query = SubsumptionIndexUnitTest._clause('q(A, x), p0(y)')
+        self.assertEqual([clauses[0]], list(index.find_subsuming_clauses(query)))
+        self.assertEqual([], list(index.find_subsumed_clauses(query)))
+        self.assertEqual(feature_buckets, index.feature_buckets)
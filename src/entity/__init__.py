@@ -52,7 +52,7 @@ def children_entity_parser(children: str):
             if len(symbol_stack) == 0:
                 return None
             else:
-                symbol_stack.pop(0)
+                symbol_stack.pop()
 
     if len(symbol_stack) != 0:
         return None
@@ -1,21 +1,44 @@
 import itertools
 import unittest
 
-from typing import List, Optional, Union, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Set, Union, Tuple
 
 from . import children_entity_parser
 from .predicate import Predicate
-from ..most_general_unifier import MostGeneralUnifier
+from .variable import Variable
+from ..most_general_unifier import Substitution, TriangularUnifier
 
 
 class Clause(object):
     """
     Class for keeping predicates together and some several multi-predicate supported functionality
+
+    Clauses are kept in a canonical form where predicates are ordered by their name, negation and shape, i.e. their
+    structure where variables are numbered by their first occurrence in the predicate. Equality and hash value of the
+    clause are computed once from its predicates where variables are renumbered by their first occurrence in the
+    clause, so variants of a clause, i.e. the same clause with renamed variables or reordered literals, are equal.
+    Predicates of the clause keep their own variables, so the resolvents are still shown with the names of the input.
+    Variants whose literals differ only in the names of their variables may still be ordered differently, so variant
+    detection is sound but not complete.
     """
 
     def __init__(self, predicates: List[Optional[Predicate]]):
-        self.predicates = predicates
-        self.predicates = sorted(self.predicates, key=lambda predicate: (predicate.get_name(), predicate.is_negated))
+        # Identical literals are merged, which resolution relies on to be complete, e.g. on ground clauses
+        self.predicates = Clause._canonical_order(list(dict.fromkeys(predicates)))
+        variables = Clause._variables_in_order(self.predicates)
+        # Predicates are hash-consed, so tuple of them is enough to compare clauses without stringifying
+        if variables:
+            renaming = {variable: Variable('v{0}'.format(index)) for index, variable in enumerate(variables)}
+            self._key = tuple(predicate.instantiate(renaming) for predicate in self.predicates)
+        else:
+            self._key = tuple(self.predicates)
+        self._hash = hash(self._key)
+        self._variables = frozenset(variables)
+        self._weight = None
+
+    def __reduce__(self):
+        # Hash values are process specific, so clause is rebuilt from its predicates while unpickling
+        return Clause, (self.predicates,)
 
     def __repr__(self):
         return str(self)
@@ -26,31 +49,28 @@ class Clause(object):
     def __eq__(self, other):
         if not isinstance(other, Clause):
             return False
-        return str(self.predicates) == str(other)
+        return self._hash == other._hash and self._key == other._key
 
     def __hash__(self):
-        return hash(str(self.predicates))
+        return self._hash
 
     def get_clause_length(self):
         return len(self.predicates)
 
     def has_tautology(self) -> bool:
         """
-        Tautology checking procedure in the list of predicates
+        Tautology checking procedure in the list of predicates where the clause is a tautology if it contains a literal
+        and its complement, complementary literals which are only unifiable, e.g. p(x), ~p(A), do not make a tautology
         :return: Boolean flag representing whether the list has tautology or not. In case of having tautology True will
         be returned, otherwise False.
         """
         # Group each predicate by their name
         for key, group in itertools.groupby(self.predicates, lambda predicate: predicate.get_name()):
-            # Separate them by their negation and test all the unification results of permutations of paired predicates
+            # Separate them by their negation, terms are hash-consed so complementary literals have the same children
             non_negated_predicates, negated_predicates = Clause._predicate_separator_by_sign(group)
-            for non_negated_predicate in non_negated_predicates:
-                for negated_predicate in negated_predicates:
-                    unification, _ = MostGeneralUnifier.unify(non_negated_predicate.get_child(),
-                                                              negated_predicate.get_child())
-                    # If any of them can be unified, it means we got tautology
-                    if unification:
-                        return True
+            non_negated_children = set(predicate.get_child() for predicate in non_negated_predicates)
+            if any(predicate.get_child() in non_negated_children for predicate in negated_predicates):
+                return True
         # If not achieved any tautology, it means we have no tautology
         return False
 
@@ -58,56 +78,233 @@ class Clause(object):
         """
         Subsumption controlling function where the function tries to find
         whether the other clause is more specific than the current clause
+        The current clause subsumes the other clause if a single substitution maps the literals of the current clause
+        onto distinct literals of the other clause (multiset subsumption). Literals are matched one at a time with
+        backtracking where the bindings are shared among the literals, and the literal with the fewest candidates is
+        matched first
         :param other: Other clause to check subsumption
         :return: Boolean flag representing that the current clause subsumes the other clause
         """
         # If no meet naming and negation match as a subset then immediately return False since subsumption cannot occur
-        fast_check_result = Clause._fast_check_by_negation_and_name(self, other)
-        if fast_check_result:
-            # Group by both name and negation
-            first_group = {key: list(group) for key, group in
-                           itertools.groupby(self.predicates, lambda p: (p.get_name(), p.is_negated))}
-            second_group = {key: list(group) for key, group in
-                            itertools.groupby(other.predicates, lambda p: (p.get_name(), p.is_negated))}
-            # Take common keys of each dict so that we can check if there exists any substitution which unifies them
-            common_keys = first_group.keys() & second_group.keys()
-            # And filter common predicates
-            filtered_first_group = [first_group[key] for key in common_keys]
-            filtered_second_group = [second_group[key] for key in common_keys]
-            # Then take multiplication of them
-            for multiplication in itertools.product(itertools.product(*filtered_first_group),
-                                                    itertools.product(*filtered_second_group)):
-                # Each of the predicates must be the same or be less specific than the other's predicates
-                result = all(child == other_child or child.is_less_specific(other_child)
-                             for child, other_child in zip(multiplication[0], multiplication[1]))
-                if result:
-                    return True
-            # If none of them holds the condition, then return False
+        if not Clause._fast_check_by_negation_and_name(self, other):
             return False
-        else:
-            # If fast check fails
+        # Resolvents are never factored, so literals are mapped onto distinct literals, e.g. p(x), p(y) would otherwise
+        # subsume p(A), q(B) although p(A) can never be derived from it, hence a longer clause never subsumes
+        if self.get_clause_length() > other.get_clause_length():
             return False
-
-    def resolve_with(self, other: 'Clause') -> Tuple[Union['Clause', None], Union['Clause', None]]:
+        groups = {}
+        for other_predicate in other.predicates:
+            groups.setdefault((other_predicate.get_name(), other_predicate.is_negated), []).append(other_predicate)
+        # Candidates of each literal are the literals of the other clause which can be matched by the literal alone,
+        # a literal of distinct variables matches every literal of the same name and arity, a ground literal matches
+        # only itself and matching never decreases depth or weight
+        candidates = []
+        for predicate in self.predicates:
+            children = predicate.get_child()
+            group = groups[(predicate.get_name(), predicate.is_negated)]
+            if predicate.is_ground():
+                matches = [other_predicate for other_predicate in group if other_predicate is predicate]
+            elif predicate.get_weight() == 1 + len(children) and len(predicate.get_variables()) == len(children):
+                matches = [other_predicate for other_predicate in group if
+                           len(other_predicate.get_child()) == len(children)]
+            else:
+                matches = [other_predicate for other_predicate in group if
+                           predicate.get_depth() <= other_predicate.get_depth() and
+                           predicate.get_weight() <= other_predicate.get_weight() and
+                           TriangularUnifier.match_with_bindings(children, other_predicate.get_child(), {}, [])]
+            # If any literal cannot be matched at all, there is nothing to backtrack
+            if not matches:
+                return False
+            candidates.append((predicate, matches))
+        candidates.sort(key=lambda candidate: len(candidate[1]))
+        return Clause._match_literals(candidates, 0, {}, [], set())
+
+    def resolve_with(self, other: 'Clause',
+                     eligible_literals: Optional[Callable[['Clause'], Sequence[Predicate]]] = None) -> \
+            Tuple[Union['Clause', None], Union[List[Substitution], None]]:
         """
         Function to resolve two clauses
         :param other: Other clause
+        :param eligible_literals: Function giving the literals of a clause which can be resolved upon, e.g. maximal or
+        selected literals of ordered resolution, every literal can be resolved upon if it is not given
         :return: Resolvent clause in case of resolution otherwise None
         """
-        for predicate1, predicate2 in itertools.product(self.predicates, other.predicates):
-            # Try to unify them if they represent the same predicate but they have different negation states
-            if predicate1.get_name() == predicate2.get_name() and predicate1.is_negated != predicate2.is_negated:
-                result, substitutions = MostGeneralUnifier.unify(predicate1.get_child(), predicate2.get_child())
-                # Compose new predicate with combined predicates of both clauses except for resolvent predicates
-                new_clause_children = [Predicate.build(str(predicate)) for predicate in self.predicates]
-                new_clause_children.extend([Predicate.build(str(predicate)) for predicate in other.predicates])
-                new_clause_children.remove(predicate1)
-                new_clause_children.remove(predicate2)
-                # Return composed clause
-                return Clause(MostGeneralUnifier.apply_substitution(new_clause_children, substitutions)), substitutions
+        if eligible_literals is None:
+            literals, other_literals = self.predicates, other.predicates
+        else:
+            literals, other_literals = eligible_literals(self), eligible_literals(other)
+        for predicate1, predicate2 in itertools.product(literals, other_literals):
+            resolvent, substitutions = self.resolve_on(other, predicate1, predicate2)
+            if resolvent is not None:
+                return resolvent, substitutions
         # If none of them can be resolved, return none
         return None, None
 
+    def resolve_on(self, other: 'Clause', predicate: Predicate, other_predicate: Predicate) -> \
+            Tuple[Union['Clause', None], Union[List[Substitution], None]]:
+        """
+        Function to resolve two clauses on the given literals
+        :param other: Other clause
+        :param predicate: Literal of the current clause to be resolved upon
+        :param other_predicate: Literal of the other clause to be resolved upon
+        :return: Resolvent clause and unifier substitutions in case of resolution otherwise None
+        """
+        # Try to unify them if they represent the same predicate but they have different negation states
+        if predicate.get_name() != other_predicate.get_name() or predicate.is_negated == other_predicate.is_negated:
+            return None, None
+        # Rename variables of the other clause which also exist in this clause, so clauses do not share variables
+        renaming = self._renaming_apart(other)
+        result, substitutions = TriangularUnifier.unify(predicate.get_child(),
+                                                        other_predicate.instantiate(renaming).get_child())
+        # If they cannot be unified, then they cannot be resolved
+        if not result:
+            return None, None
+        bindings = {substitution.variable: substitution.substitute for substitution in substitutions}
+        other_bindings = {variable: renamed.instantiate(bindings) for variable, renamed in renaming.items()}
+        other_bindings.update((variable, substitute) for variable, substitute in bindings.items()
+                              if variable not in renaming)
+        # Compose new clause from the predicates of both clauses except for resolved predicates, where each predicate
+        # is instantiated directly and its unchanged parts are shared with the parent predicate
+        new_clause_children = Clause._instantiate_except(self.predicates, predicate, bindings)
+        new_clause_children.extend(Clause._instantiate_except(other.predicates, other_predicate, other_bindings))
+        return Clause(new_clause_children), substitutions
+
+    def get_variables(self) -> Set[Variable]:
+        """
+        Variables which exist in the predicates of the clause
+        """
+        return self._variables
+
+    def is_variant(self, other: 'Clause') -> bool:
+        """
+        Check whether the other clause is the same as the current clause up to renaming of variables and order of
+        literals, which is the same as equality of the clauses
+        """
+        return self == other
+
+    def get_term_depth(self) -> int:
+        """
+        Maximum nesting depth of the terms in the predicates of the clause where variables and constants have depth
+        zero and each function application adds one
+        """
+        return max((predicate.get_depth() for predicate in self.predicates), default=0)
+
+    def get_weight(self) -> int:
+        """
+        Number of symbols in the predicates of the clause, e.g. weight of [~p(x), q(f(A))] is 5
+        """
+        if self._weight is None:
+            self._weight = sum(predicate.get_weight() for predicate in self.predicates)
+        return self._weight
+
+    def get_sort_key(self) -> tuple:
+        """
+        Deterministic key ordering the clauses by their length, weight and canonical literals where each literal is
+        represented by its name, negation and shape, so clauses are ordered without stringifying their terms
+        """
+        return (len(self.predicates), self.get_weight(),
+                tuple((predicate.get_name(), predicate.is_negated, Clause._shape(predicate)) for predicate in self._key))
+
+    def _renaming_apart(self, other: 'Clause') -> Dict[Variable, Variable]:
+        """
+        Renaming of the variables of the other clause which also exist in the current clause into fresh variables
+        :param other: Other clause
+        :return: Dictionary of variables to their fresh variables, empty if clauses do not share any variable
+        """
+        shared_variables = self.get_variables() & other.get_variables()
+        if not shared_variables:
+            return {}
+        used_names = set(variable.get_name() for variable in self.get_variables() | other.get_variables())
+        renaming = {}
+        for variable in sorted(shared_variables, key=lambda v: v.get_name()):
+            base_name, index = variable.get_name().rstrip('0123456789'), 1
+            while base_name + str(index) in used_names:
+                index += 1
+            used_names.add(base_name + str(index))
+            renaming[variable] = Variable(base_name + str(index))
+        return renaming
+
+    @staticmethod
+    def _match_literals(candidates: List[Tuple[Predicate, List[Predicate]]], index: int, bindings: dict,
+                        trail: list, used: Set[Predicate]) -> bool:
+        """
+        Match the literals starting from the given index onto their candidates consistently with the bindings of the
+        previous literals, bindings of a failed candidate are undone before trying the next one and candidates which
+        are already used by the previous literals are skipped
+        """
+        if index == len(candidates):
+            return True
+        predicate, matches = candidates[index]
+        for other_predicate in matches:
+            if other_predicate in used:
+                continue
+            mark = len(trail)
+            if TriangularUnifier.match_with_bindings(predicate.get_child(), other_predicate.get_child(), bindings,
+                                                     trail):
+                used.add(other_predicate)
+                if Clause._match_literals(candidates, index + 1, bindings, trail, used):
+                    return True
+                used.discard(other_predicate)
+                TriangularUnifier.undo(bindings, trail, mark)
+        return False
+
+    @staticmethod
+    def _canonical_order(predicates: List[Predicate]) -> List[Predicate]:
+        """
+        Order the predicates by their name and negation, and by their shape if several predicates have the same name
+        and negation
+        """
+        predicates = sorted(predicates, key=lambda predicate: (predicate.get_name(), predicate.is_negated))
+        if all(predicate1.get_name() != predicate2.get_name() or predicate1.is_negated != predicate2.is_negated
+               for predicate1, predicate2 in zip(predicates, predicates[1:])):
+            return predicates
+        return sorted(predicates, key=lambda predicate: (predicate.get_name(), predicate.is_negated,
+                                                         Clause._shape(predicate)))
+
+    @staticmethod
+    def _shape(predicate: Predicate) -> Tuple[Tuple[str, int], ...]:
+        """
+        Preorder traversal of the arguments of the predicate where each symbol is represented by its name and arity,
+        and each variable by the order of its first occurrence in the predicate, so it does not depend on the names of
+        the variables
+        """
+        shape, variables = [], {}
+        stack = list(reversed(predicate.get_child()))
+        while stack:
+            entity = stack.pop()
+            if isinstance(entity, Variable):
+                shape.append(('', variables.setdefault(entity, len(variables))))
+            elif entity.has_child():
+                shape.append((entity.get_name(), len(entity.get_child())))
+                stack.extend(reversed(entity.get_child()))
+            else:
+                shape.append((entity.get_name(), 0))
+        return tuple(shape)
+
+    @staticmethod
+    def _variables_in_order(predicates: List[Predicate]) -> List[Variable]:
+        """
+        Variables of the predicates in the order of their first occurrence
+        """
+        variables = {}
+        stack = [predicate for predicate in reversed(predicates) if not predicate.is_ground()]
+        while stack:
+            entity = stack.pop()
+            if isinstance(entity, Variable):
+                variables.setdefault(entity, None)
+            elif entity.has_child():
+                stack.extend(reversed(entity.get_child()))
+        return list(variables)
+
+    @staticmethod
+    def _instantiate_except(predicates: List[Predicate], excluded: Predicate, bindings: dict) -> List[Predicate]:
+        """
+        Instantiate all the predicates except for the first occurrence of the excluded predicate
+        """
+        excluded_index = predicates.index(excluded)
+        return [predicate.instantiate(bindings) for index, predicate in enumerate(predicates) if
+                index != excluded_index]
+
     @staticmethod
     def _predicate_separator_by_sign(predicates):
         """
@@ -159,6 +356,48 @@ class ClauseUnitTest(unittest.TestCase):
         self.assertNotEqual(clause, clause3)
         self.assertNotEqual(clause, 8)
 
+    def test_variants(self):
+        clause = Clause(ClauseUnitTest._predicate_parser('p(x, f(y)), p(A, x), ~q(y)'))
+        variant = Clause(ClauseUnitTest._predicate_parser('~q(u), p(A, z), p(z, f(u))'))
+
+        self.assertEqual(clause, variant)
+        self.assertEqual(hash(clause), hash(variant))
+        self.assertTrue(clause.is_variant(variant))
+        self.assertEqual(1, len({clause, variant}))
+        # Predicates keep their variables and they are ordered by their shape
+        self.assertEqual('[p(z,f(u)), p(A,z), ~q(u)]', str(variant))
+        self.assertEqual({Variable('u'), Variable('z')}, variant.get_variables())
+
+        self.assertNotEqual(clause, Clause(ClauseUnitTest._predicate_parser('p(x, f(y)), p(A, y), ~q(y)')))
+        self.assertNotEqual(Clause(ClauseUnitTest._predicate_parser('p(x, x)')),
+                            Clause(ClauseUnitTest._predicate_parser('p(x, y)')))
+        self.assertNotEqual(Clause(ClauseUnitTest._predicate_parser('p(x)')),
+                            Clause(ClauseUnitTest._predicate_parser('p(A)')))
+
+    def test_get_term_depth(self):
+        self.assertEqual(0, Clause([]).get_term_depth())
+        self.assertEqual(0, Clause(ClauseUnitTest._predicate_parser('p(y), q(y,A)')).get_term_depth())
+        self.assertEqual(3, Clause(ClauseUnitTest._predicate_parser('p(f(y)), q(g(A, h(k(x))))')).get_term_depth())
+
+    def test_get_weight(self):
+        self.assertEqual(0, Clause([]).get_weight())
+        self.assertEqual(5, Clause(ClauseUnitTest._predicate_parser('~p(x), q(f(A))')).get_weight())
+        self.assertEqual(8, Clause(ClauseUnitTest._predicate_parser('p(f(y)), q(g(A, h(x)))')).get_weight())
+
+    def test_identical_literals(self):
+        clause = Clause(ClauseUnitTest._predicate_parser('p(A), q(x), p(A), q(x)'))
+        self.assertEqual(Clause(ClauseUnitTest._predicate_parser('p(A), q(x)')), clause)
+        self.assertEqual(2, clause.get_clause_length())
+        # Only identical literals are merged, merging unifiable literals would be factoring
+        self.assertEqual(2, Clause(ClauseUnitTest._predicate_parser('p(x), p(A)')).get_clause_length())
+
+    def test_get_sort_key(self):
+        clauses = [Clause(ClauseUnitTest._predicate_parser(predicates)) for predicates in
+                   ['p(x), q(f(A))', 'q(B)', 'p(y), q(f(A))', 'p(A), ~q(f(A))', 'p(A), q(f(A))', 'p(f(x))']]
+        self.assertEqual([clauses[1], clauses[5], clauses[0], clauses[2], clauses[4], clauses[3]],
+                         sorted(clauses, key=Clause.get_sort_key))
+        self.assertEqual(clauses[0].get_sort_key(), clauses[2].get_sort_key())
+
     def test_get_predicate_length(self):
         clause = Clause([])
         self.assertEqual(0, clause.get_clause_length())
@@ -186,11 +425,15 @@ class ClauseUnitTest(unittest.TestCase):
         self.assertTrue(clause.has_tautology())
 
     def test_has_tautology_variable_constant(self):
+        # Unifiable complementary literals do not make a tautology since p(y) does not hold for every y
         clause = Clause(ClauseUnitTest._predicate_parser('p(y),q(y, A),r(A),~p(H)'))
-        self.assertTrue(clause.has_tautology())
+        self.assertFalse(clause.has_tautology())
 
     def test_has_tautology_variable_function(self):
         clause = Clause(ClauseUnitTest._predicate_parser('p(y),q(y, A),r(A),~p(c(a, T))'))
+        self.assertFalse(clause.has_tautology())
+
+        clause = Clause(ClauseUnitTest._predicate_parser('p(c(a, T)),q(y, A),r(A),~p(c(a, T))'))
         self.assertTrue(clause.has_tautology())
 
     def test_has_tautology_constant(self):
@@ -205,9 +448,12 @@ class ClauseUnitTest(unittest.TestCase):
         self.assertFalse(clause.has_tautology())
 
         clause = Clause(ClauseUnitTest._predicate_parser('p(x, r(ABC, k)),q(y, A),r(A),~p(x, r(b, k))'))
-        self.assertTrue(clause.has_tautology())
+        self.assertFalse(clause.has_tautology())
 
         clause = Clause(ClauseUnitTest._predicate_parser('p(x, r(ABC, k)),q(y, A),r(A),~p(u, r(b, k))'))
+        self.assertFalse(clause.has_tautology())
+
+        clause = Clause(ClauseUnitTest._predicate_parser('p(x, r(b, k)),q(y, A),r(A),~p(x, r(b, k))'))
         self.assertTrue(clause.has_tautology())
 
     def test_fast_check_valid(self):
@@ -314,6 +560,54 @@ class ClauseUnitTest(unittest.TestCase):
         clause2 = Clause(ClauseUnitTest._predicate_parser('p(y),q(y),r(y,B)'))
         self.assertFalse(clause1.does_subsume(clause2))
 
+    def test_subsumption_with_shared_bindings(self):
+        # Variable x cannot be bound to both A and B
+        clause1 = Clause(ClauseUnitTest._predicate_parser('p(x),q(x)'))
+        self.assertFalse(clause1.does_subsume(Clause(ClauseUnitTest._predicate_parser('p(A),q(B)'))))
+        self.assertTrue(clause1.does_subsume(Clause(ClauseUnitTest._predicate_parser('p(A),q(B),q(A)'))))
+
+        # Repeated predicates are matched onto any of the literals of the same name
+        clause1 = Clause(ClauseUnitTest._predicate_parser('p(x,y),p(y,x)'))
+        self.assertTrue(clause1.does_subsume(Clause(ClauseUnitTest._predicate_parser('p(B,A),p(A,B),q(C)'))))
+        self.assertFalse(clause1.does_subsume(Clause(ClauseUnitTest._predicate_parser('p(A,B),p(B,C)'))))
+        self.assertTrue(Clause(ClauseUnitTest._predicate_parser('p(x),p(y)')).does_subsume(
+            Clause(ClauseUnitTest._predicate_parser('p(A),p(B)'))))
+        # Longer clause does not subsume a shorter one since clauses are not factored
+        self.assertFalse(Clause(ClauseUnitTest._predicate_parser('p(x),p(y)')).does_subsume(
+            Clause(ClauseUnitTest._predicate_parser('p(A)'))))
+        self.assertTrue(Clause(ClauseUnitTest._predicate_parser('p(A)')).does_subsume(
+            Clause(ClauseUnitTest._predicate_parser('p(A),p(A)'))))
+        # Literals are not matched onto the same literal even if the subsuming clause is not longer
+        self.assertFalse(Clause(ClauseUnitTest._predicate_parser('p(z),p(z1)')).does_subsume(
+            Clause(ClauseUnitTest._predicate_parser('r(x),p(z)'))))
+        self.assertFalse(Clause(ClauseUnitTest._predicate_parser('p(y),p(x)')).does_subsume(
+            Clause(ClauseUnitTest._predicate_parser('p(x),~q(y)'))))
+        self.assertTrue(Clause(ClauseUnitTest._predicate_parser('p(x),p(A)')).does_subsume(
+            Clause(ClauseUnitTest._predicate_parser('p(A),p(B)'))))
+
+    def test_subsumption_without_factoring(self):
+        import json
+        from io import StringIO
+        from ..autonomous_theorem_prover import AutonomousTheoremProver
+        from ..input_parser import InputParser
+
+        # Negated theorem is retired by p(z), p(z1) if its literals are matched onto the same literal, whose factor
+        # p(z) is never derived
+        problem_state = InputParser.parse(StringIO(json.dumps({
+            InputParser.KNOWLEDGE_BASE_LABEL: ['~r(f(B)),~r(A)', '~p(A),~q(A)', '~q(B),~r(A)', '~p(f(y)),~p(y)'],
+            InputParser.NEGATED_THEOREM_PREDICATES_LABEL: ['r(x),p(z)']
+        })))
+        for strategy in AutonomousTheoremProver.SEARCH_STRATEGIES:
+            self.assertTrue(AutonomousTheoremProver(problem_state, search_strategy=strategy).prove())
+
+        # Variables of the subsumed clause are treated as constants even if they have the same names
+        self.assertTrue(Clause(ClauseUnitTest._predicate_parser('p(x)')).does_subsume(
+            Clause(ClauseUnitTest._predicate_parser('p(f(x))'))))
+        self.assertFalse(Clause(ClauseUnitTest._predicate_parser('p(x,x)')).does_subsume(
+            Clause(ClauseUnitTest._predicate_parser('p(y,f(y))'))))
+        self.assertFalse(Clause(ClauseUnitTest._predicate_parser('p(f(x))')).does_subsume(
+            Clause(ClauseUnitTest._predicate_parser('p(x)'))))
+
     def test_resolve_with_with_match(self):
         clause1 = Clause(ClauseUnitTest._predicate_parser('~q(y), r(y)'))
         clause2 = Clause(ClauseUnitTest._predicate_parser('~r(A)'))
@@ -323,12 +617,20 @@ class ClauseUnitTest(unittest.TestCase):
         self.assertIsNotNone(resolvent)
         self.assertIsNotNone(substitution)
 
-        expected_resolvent = Clause(ClauseUnitTest._predicate_parser('~q(y)'))
+        expected_resolvent = Clause(ClauseUnitTest._predicate_parser('~q(A)'))
         expected_substitution_list = '[A / y]'
 
         self.assertEqual(expected_resolvent, resolvent)
         self.assertEqual(expected_substitution_list, str(substitution))
 
+    def test_resolve_with_eligible_literals(self):
+        clause1 = Clause(ClauseUnitTest._predicate_parser('~q(y), r(y)'))
+        clause2 = Clause(ClauseUnitTest._predicate_parser('q(A)'))
+
+        self.assertEqual(Clause(ClauseUnitTest._predicate_parser('r(A)')), clause1.resolve_with(clause2)[0])
+        # Only the last literal of each clause is eligible
+        self.assertEqual((None, None), clause1.resolve_with(clause2, lambda clause: clause.predicates[-1:]))
+
     def test_resolve_with_with_no_match(self):
         clause1 = Clause(ClauseUnitTest._predicate_parser('~q(y), r(y)'))
         clause2 = Clause(ClauseUnitTest._predicate_parser('p(A,f(t))'))
@@ -337,3 +639,72 @@ class ClauseUnitTest(unittest.TestCase):
 
         self.assertIsNone(resolvent)
         self.assertIsNone(substitution)
+
+    def test_resolve_with_with_non_unifiable_match(self):
+        clause1 = Clause(ClauseUnitTest._predicate_parser('p(A)'))
+        clause2 = Clause(ClauseUnitTest._predicate_parser('~p(B)'))
+
+        resolvent, substitution = clause1.resolve_with(clause2)
+
+        self.assertIsNone(resolvent)
+        self.assertIsNone(substitution)
+
+    def test_resolve_with_does_not_modify_parents(self):
+        clause1 = Clause(ClauseUnitTest._predicate_parser('p(x, f(x)), q(x)'))
+        clause2 = Clause(ClauseUnitTest._predicate_parser('~p(A, f(y))'))
+
+        resolvent, _ = clause1.resolve_with(clause2)
+
+        self.assertEqual(Clause(ClauseUnitTest._predicate_parser('q(A)')), resolvent)
+        self.assertEqual('[p(x,f(x)), q(x)]', str(clause1))
+        self.assertEqual('[~p(A,f(y))]', str(clause2))
+
+    def test_resolve_on(self):
+        clause1 = Clause(ClauseUnitTest._predicate_parser('p(x), q(x)'))
+        clause2 = Clause(ClauseUnitTest._predicate_parser('~p(A), ~q(B)'))
+
+        resolvent, substitution = clause1.resolve_on(clause2, Predicate.build('q(x)'), Predicate.build('~q(B)'))
+        self.assertEqual(Clause(ClauseUnitTest._predicate_parser('p(B), ~p(A)')), resolvent)
+        self.assertEqual('[B / x]', str(substitution))
+
+        resolvent, substitution = clause1.resolve_on(clause2, Predicate.build('p(x)'), Predicate.build('~q(B)'))
+        self.assertIsNone(resolvent)
+        self.assertIsNone(substitution)
+
+    def test_resolve_on_renaming_apart(self):
+        clause1 = Clause(ClauseUnitTest._predicate_parser('p(x), q(x, y1)'))
+        clause2 = Clause(ClauseUnitTest._predicate_parser('~p(f(x)), r(x, y)'))
+
+        resolvent, substitution = clause1.resolve_on(clause2, Predicate.build('p(x)'), Predicate.build('~p(f(x))'))
+        self.assertEqual(Clause(ClauseUnitTest._predicate_parser('q(f(x1), y1), r(x1, y)')), resolvent)
+        self.assertEqual('[f(x1) / x]', str(substitution))
+
+        # Resolution of a clause with itself works on renamed copy of the clause
+        clause = Clause(ClauseUnitTest._predicate_parser('~p(x), p(f(x))'))
+        resolvent, _ = clause.resolve_on(clause, Predicate.build('p(f(x))'), Predicate.build('~p(x)'))
+        self.assertEqual(Clause(ClauseUnitTest._predicate_parser('~p(x), p(f(f(x)))')), resolvent)
+
+    def test_resolve_on_shares_unchanged_parts(self):
+        clause1 = Clause(ClauseUnitTest._predicate_parser('p(x), q(g(A), h(x))'))
+        clause2 = Clause(ClauseUnitTest._predicate_parser('~p(B), r(k(C))'))
+
+        resolvent, _ = clause1.resolve_on(clause2, Predicate.build('p(x)'), Predicate.build('~p(B)'))
+        self.assertEqual(Clause(ClauseUnitTest._predicate_parser('q(g(A), h(B)), r(k(C))')), resolvent)
+        self.assertIs(clause2.predicates[1], resolvent.predicates[1])
+        self.assertIs(clause1.predicates[1].get_child()[0], resolvent.predicates[0].get_child()[0])
+
+    def test_resolve_on_deep_terms(self):
+        from .constant import Constant
+        from .function import Function
+
+        # Terms nested deeper than the recursion limit are instantiated without recursion
+        deep_term, deep_ground_term = Variable('x'), Constant('A')
+        for _ in range(3000):
+            deep_term, deep_ground_term = Function('f', [deep_term]), Function('f', [deep_ground_term])
+        clause1 = Clause([Predicate('p', [deep_term, Variable('y')]), Predicate('q', [deep_term])])
+        clause2 = Clause([Predicate('p', [deep_ground_term, Constant('B')], True), Predicate('r', [Variable('y')])])
+
+        resolvent, _ = clause1.resolve_on(clause2, clause1.predicates[0], clause2.predicates[0])
+        self.assertEqual(Clause([Predicate('q', [deep_ground_term]), Predicate('r', [Variable('z')])]), resolvent)
+        self.assertIs(deep_ground_term, resolvent.predicates[0].get_child()[0])
+        self.assertEqual(3000, resolvent.get_term_depth())
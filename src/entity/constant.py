@@ -1,5 +1,5 @@
 import unittest
-from typing import Optional, List
+from typing import Optional, Tuple
 
 from .first_order_predicate_logic_entity import FirstOrderPredicateLogicEntity
 
@@ -9,8 +9,13 @@ class Constant(FirstOrderPredicateLogicEntity):
     Constants are also atomic values whose names start with an upper case letter.
     """
 
-    def __init__(self, name: str):
-        self.name = name
+    __slots__ = ('name',)
+
+    def __new__(cls, name: str):
+        return cls._hash_cons((name,), name=name)
+
+    def __reduce__(self):
+        return Constant, (self.name,)
 
     def __repr__(self):
         return str(self)
@@ -18,14 +23,6 @@ class Constant(FirstOrderPredicateLogicEntity):
     def __str__(self):
         return self.name
 
-    def __eq__(self, other):
-        """
-        Check other instance to be Constant as well and their names are equal
-        """
-        if not isinstance(other, Constant):
-            return False
-        return self.get_name() == other.get_name()
-
     def __contains__(self, item):
         return self == item
 
@@ -35,15 +32,21 @@ class Constant(FirstOrderPredicateLogicEntity):
     def has_child(self) -> bool:
         return False
 
-    def get_child(self) -> Optional[List[FirstOrderPredicateLogicEntity]]:
+    def get_child(self) -> Optional[Tuple[FirstOrderPredicateLogicEntity, ...]]:
         return None
 
-    def find_variable_and_apply_substitution(self, substitute: 'FirstOrderPredicateLogicEntity',
-                                             variable: 'FirstOrderPredicateLogicEntity'):
+    def replace_variable(self, substitute: 'FirstOrderPredicateLogicEntity',
+                         variable: 'FirstOrderPredicateLogicEntity') -> 'FirstOrderPredicateLogicEntity':
         """
-        Constants cannot be iterated and their children cannot substituted so do nothing
+        Constants cannot be iterated and their children cannot substituted so return itself
         """
-        pass
+        return self
+
+    def instantiate(self, bindings: dict) -> 'FirstOrderPredicateLogicEntity':
+        """
+        Constants do not have any variable so return itself
+        """
+        return self
 
     def is_less_specific(self, other: 'FirstOrderPredicateLogicEntity') -> bool:
         """
@@ -127,3 +130,18 @@ class ConstantUnitTest(unittest.TestCase):
 
         constant2 = ''
         self.assertFalse(Constant.build(constant2))
+
+    def test_hash_consing(self):
+        constant1 = Constant.build('Abc')
+        constant2 = Constant.build('  Abc ')
+
+        self.assertIs(constant1, constant2)
+        self.assertEqual(hash(constant1), hash(constant2))
+        self.assertNotEqual(Constant.build('Abc'), Constant.build('Abc2'))
+
+    def test_immutability(self):
+        constant = Constant.build('Abc')
+
+        with self.assertRaises(AttributeError):
+            constant.name = 'Abc2'
+        self.assertEqual('Abc', constant.get_name())
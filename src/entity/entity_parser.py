@@ -0,0 +1,217 @@
+import re
+import unittest
+from typing import List
+
+from . import BLOCK_CLOSE_SYMBOL, BLOCK_OPEN_SYMBOL, ENTITY_SEPARATE_SYMBOL, NEGATION_SYMBOL
+from .constant import Constant
+from .first_order_predicate_logic_entity import FirstOrderPredicateLogicEntity
+from .function import Function
+from .predicate import Predicate
+from .variable import Variable
+
+
+class ParseError(ValueError):
+    """
+    Error raised when text cannot be parsed into entities, position is the index of the offending character
+    """
+
+    def __init__(self, message: str, text: str, position: int):
+        super().__init__('{0} at position {1} in {2!r}'.format(message, position, text))
+        self.text = text
+        self.position = position
+
+
+class EntityParser(object):
+    """
+    Entity Parser
+    =============
+    Parser of predicates and terms where text is split into tokens in a single pass and entities are built while
+    the tokens are consumed, so parsing time is linear in the length of the text
+
+    Tokens:
+        * Name: Alphanumeric characters, names starting with a lower case letter are variables, functions or
+          predicates and names starting with an upper case letter are constants
+        * Symbols: Negation '~', block open '(', entity separator ',' and block close ')'
+
+    Grammar:
+        * CLAUSE <- PREDICATE (',' PREDICATE)*
+        * PREDICATE <- '~'? NAME '(' TERM (',' TERM)* ')'
+        * TERM <- NAME '(' TERM (',' TERM)* ')' | NAME
+
+    Nested terms are handled with an explicit stack instead of recursion, so nesting depth is not bounded by the
+    recursion limit of the interpreter.
+    """
+    END = ''
+    _TOKEN_PATTERN = re.compile(r'\s*(?:([^\W_]+)|(\S))')
+
+    @staticmethod
+    def parse_clause(text: str) -> List[Predicate]:
+        """
+        Parse comma separated predicates
+        :param text: Predicates of a clause
+        :return: Predicates in the order of the text
+        :raise ParseError: If the text is not a valid clause
+        """
+        tokens = EntityParser._tokenize(text)
+        predicates, index = [], 0
+        while True:
+            predicate, index = EntityParser._parse_entity(text, tokens, index, is_predicate=True)
+            predicates.append(predicate)
+            token, position = tokens[index]
+            if token == EntityParser.END:
+                return predicates
+            if token != ENTITY_SEPARATE_SYMBOL:
+                raise ParseError("Expected '{0}' or end of clause".format(ENTITY_SEPARATE_SYMBOL), text, position)
+            index += 1
+
+    @staticmethod
+    def parse_predicate(text: str) -> Predicate:
+        """
+        Parse single predicate
+        :raise ParseError: If the text is not a valid predicate
+        """
+        tokens = EntityParser._tokenize(text)
+        predicate, index = EntityParser._parse_entity(text, tokens, 0, is_predicate=True)
+        EntityParser._expect_end(text, tokens, index)
+        return predicate
+
+    @staticmethod
+    def parse_term(text: str) -> FirstOrderPredicateLogicEntity:
+        """
+        Parse single term which is either function, variable or constant
+        :raise ParseError: If the text is not a valid term
+        """
+        tokens = EntityParser._tokenize(text)
+        term, index = EntityParser._parse_entity(text, tokens, 0, is_predicate=False)
+        EntityParser._expect_end(text, tokens, index)
+        return term
+
+    @staticmethod
+    def _tokenize(text: str) -> list:
+        """
+        Split text into names and symbols together with their positions, trailing END token marks the end of text
+        """
+        tokens = []
+        for match in EntityParser._TOKEN_PATTERN.finditer(text):
+            name, symbol = match.groups()
+            if name is not None:
+                tokens.append((name, match.start(1)))
+            elif symbol is not None:
+                if symbol not in (NEGATION_SYMBOL, BLOCK_OPEN_SYMBOL, ENTITY_SEPARATE_SYMBOL, BLOCK_CLOSE_SYMBOL):
+                    raise ParseError('Unexpected character {0!r}'.format(symbol), text, match.start(2))
+                tokens.append((symbol, match.start(2)))
+        tokens.append((EntityParser.END, len(text)))
+        return tokens
+
+    @staticmethod
+    def _expect_end(text: str, tokens: list, index: int):
+        token, position = tokens[index]
+        if token != EntityParser.END:
+            raise ParseError('Unexpected {0!r}'.format(token), text, position)
+
+    @staticmethod
+    def _expect_name(text: str, tokens: list, index: int) -> str:
+        token, position = tokens[index]
+        if not token.isalnum():
+            raise ParseError('Expected name' if token == EntityParser.END else
+                             'Expected name instead of {0!r}'.format(token), text, position)
+        return token
+
+    @staticmethod
+    def _parse_entity(text: str, tokens: list, index: int, is_predicate: bool):
+        """
+        Parse predicate or term starting from the given token
+        :return: Parsed entity and index of the token following it
+        """
+        is_negated = False
+        if is_predicate and tokens[index][0] == NEGATION_SYMBOL:
+            is_negated, index = True, index + 1
+
+        # Each frame keeps name of an entity whose children are being parsed and its children parsed so far
+        stack = []
+        while True:
+            name = EntityParser._expect_name(text, tokens, index)
+            position = tokens[index][1]
+            index += 1
+            if tokens[index][0] == BLOCK_OPEN_SYMBOL:
+                if not name[0].islower():
+                    raise ParseError('Name of {0} should start with lower case letter'.format(
+                        'predicate' if is_predicate and not stack else 'function'), text, position)
+                stack.append((name, []))
+                index += 1
+                continue
+            if is_predicate and not stack:
+                raise ParseError("Expected '{0}'".format(BLOCK_OPEN_SYMBOL), text, tokens[index][1])
+            if name[0].islower():
+                entity = Variable(name)
+            elif name[0].isupper():
+                entity = Constant(name)
+            else:
+                raise ParseError('Name should start with a letter', text, position)
+
+            # Close the entities whose children are completed
+            while stack:
+                stack[-1][1].append(entity)
+                token, position = tokens[index]
+                if token == ENTITY_SEPARATE_SYMBOL:
+                    index += 1
+                    break
+                if token != BLOCK_CLOSE_SYMBOL:
+                    raise ParseError("Expected '{0}' or '{1}'".format(ENTITY_SEPARATE_SYMBOL, BLOCK_CLOSE_SYMBOL),
+                                     text, position)
+                index += 1
+                name, children = stack.pop()
+                if is_predicate and not stack:
+                    return Predicate(name, children, is_negated), index
+                entity = Function(name, children)
+            else:
+                return entity, index
+
+
+class EntityParserUnitTest(unittest.TestCase):
+
+    def test_parse_clause(self):
+        texts = {'p(x)': '[p(x)]',
+                 ' ~ p ( x , f ( y, h, z) , C ,   g (  a  ) ) ': '[~p(x,f(y,h,z),C,g(a))]',
+                 'p(x), ~q(A, f(g(x, B)))': '[p(x), ~q(A,f(g(x,B)))]',
+                 'q(z),~p(z,f(B))': '[q(z), ~p(z,f(B))]',
+                 'p1(x1, Abc2)': '[p1(x1,Abc2)]'}
+        for text, expected in texts.items():
+            self.assertEqual(expected, str(EntityParser.parse_clause(text)))
+
+        predicate = EntityParser.parse_clause('p(x), ~q(A, f(g(x, B)))')[1]
+        self.assertIs(predicate, Predicate('q', [Constant('A'), Function('f', [
+            Function('g', [Variable('x'), Constant('B')])])], is_negated=True))
+
+    def test_parse_predicate_and_term(self):
+        predicate = EntityParser.parse_predicate('~p(x, f(A))')
+        self.assertTrue(predicate.is_negated)
+        self.assertEqual('~p(x,f(A))', str(predicate))
+
+        self.assertIs(Variable('x'), EntityParser.parse_term(' x '))
+        self.assertIs(Constant('A'), EntityParser.parse_term('A'))
+        self.assertIs(Function.build('f(x, g(A))'), EntityParser.parse_term('f(x,g(A))'))
+
+    def test_deep_nesting(self):
+        depth = 5000
+        text = 'p({0}x{1})'.format('f(' * depth, ')' * depth)
+        term = EntityParser.parse_clause(text)[0].get_child()[0]
+        for _ in range(depth):
+            self.assertEqual('f', term.get_name())
+            term = term.get_child()[0]
+        self.assertIs(Variable('x'), term)
+
+    def test_parse_errors(self):
+        errors = [('p(x', 3), ('p(x))', 4), ('p(x) q(y)', 5), ('P(x)', 0), ('p()', 2), ('p', 1), ('p(x,)', 4),
+                  ('p(F(x))', 2), ('p(x) ,', 6), ('', 0), ('p(x_y)', 3), ('~~p(x)', 1), ('p(x), , q(y)', 6),
+                  ('p(x)y', 4)]
+        for text, position in errors:
+            with self.assertRaises(ParseError) as context:
+                EntityParser.parse_clause(text)
+            self.assertEqual(position, context.exception.position, text)
+            self.assertIsInstance(context.exception, ValueError)
+
+        with self.assertRaises(ParseError):
+            EntityParser.parse_term('f(x) g')
+        with self.assertRaises(ParseError):
+            EntityParser.parse_predicate('x')
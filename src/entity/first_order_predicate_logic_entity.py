@@ -1,28 +1,156 @@
 from abc import ABCMeta, abstractmethod
-from typing import Optional, List
+from threading import Lock
+from typing import FrozenSet, Optional, Tuple
+from weakref import WeakValueDictionary
+
+# Hash-consing storage where structurally identical entities are kept as a single instance
+_TERM_BANK = WeakValueDictionary()
+_TERM_BANK_LOCK = Lock()
+_NO_VARIABLES = frozenset()
 
 
 class FirstOrderPredicateLogicEntity(metaclass=ABCMeta):
+    """
+    Base of the hash-consed and immutable entities where structurally identical entities are represented by the
+    same instance, so equality check is identity check and hash value is computed only once at construction
 
-    @abstractmethod
-    def __repr__(self):
+    Metadata of each entity, i.e. whether it is ground, its variables, depth and weight, is also computed once when
+    the entity is created from the metadata of its already hash-consed children, so none of them walks the entity.
+    """
+    __slots__ = ('_hash', '_variables', '_depth', '_weight', '__weakref__')
+    # Nesting depth added by the entity on top of its children, predicates are not terms so they add nothing
+    DEPTH_INCREMENT = 1
+
+    @classmethod
+    def _hash_cons(cls, key: tuple, **fields) -> 'FirstOrderPredicateLogicEntity':
+        """
+        Fetch the entity with the given structural key from the term bank or create and register it if it does not
+        exist yet
+        :param key: Structural key of the entity which is composed of already hash-consed parts
+        :param fields: Attribute values of the entity to be set in case of creation
+        :return: The unique entity instance for the given key
+        """
+        bank_key = (cls, key)
+        entity = _TERM_BANK.get(bank_key)
+        if entity is None:
+            with _TERM_BANK_LOCK:
+                # Check again since another thread may have registered the same entity meanwhile
+                entity = _TERM_BANK.get(bank_key)
+                if entity is None:
+                    entity = object.__new__(cls)
+                    for field, value in fields.items():
+                        object.__setattr__(entity, field, value)
+                    object.__setattr__(entity, '_hash', hash(bank_key))
+                    entity._init_metadata()
+                    _TERM_BANK[bank_key] = entity
+        return entity
+
+    def _init_metadata(self):
+        """
+        Compute the metadata of the entity from the metadata of its children
+        """
+        children = self.get_child() if self.has_child() else ()
+        variables = _NO_VARIABLES
+        for child in children:
+            # Variable sets are shared with the children as long as no new variable is added
+            if not child._variables <= variables:
+                variables = child._variables if variables <= child._variables else variables | child._variables
+        object.__setattr__(self, '_variables', variables)
+        object.__setattr__(self, '_depth', max((child._depth for child in children), default=0) +
+                           (self.DEPTH_INCREMENT if children else 0))
+        object.__setattr__(self, '_weight', 1 + sum(child._weight for child in children))
+
+    def is_ground(self) -> bool:
         """
-        Representation of the entity
+        Check whether the entity has no variable
         """
+        return not self._variables
 
-    @abstractmethod
-    def __str__(self):
+    def get_variables(self) -> FrozenSet['FirstOrderPredicateLogicEntity']:
         """
-        String representation of the entity
+        Variables which exist in the entity
         """
+        return self._variables
+
+    def get_depth(self) -> int:
+        """
+        Nesting depth of the entity where variables and constants have depth zero and each function application adds
+        one, depth of a predicate is the maximum depth of its arguments
+        """
+        return self._depth
+
+    def get_weight(self) -> int:
+        """
+        Number of symbols in the entity, i.e. each variable, constant, function and predicate counts as one
+        """
+        return self._weight
+
+    def _rebuild(self, bindings: dict, is_affected) -> 'FirstOrderPredicateLogicEntity':
+        """
+        Replace the bound variables of the entity bottom-up with an explicit stack, so deeply nested entities do not
+        exhaust the call stack, where unchanged subterms are shared and each distinct subterm is rebuilt only once
+        :param bindings: Dictionary of variables to their substitutes
+        :param is_affected: Function telling whether a subterm may contain a bound variable, others are kept as is
+        :return: Entity where the bound variables are replaced, the same entity if nothing is replaced
+        """
+        rebuilt = {}
+        stack = [self]
+        while stack:
+            entity = stack[-1]
+            if entity in rebuilt:
+                stack.pop()
+                continue
+            if not entity.has_child() or not is_affected(entity):
+                rebuilt[entity] = bindings.get(entity, entity)
+                stack.pop()
+                continue
+            pending_children = [child for child in entity.get_child() if child not in rebuilt]
+            if pending_children:
+                stack.extend(pending_children)
+                continue
+            stack.pop()
+            children = tuple(rebuilt[child] for child in entity.get_child())
+            if all(child is old_child for child, old_child in zip(children, entity.get_child())):
+                rebuilt[entity] = entity
+            else:
+                rebuilt[entity] = entity._with_children(children)
+        return rebuilt[self]
+
+    def _with_children(self, children: Tuple['FirstOrderPredicateLogicEntity', ...]) -> \
+            'FirstOrderPredicateLogicEntity':
+        """
+        Entity of the same kind and name with the given children, only entities having children support it
+        """
+        raise TypeError('{0} entities do not have children'.format(type(self).__name__))
+
+    def __setattr__(self, key, value):
+        raise AttributeError('{0} entities are immutable'.format(type(self).__name__))
+
+    def __delattr__(self, item):
+        raise AttributeError('{0} entities are immutable'.format(type(self).__name__))
+
+    def __hash__(self):
+        return self._hash
 
-    @abstractmethod
     def __eq__(self, other):
         """
-        Equality check operator for the entity
+        Equality check operator for the entity where structurally identical entities are the same instance
         :param other: Other object instance to check equality
         :return: Boolean value representing equality of this instance with respect to the given parameter
         """
+        return self is other
+
+    @abstractmethod
+    def __repr__(self):
+        """
+        Representation of the entity
+        """
+
+    @abstractmethod
+    def __str__(self):
+        """
+        String representation of the entity
+        """
 
     @abstractmethod
     def __contains__(self, item):
@@ -47,19 +175,28 @@ class FirstOrderPredicateLogicEntity(metaclass=ABCMeta):
         """
 
     @abstractmethod
-    def get_child(self) -> Optional[List['FirstOrderPredicateLogicEntity']]:
+    def get_child(self) -> Optional[Tuple['FirstOrderPredicateLogicEntity', ...]]:
         """
         Obtainment functionality of children of the current entity
         :return: Children of the current entity if they exist otherwise None will be returned
         """
 
     @abstractmethod
-    def find_variable_and_apply_substitution(self, substitute: 'FirstOrderPredicateLogicEntity',
-                                             variable: 'FirstOrderPredicateLogicEntity'):
+    def replace_variable(self, substitute: 'FirstOrderPredicateLogicEntity',
+                         variable: 'FirstOrderPredicateLogicEntity') -> 'FirstOrderPredicateLogicEntity':
         """
-        Method to apply substitution to an entity on their children while iterating
+        Method to apply substitution to an entity where the entity itself is not modified
         :param substitute: Substitution to be applied
         :param variable: Variable to be replaced
+        :return: Entity where the variable is replaced with the substitute, the same entity if nothing is replaced
+        """
+
+    @abstractmethod
+    def instantiate(self, bindings: dict) -> 'FirstOrderPredicateLogicEntity':
+        """
+        Method to replace all the bound variables of an entity at once where the entity itself is not modified
+        :param bindings: Dictionary of variables to their substitutes
+        :return: Entity where variables are replaced with their substitutes, the same entity if nothing is replaced
         """
 
     @abstractmethod
@@ -1,8 +1,9 @@
 import unittest
-from typing import List, Optional
+from typing import Optional, Sequence, Tuple
 
-from . import BLOCK_OPEN_SYMBOL, ENTITY_SEPARATE_SYMBOL, BLOCK_CLOSE_SYMBOL, children_entity_parser
+from . import BLOCK_OPEN_SYMBOL, ENTITY_SEPARATE_SYMBOL, BLOCK_CLOSE_SYMBOL
 from .first_order_predicate_logic_entity import FirstOrderPredicateLogicEntity
+from .variable import Variable
 
 
 class Function(FirstOrderPredicateLogicEntity):
@@ -11,9 +12,14 @@ class Function(FirstOrderPredicateLogicEntity):
     and take other functions as its children. Their names should start with lower case letter.
     """
 
-    def __init__(self, name: str, children: List[FirstOrderPredicateLogicEntity]):
-        self.name = name
-        self.children = children
+    __slots__ = ('name', 'children')
+
+    def __new__(cls, name: str, children: Sequence[FirstOrderPredicateLogicEntity]):
+        children = tuple(children)
+        return cls._hash_cons((name, children), name=name, children=children)
+
+    def __reduce__(self):
+        return Function, (self.name, self.children)
 
     def __repr__(self):
         return str(self)
@@ -22,17 +28,10 @@ class Function(FirstOrderPredicateLogicEntity):
         return self.name + BLOCK_OPEN_SYMBOL \
                + ENTITY_SEPARATE_SYMBOL.join(repr(child) for child in self.children) + BLOCK_CLOSE_SYMBOL
 
-    def __eq__(self, other):
-        """
-        Check name and children equality with other function
-        """
-        if not isinstance(other, Function):
-            return False
-        return self.get_name() == other.get_name() and len(self.get_child()) == len(other.get_child()) and all(
-            [child_tuple[0] == child_tuple[1] for child_tuple in zip(self.get_child(), other.get_child())])
-
     def __contains__(self, item):
-        return self == item or any([item in child for child in self.children])
+        if type(item) == Variable:
+            return item in self._variables
+        return self == item or (item.get_depth() < self._depth and any(item in child for child in self.children))
 
     def get_name(self) -> str:
         return self.name
@@ -40,19 +39,28 @@ class Function(FirstOrderPredicateLogicEntity):
     def has_child(self) -> bool:
         return True
 
-    def get_child(self) -> Optional[List[FirstOrderPredicateLogicEntity]]:
+    def get_child(self) -> Optional[Tuple[FirstOrderPredicateLogicEntity, ...]]:
         return self.children
 
-    def find_variable_and_apply_substitution(self, substitute: 'FirstOrderPredicateLogicEntity',
-                                             variable: 'FirstOrderPredicateLogicEntity'):
+    def replace_variable(self, substitute: 'FirstOrderPredicateLogicEntity',
+                         variable: 'FirstOrderPredicateLogicEntity') -> 'FirstOrderPredicateLogicEntity':
         """
-        Search and replace the variable with substitution in a recursive way
+        Search and replace the variable with substitution without recursion where unchanged children are shared
         """
-        for index, value in enumerate(self.children):
-            if value == variable:
-                self.children[index] = substitute
-            elif value.has_child:
-                value.find_variable_and_apply_substitution(substitute, variable)
+        if variable not in self._variables:
+            return self
+        return self._rebuild({variable: substitute}, lambda entity: variable in entity.get_variables())
+
+    def instantiate(self, bindings: dict) -> 'FirstOrderPredicateLogicEntity':
+        """
+        Replace bound variables among the children in a single pass where unchanged children are shared
+        """
+        if not self._variables:
+            return self
+        return self._rebuild(bindings, lambda entity: not entity.is_ground())
+
+    def _with_children(self, children: Tuple[FirstOrderPredicateLogicEntity, ...]) -> 'Function':
+        return Function(self.name, children)
 
     def is_less_specific(self, other: 'FirstOrderPredicateLogicEntity') -> bool:
         """
@@ -70,28 +78,13 @@ class Function(FirstOrderPredicateLogicEntity):
         Build method for Function entity where validity of parentheses are checked and internal entities should hold
         other entities among Function, Variable or Constant
         """
-        import src.entity.constant as c
-        import src.entity.variable as v
+        from .entity_parser import EntityParser, ParseError
+
         try:
-            # Remove whitespaces beginning and end of the string
-            value = value.strip()
-            # Find blocks
-            first_open_block_index = value.index(BLOCK_OPEN_SYMBOL)
-            last_close_block_index = value.rindex(BLOCK_CLOSE_SYMBOL)
-            function_name = value[:first_open_block_index].strip()
-            # It should be alphanumeric and must be start with lower case
-            if function_name.isalnum() and function_name[0].islower():
-                children = children_entity_parser(value[first_open_block_index + 1: last_close_block_index])
-                if children is None:
-                    return None
-                # Inside of a function there must be these entities only
-                built_children = [Function.build(child) or v.Variable.build(child) or c.Constant.build(child) for child
-                                  in children]
-                if all(built_children):
-                    return Function(function_name, built_children)
-            return None
-        except (ValueError, IndexError):
+            function = EntityParser.parse_term(value)
+        except ParseError:
             return None
+        return function if isinstance(function, Function) else None
 
 
 class FunctionUnitTest(unittest.TestCase):
@@ -237,3 +230,79 @@ class FunctionUnitTest(unittest.TestCase):
         function1 = Function.build('f(A, b)')
         function2 = Function.build('f(A, g(m))')
         self.assertTrue(function1.is_less_specific(function2))
+
+    def test_hash_consing(self):
+        function1 = Function.build('f(a,B,g(c))')
+        function2 = Function.build('  f( a , B , g ( c ) )')
+
+        self.assertIs(function1, function2)
+        self.assertEqual(hash(function1), hash(function2))
+        self.assertIs(Function.build('g(c)'), function1.get_child()[2])
+        self.assertIsNot(function1, Function.build('f(a,B,g(C))'))
+
+    def test_immutability(self):
+        import pickle
+
+        function = Function.build('f(a,B,g(c))')
+
+        with self.assertRaises(AttributeError):
+            function.name = 'g'
+        with self.assertRaises(TypeError):
+            function.get_child()[0] = function
+        self.assertIs(function, pickle.loads(pickle.dumps(function)))
+
+    def test_replace_variable(self):
+        import src.entity.constant as c
+        import src.entity.variable as v
+
+        function = Function.build('f(a,B,g(c))')
+
+        replaced = function.replace_variable(c.Constant.build('C'), v.Variable.build('c'))
+        self.assertIs(Function.build('f(a,B,g(C))'), replaced)
+        self.assertIs(function.get_child()[0], replaced.get_child()[0])
+        self.assertEqual('f(a,B,g(c))', str(function))
+
+        self.assertIs(function, function.replace_variable(c.Constant.build('C'), v.Variable.build('y')))
+
+    def test_instantiate(self):
+        import src.entity.constant as c
+        import src.entity.variable as v
+
+        function = Function.build('f(a,B,g(c),h(D))')
+
+        instantiated = function.instantiate({v.Variable.build('a'): v.Variable.build('c'),
+                                             v.Variable.build('c'): c.Constant.build('C')})
+        self.assertIs(Function.build('f(c,B,g(C),h(D))'), instantiated)
+        self.assertIs(function.get_child()[3], instantiated.get_child()[3])
+        self.assertIs(function, function.instantiate({v.Variable.build('y'): c.Constant.build('C')}))
+
+    def test_metadata(self):
+        import src.entity.variable as v
+
+        function = Function.build('f(a,B,g(h(a),c))')
+        self.assertFalse(function.is_ground())
+        self.assertEqual({v.Variable.build('a'), v.Variable.build('c')}, function.get_variables())
+        self.assertEqual(3, function.get_depth())
+        self.assertEqual(7, function.get_weight())
+        # Variable set is shared with the child which has all the variables
+        self.assertIs(function.get_child()[2].get_variables(), function.get_variables())
+
+        ground_function = Function.build('g(A,h(B))')
+        self.assertTrue(ground_function.is_ground())
+        self.assertEqual(frozenset(), ground_function.get_variables())
+        self.assertIs(ground_function, ground_function.instantiate({v.Variable.build('a'): ground_function}))
+        self.assertNotIn(v.Variable.build('a'), ground_function)
+        self.assertIn(Function.build('h(B)'), ground_function)
+
+    def test_deep_instantiation(self):
+        import src.entity.constant as c
+        import src.entity.variable as v
+
+        variable, constant = v.Variable.build('x'), c.Constant.build('A')
+        function, expected_function = variable, constant
+        for index in range(3000):
+            function = Function('f', [function, c.Constant('C{0}'.format(index % 2))])
+            expected_function = Function('f', [expected_function, c.Constant('C{0}'.format(index % 2))])
+        self.assertIs(expected_function, function.instantiate({variable: constant}))
+        self.assertIs(expected_function, function.replace_variable(constant, variable))
+        self.assertIs(function, function.replace_variable(constant, v.Variable.build('y')))
@@ -1,8 +1,9 @@
 import unittest
-from typing import List, Optional
+from typing import Optional, Sequence, Tuple
 
-from . import BLOCK_OPEN_SYMBOL, ENTITY_SEPARATE_SYMBOL, BLOCK_CLOSE_SYMBOL, NEGATION_SYMBOL, children_entity_parser
+from . import BLOCK_OPEN_SYMBOL, ENTITY_SEPARATE_SYMBOL, BLOCK_CLOSE_SYMBOL, NEGATION_SYMBOL
 from .first_order_predicate_logic_entity import FirstOrderPredicateLogicEntity
+from .variable import Variable
 
 
 class Predicate(FirstOrderPredicateLogicEntity):
@@ -12,10 +13,15 @@ class Predicate(FirstOrderPredicateLogicEntity):
     Their names should start with lower case letter.
     """
 
-    def __init__(self, name: str, children: List[FirstOrderPredicateLogicEntity], is_negated: bool = False):
-        self.name = name
-        self.children = children
-        self.is_negated = is_negated
+    __slots__ = ('name', 'children', 'is_negated')
+    DEPTH_INCREMENT = 0
+
+    def __new__(cls, name: str, children: Sequence[FirstOrderPredicateLogicEntity], is_negated: bool = False):
+        children = tuple(children)
+        return cls._hash_cons((name, children, is_negated), name=name, children=children, is_negated=is_negated)
+
+    def __reduce__(self):
+        return Predicate, (self.name, self.children, self.is_negated)
 
     def __repr__(self):
         return str(self)
@@ -25,18 +31,10 @@ class Predicate(FirstOrderPredicateLogicEntity):
                BLOCK_OPEN_SYMBOL + ENTITY_SEPARATE_SYMBOL.join(
             repr(child) for child in self.children) + BLOCK_CLOSE_SYMBOL
 
-    def __eq__(self, other):
-        """
-        Check name, negation and children equality with other predicate
-        """
-        if not isinstance(other, Predicate):
-            return False
-        return self.get_name() == other.get_name() and self.is_negated == other.is_negated and len(
-            self.get_child()) == len(other.get_child()) and all(
-            [child_tuple[0] == child_tuple[1] for child_tuple in zip(self.get_child(), other.get_child())])
-
     def __contains__(self, item):
-        return self == item or any([item in child for child in self.children])
+        if type(item) == Variable:
+            return item in self._variables
+        return self == item or (item.get_depth() <= self._depth and any(item in child for child in self.children))
 
     def get_name(self) -> str:
         return self.name
@@ -44,14 +42,28 @@ class Predicate(FirstOrderPredicateLogicEntity):
     def has_child(self) -> bool:
         return True
 
-    def get_child(self) -> Optional[List[FirstOrderPredicateLogicEntity]]:
+    def get_child(self) -> Optional[Tuple[FirstOrderPredicateLogicEntity, ...]]:
         return self.children
 
-    def find_variable_and_apply_substitution(self, substitute: 'FirstOrderPredicateLogicEntity',
-                                             variable: 'FirstOrderPredicateLogicEntity'):
+    def replace_variable(self, substitute: 'FirstOrderPredicateLogicEntity',
+                         variable: 'FirstOrderPredicateLogicEntity') -> 'FirstOrderPredicateLogicEntity':
+        """
+        Search and replace the variable with substitution among the children of the predicate
+        """
+        if variable not in self._variables:
+            return self
+        return self._rebuild({variable: substitute}, lambda entity: variable in entity.get_variables())
+
+    def instantiate(self, bindings: dict) -> 'FirstOrderPredicateLogicEntity':
         """
-        Predicates cannot be applied for substitution
+        Replace bound variables among the children in a single pass where unchanged children are shared
         """
+        if not self._variables:
+            return self
+        return self._rebuild(bindings, lambda entity: not entity.is_ground())
+
+    def _with_children(self, children: Tuple[FirstOrderPredicateLogicEntity, ...]) -> 'Predicate':
+        return Predicate(self.name, children, self.is_negated)
 
     def is_less_specific(self, other: 'FirstOrderPredicateLogicEntity'):
         """
@@ -69,31 +81,11 @@ class Predicate(FirstOrderPredicateLogicEntity):
         Build method for Predicate entity where validity of parentheses are checked and negation, internal entities
         should hold other entities among Function, Variable or Constant
         """
-        import src.entity.constant as c
-        import src.entity.function as f
-        import src.entity.variable as v
+        from .entity_parser import EntityParser, ParseError
 
         try:
-            # Remove whitespaces beginning and end of the string 
-            value = value.strip()
-            # Find blocks
-            first_open_block_index = value.index(BLOCK_OPEN_SYMBOL)
-            last_close_block_index = value.rindex(BLOCK_CLOSE_SYMBOL)
-            # Check negation
-            predicate_name_with_negation = value[:first_open_block_index].strip()
-            is_negated = predicate_name_with_negation[0] == NEGATION_SYMBOL
-            predicate_name = predicate_name_with_negation[1:] if is_negated else predicate_name_with_negation
-            predicate_name = predicate_name.strip()
-            # It should be alphanumeric and must be start with lower case
-            if predicate_name.isalnum() and predicate_name[0].islower():
-                children = children_entity_parser(value[first_open_block_index + 1: last_close_block_index])
-                # Inside of a predicate there must be these entities only
-                built_children = [f.Function.build(child) or v.Variable.build(child) or c.Constant.build(child) for
-                                  child in children]
-                if all(built_children):
-                    return Predicate(predicate_name, built_children, is_negated)
-            return None
-        except (ValueError, IndexError):
+            return EntityParser.parse_predicate(value)
+        except ParseError:
             return None
 
 
@@ -222,3 +214,15 @@ class PredicateUnitTest(unittest.TestCase):
         self.assertFalse(predicate1.is_less_specific(variable))
         self.assertFalse(predicate1.is_less_specific(predicate2))
 
+    def test_hash_consing(self):
+        import src.entity.function as f
+
+        predicate1 = Predicate.build('~p(a,B,g(c))')
+        predicate2 = Predicate.build(' ~ p( a , B , g ( c ) )')
+
+        self.assertIs(predicate1, predicate2)
+        self.assertEqual(hash(predicate1), hash(predicate2))
+        self.assertIsNot(predicate1, Predicate.build('p(a,B,g(c))'))
+        self.assertIs(f.Function.build('g(c)'), predicate1.get_child()[2])
+        # Predicates and functions with the same structure are different entities
+        self.assertNotEqual(f.Function.build('p(a,B,g(c))'), Predicate.build('p(a,B,g(c))'))
@@ -1,5 +1,5 @@
 import unittest
-from typing import Optional, List
+from typing import Optional, Tuple
 
 from .first_order_predicate_logic_entity import FirstOrderPredicateLogicEntity
 
@@ -9,8 +9,18 @@ class Variable(FirstOrderPredicateLogicEntity):
     Variables are atomic values whose names start with a lower case letter.
     """
 
-    def __init__(self, name: str):
-        self.name = name
+    __slots__ = ('name',)
+
+    def __new__(cls, name: str):
+        return cls._hash_cons((name,), name=name)
+
+    def __reduce__(self):
+        return Variable, (self.name,)
+
+    def _init_metadata(self):
+        object.__setattr__(self, '_variables', frozenset((self,)))
+        object.__setattr__(self, '_depth', 0)
+        object.__setattr__(self, '_weight', 1)
 
     def __repr__(self):
         return str(self)
@@ -18,14 +28,6 @@ class Variable(FirstOrderPredicateLogicEntity):
     def __str__(self):
         return self.name
 
-    def __eq__(self, other):
-        """
-        Check other instance to be Variable as well and their names are equal
-        """
-        if not isinstance(other, Variable):
-            return False
-        return self.get_name() == other.get_name()
-
     def __contains__(self, item):
         return self == item
 
@@ -35,15 +37,21 @@ class Variable(FirstOrderPredicateLogicEntity):
     def has_child(self) -> bool:
         return False
 
-    def get_child(self) -> Optional[List[FirstOrderPredicateLogicEntity]]:
+    def get_child(self) -> Optional[Tuple[FirstOrderPredicateLogicEntity, ...]]:
         return None
 
-    def find_variable_and_apply_substitution(self, substitute: 'FirstOrderPredicateLogicEntity',
-                                             variable: 'FirstOrderPredicateLogicEntity'):
+    def replace_variable(self, substitute: 'FirstOrderPredicateLogicEntity',
+                         variable: 'FirstOrderPredicateLogicEntity') -> 'FirstOrderPredicateLogicEntity':
         """
-        Variables cannot be iterated and their children cannot substituted so do nothing
+        Variables have no children, so the substitute is returned only if the variable itself is replaced
         """
-        pass
+        return substitute if self is variable else self
+
+    def instantiate(self, bindings: dict) -> 'FirstOrderPredicateLogicEntity':
+        """
+        Variable is replaced with its substitute if it is bound
+        """
+        return bindings.get(self, self)
 
     def is_less_specific(self, other: 'FirstOrderPredicateLogicEntity') -> bool:
         """
@@ -127,3 +135,36 @@ class VariableUnitTest(unittest.TestCase):
 
         variable2 = ''
         self.assertFalse(Variable.build(variable2))
+
+    def test_hash_consing(self):
+        variable1 = Variable.build('abc')
+        variable2 = Variable.build('  abc ')
+
+        self.assertIs(variable1, variable2)
+        self.assertEqual(hash(variable1), hash(variable2))
+        self.assertNotEqual(Variable.build('abc'), Variable.build('abc2'))
+
+    def test_immutability(self):
+        variable = Variable.build('abc')
+
+        with self.assertRaises(AttributeError):
+            variable.name = 'abc2'
+        self.assertEqual('abc', variable.get_name())
+
+    def test_replace_variable(self):
+        import src.entity.constant as c
+
+        variable = Variable.build('abc')
+        constant = c.Constant.build('A')
+
+        self.assertIs(constant, variable.replace_variable(constant, Variable.build('abc')))
+        self.assertIs(variable, variable.replace_variable(constant, Variable.build('abc2')))
+
+    def test_instantiate(self):
+        import src.entity.constant as c
+
+        variable = Variable.build('abc')
+        constant = c.Constant.build('A')
+
+        self.assertIs(constant, variable.instantiate({Variable.build('abc'): constant}))
+        self.assertIs(variable, variable.instantiate({Variable.build('abc2'): constant}))
@@ -1,68 +1,298 @@
+import json
 import unittest
-from typing import TextIO
+from typing import Iterator, List, TextIO, Tuple
 
-from .entity import children_entity_parser
+from . import ProblemState
+from .entity.entity_parser import EntityParser
+from .entity.predicate import Predicate
 
 
 class InputParser(object):
     KNOWLEDGE_BASE_LABEL = 'knowledge_base'
     NEGATED_THEOREM_PREDICATES_LABEL = 'negated_theorem_predicates'
+    LABELS = [KNOWLEDGE_BASE_LABEL, NEGATED_THEOREM_PREDICATES_LABEL]
+    FORMAT_ERROR_MESSAGE = 'Please check the given input again and fix the format issue!'
+    # Number of characters read from the file at once while streaming
+    READ_SIZE = 1 << 16
 
     @staticmethod
-    def parse(file: TextIO):
-        from src import Predicate
-        from src import ProblemState
+    def parse(file: TextIO) -> ProblemState:
+        """
+        Parse single problem given as JSON object of knowledge base and negated theorem clauses
+        :param file: File of the problem
+        :return: Problem state of the parsed clauses
+        :raise ValueError: If the input is not valid JSON or any of the clauses cannot be parsed
+        """
+        knowledge_base, negated_theorem_predicates = [], []
+        for label, predicates in InputParser.iterate_clauses(file):
+            if label == InputParser.KNOWLEDGE_BASE_LABEL:
+                knowledge_base.append(predicates)
+            else:
+                negated_theorem_predicates.append(predicates)
+        return ProblemState(knowledge_base, negated_theorem_predicates)
 
-        # Read file and get predicates
-        problem_input = eval(file.read())
+    @staticmethod
+    def parse_lines(file: TextIO) -> Iterator[ProblemState]:
+        """
+        Parse JSON-Lines file where each non-empty line is a problem, problems are parsed one at a time while the
+        generator is consumed
+        :param file: File of the problems
+        :return: Generator of problem states
+        :raise ValueError: If any of the lines is not a valid problem, line number is given in the message
+        """
+        from io import StringIO
 
-        try:
-            knowledge_base = problem_input[InputParser.KNOWLEDGE_BASE_LABEL]
-            negated_theorem_predicates = problem_input[InputParser.NEGATED_THEOREM_PREDICATES_LABEL]
-        except KeyError as e:
-            raise ValueError("Please check the given input again and fix the format issue!") from e
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                problem_state = InputParser.parse(StringIO(line))
+            except ValueError as e:
+                raise ValueError('Line {0}: {1}'.format(line_number, e)) from e
+            yield problem_state
 
-        knowledge_base = [[Predicate.build(predicate) for predicate in
-                           children_entity_parser(knowledge_base_predicate)] for
-                          knowledge_base_predicate in knowledge_base]
+    @staticmethod
+    def iterate_clauses(file: TextIO, read_size: int = READ_SIZE) -> Iterator[Tuple[str, List[Predicate]]]:
+        """
+        Stream the clauses of a problem given as JSON object where file is read in chunks and each clause is parsed
+        only when it is reached, so memory does not depend on the size of the file
+        Other keys of the object are skipped
+        :param file: File of the problem
+        :param read_size: Number of characters read from the file at once
+        :return: Generator of label of each clause and its predicates in the order of the file
+        :raise ValueError: If the input is not valid JSON, e.g. it has a trailing comma or a duplicate key, any of the
+        clauses cannot be parsed or any label is missing
+        """
+        stream = _JSONStream(file, read_size)
+        stream.expect('{')
+        keys = set()
+        # A comma is always followed by another member or element, so trailing commas are rejected
+        has_member = stream.peek() != '}'
+        while has_member:
+            stream.peek()
+            key_offset = stream.offset()
+            label = stream.value()
+            if not isinstance(label, str):
+                raise ValueError(InputParser.FORMAT_ERROR_MESSAGE)
+            if label in keys:
+                raise ValueError("Duplicate key '{0}' at position {1}".format(label, key_offset))
+            keys.add(label)
+            stream.expect(':')
 
-        negated_theorem_predicates = [[Predicate.build(predicate) for predicate in
-                                       children_entity_parser(negated_theorem_predicate)] for
-                                      negated_theorem_predicate in negated_theorem_predicates]
+            if label in InputParser.LABELS:
+                # Clauses are yielded one by one instead of decoding the whole list
+                stream.expect('[')
+                if stream.peek() != ']':
+                    yield label, InputParser.parse_clause(stream.value())
+                    while stream.accept(','):
+                        yield label, InputParser.parse_clause(stream.value())
+                stream.expect(']')
+            else:
+                stream.value()
+            has_member = stream.accept(',')
+        stream.expect('}')
 
-        if any(None in p for p in knowledge_base) or any(
-                None in p for p in negated_theorem_predicates):
-            raise ValueError("Please check the given input again and fix the format issue!")
+        if stream.peek() != '':
+            raise ValueError('Unexpected content after the problem at position {0}'.format(stream.offset()))
+        if any(label not in keys for label in InputParser.LABELS):
+            raise ValueError(InputParser.FORMAT_ERROR_MESSAGE)
 
-        return ProblemState(knowledge_base, negated_theorem_predicates)
+    @staticmethod
+    def parse_clause(clause: str) -> List[Predicate]:
+        """
+        Parse predicates of a single clause
+        :param clause: Clause as comma separated predicates
+        :return: Predicates of the clause
+        :raise ParseError: If the clause cannot be parsed, position of the error is given in the message
+        """
+        if not isinstance(clause, str):
+            raise ValueError(InputParser.FORMAT_ERROR_MESSAGE)
+        return EntityParser.parse_clause(clause)
+
+
+class _JSONStream(object):
+    """
+    Incremental reader of JSON text where structural symbols are consumed one by one and values are decoded with the
+    standard JSON decoder, only the unread part of the current chunk is kept in memory
+    """
+    WHITESPACES = ' \t\n\r'
+
+    def __init__(self, file: TextIO, read_size: int):
+        self.file = file
+        self.read_size = read_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        # Number of characters dropped from the beginning of the buffer
+        self.dropped = 0
+        self.is_exhausted = False
+
+    def offset(self) -> int:
+        return self.dropped + self.position
+
+    def peek(self) -> str:
+        """
+        Next non-whitespace character without consuming it, empty string at the end of the file
+        """
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in _JSONStream.WHITESPACES:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._read():
+                return ''
+
+    def accept(self, symbol: str) -> bool:
+        """
+        Consume the next non-whitespace character if it is the given symbol
+        """
+        if self.peek() == symbol:
+            self.position += 1
+            return True
+        return False
+
+    def expect(self, symbol: str):
+        if not self.accept(symbol):
+            raise ValueError("Expected '{0}' at position {1}".format(symbol, self.offset()))
+
+    def value(self):
+        """
+        Decode the next JSON value, more characters are read while the value is incomplete in the buffer
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as e:
+                if self._read():
+                    continue
+                raise ValueError('Invalid JSON value at position {0}'.format(self.offset())) from e
+            # Numbers and literals can be cut at the end of the buffer
+            if end == len(self.buffer) and self._read():
+                continue
+            self.position = end
+            return value
+
+    def _read(self) -> bool:
+        """
+        Append next chunk of the file into the buffer after dropping the consumed characters
+        :return: Boolean flag representing whether any character is read or not
+        """
+        if self.is_exhausted:
+            return False
+        chunk = self.file.read(self.read_size)
+        if not chunk:
+            self.is_exhausted = True
+            return False
+        self.dropped += self.position
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
 
 
 class InputParserUnitTest(unittest.TestCase):
 
-    def test_input_parser(self):
+    @staticmethod
+    def _file(problem_input):
         from io import StringIO
-        file = StringIO(str({
+        return StringIO(json.dumps(problem_input))
+
+    def test_input_parser(self):
+        file = InputParserUnitTest._file({
             "knowledge_base": ["~p(x),q(x)", "p(y),r(y)", "~q(z),s(z)", "~r(t),s(t)"],
             "negated_theorem_predicates": ["~s(A)"]
-        }))
+        })
         problem_state = InputParser.parse(file)
         self.assertEqual(5, len(problem_state.clauses))
+        self.assertEqual(4, len(problem_state.knowledge_base_clauses))
 
     def test_input_parser_with_invalid_input_1(self):
-        from io import StringIO
-        file = StringIO(str({
+        file = InputParserUnitTest._file({
             "negated_theorem_predicates": ["~s(A)"]
-        }))
+        })
 
         with self.assertRaises(ValueError):
             _ = InputParser.parse(file)
 
     def test_input_parser_with_invalid_input_2(self):
-        from io import StringIO
-        file = StringIO(str({
+        file = InputParserUnitTest._file({
             "knowledge_base": ["~p(x),q(x)", "p(y),r(y)", "~q(z),s(z)", "~r(t),s(t)"],
             "negated_theorem_predicates": ["p A (a,b,c,f(a))"]
-        }))
+        })
 
         with self.assertRaises(ValueError):
             _ = InputParser.parse(file)
+
+    def test_input_parser_with_invalid_input_3(self):
+        from io import StringIO
+
+        # Input is never evaluated as Python code
+        invalid_inputs = ["{'knowledge_base': ['p(x)'], 'negated_theorem_predicates': ['~p(A)']}",
+                          "__import__('os').getcwd()",
+                          '{"knowledge_base": ["p(x)"], "negated_theorem_predicates": ["~p(A)"]} []',
+                          '{"knowledge_base": ["p(x)"] "negated_theorem_predicates": ["~p(A)"]}',
+                          '{"knowledge_base": ["p(x)", 5], "negated_theorem_predicates": ["~p(A)"]}',
+                          '{"knowledge_base": ["p(x))"], "negated_theorem_predicates": ["~p(A)"]}',
+                          '{"knowledge_base": ["p(x)"], "negated_theorem_predicates": ["~p(A)"]']
+        for invalid_input in invalid_inputs:
+            with self.assertRaises(ValueError):
+                _ = InputParser.parse(StringIO(invalid_input))
+
+    def test_input_parser_with_invalid_json(self):
+        from io import StringIO
+
+        # Trailing commas and duplicate keys are rejected with the position of the error
+        invalid_inputs = [('{"knowledge_base": ["p(A)",], "negated_theorem_predicates": ["~p(A)"]}', 27),
+                          ('{"knowledge_base": ["p(A)"], "negated_theorem_predicates": ["~p(A)"],}', 69),
+                          ('{"knowledge_base": ["p(A)",], "negated_theorem_predicates": ["~p(A)",],}', 27),
+                          ('{"knowledge_base": [,], "negated_theorem_predicates": ["~p(A)"]}', 20),
+                          ('{"knowledge_base": ["p(A)"], "negated_theorem_predicates": ["~p(A)"], '
+                           '"comment": [1,]}', 81),
+                          ('{,}', 1)]
+        for invalid_input, position in invalid_inputs:
+            with self.assertRaisesRegex(ValueError, 'position {0}$'.format(position)):
+                _ = InputParser.parse(StringIO(invalid_input))
+
+        invalid_inputs = [('{"knowledge_base": ["p(A)"], "negated_theorem_predicates": ["~p(A)"], '
+                           '"knowledge_base": ["q(B)"]}', 70),
+                          ('{"knowledge_base": ["p(A)"], "comment": 1, "negated_theorem_predicates": ["~p(A)"], '
+                           '"comment": 2}', 84)]
+        for invalid_input, position in invalid_inputs:
+            with self.assertRaisesRegex(ValueError, "Duplicate key '[a-z_]+' at position {0}$".format(position)):
+                _ = InputParser.parse(StringIO(invalid_input))
+
+        problem_state = InputParser.parse(StringIO('{"knowledge_base": [], "negated_theorem_predicates": ["~p(A)"]}'))
+        self.assertEqual(1, len(problem_state.clauses))
+
+    def test_iterate_clauses(self):
+        from io import StringIO
+
+        text = json.dumps({"comment": {"nested": [1, 2.5, None]}, "negated_theorem_predicates": ["~s(A)"],
+                           "knowledge_base": ["p(x{0}),q(f(x{0}), B)".format(index) for index in range(100)]},
+                          indent=1)
+        file = StringIO(text)
+        clauses = InputParser.iterate_clauses(file, read_size=7)
+        label, predicates = next(clauses)
+        self.assertEqual(InputParser.NEGATED_THEOREM_PREDICATES_LABEL, label)
+        self.assertEqual('~s(A)', str(predicates[0]))
+        # Clauses are parsed while the file is being read
+        self.assertLess(file.tell(), len(text))
+
+        clauses = list(clauses)
+        self.assertEqual(100, len(clauses))
+        self.assertEqual((InputParser.KNOWLEDGE_BASE_LABEL, InputParser.parse_clause('p(x99),q(f(x99),B)')),
+                         clauses[-1])
+
+    def test_parse_lines(self):
+        from io import StringIO
+
+        lines = [json.dumps({"knowledge_base": ["p(x)"], "negated_theorem_predicates": ["~p(A)"]}), '',
+                 json.dumps({"knowledge_base": [], "negated_theorem_predicates": ["~p(A)", "q(B)"]})]
+        problem_states = list(InputParser.parse_lines(StringIO('\n'.join(lines))))
+        self.assertEqual([2, 2], [len(problem_state.clauses) for problem_state in problem_states])
+
+        problem_states = InputParser.parse_lines(StringIO('\n'.join(lines + ['{"knowledge_base": []}'])))
+        self.assertEqual(2, len(next(problem_states).clauses))
+        self.assertEqual(2, len(next(problem_states).clauses))
+        with self.assertRaisesRegex(ValueError, 'Line 4'):
+            next(problem_states)
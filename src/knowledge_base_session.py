@@ -0,0 +1,159 @@
+import unittest
+from typing import Iterable, Optional
+
+from . import ProblemState
+from .autonomous_theorem_prover import AutonomousTheoremProver
+from .clause_index import LiteralIndex, SubsumptionIndex
+from .entity.clause import Clause
+from .proof_result import ProofResult
+from .resource_limits import CancellationToken, ResourceLimits
+
+
+class KnowledgeBaseSession(object):
+    """
+    Knowledge Base Session
+    ======================
+    Knowledge base which is preprocessed once and queried with many negated theorems
+
+    Tautologies and subsumed clauses of the knowledge base are removed once while creating the session, and the
+    knowledge base can optionally be saturated up to the given resource limits, so that resolvents of knowledge base
+    clauses are not generated again for each query. Literal and subsumption indexes of the knowledge base are built
+    once and shared by the queries. Queries resolve with the indexed clauses and discard resolvents subsumed by them,
+    but they never insert, retire or re-bucket any clause, so the indexes are not changed by answering queries.
+
+    Each query is answered by the given clause search of :class:`AutonomousTheoremProver` with set of support strategy
+    where the clauses of the negated theorem form the set of support and the knowledge base clauses are the usable
+    clauses. Every resolvent has at least one parent descending from the negated theorem, so resolutions among the
+    knowledge base clauses are never repeated. Set of support is complete as long as the knowledge base is consistent,
+    and contradiction within the knowledge base is detected only while saturating it.
+    """
+
+    def __init__(self, knowledge_base: Iterable[Clause], saturate: bool = False,
+                 limits: Optional[ResourceLimits] = None):
+        """
+        :param knowledge_base: Clauses of the knowledge base
+        :param saturate: Whether the knowledge base is saturated beforehand
+        :param limits: Resource limits of the saturation, saturation is not limited if not given
+        """
+        # Remove tautologies and subsumptions
+        clauses = set(clause for clause in knowledge_base if not clause.has_tautology())
+        self.subsumption_index = SubsumptionIndex()
+        self.clauses, _ = AutonomousTheoremProver.apply_subsumption(clauses, self.subsumption_index)
+        # Whether EMPTY_CLAUSE is derived from the knowledge base, then every query is provable
+        self.is_inconsistent = False
+        # Result of the saturation if the knowledge base is saturated
+        self.saturation_result = None
+
+        if saturate:
+            self.saturation_result = self._saturate(limits)
+            self.is_inconsistent = self.saturation_result.is_proved()
+        self.literal_index = LiteralIndex(self.clauses)
+
+    def query(self, negated_theorem_clauses: Iterable[Clause], limits: Optional[ResourceLimits] = None,
+              cancellation_token: Optional[CancellationToken] = None) -> ProofResult:
+        """
+        Try to refute the negated theorem clauses with respect to the knowledge base
+        :param negated_theorem_clauses: Clauses of the negated theorem which form the set of support
+        :param limits: Resource limits of the query, query is not limited if not given
+        :param cancellation_token: Token to cancel the query from another thread
+        :return: Result of the query which is truthy only if EMPTY_CLAUSE is reached, resolution steps are given only
+        if the theorem is proved and the knowledge base is consistent
+        """
+        if self.is_inconsistent:
+            return ProofResult(ProofResult.PROVED)
+        problem_state = ProblemState([], [clause.predicates for clause in negated_theorem_clauses])
+        prover = AutonomousTheoremProver(problem_state, AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY, limits=limits,
+                                         cancellation_token=cancellation_token, set_of_support=True,
+                                         usable_index=self.literal_index,
+                                         usable_subsumption_index=self.subsumption_index)
+        return prover.prove()
+
+    def _saturate(self, limits: Optional[ResourceLimits]) -> ProofResult:
+        """
+        Saturate the knowledge base by the given clause search of all of its clauses, kept resolvents are added to the
+        knowledge base even if the saturation is stopped due to the resource limits since all of them are sound
+        consequences of the knowledge base
+        """
+        problem_state = ProblemState([clause.predicates for clause in self.clauses], [], is_preprocessed=True)
+        prover = AutonomousTheoremProver(problem_state, AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY, limits=limits)
+        result = prover.prove()
+        # Clauses known by the search include the subsumed resolvents, which are removed again
+        self.subsumption_index = SubsumptionIndex()
+        self.clauses, _ = AutonomousTheoremProver.apply_subsumption(prover.clauses, self.subsumption_index)
+        return result
+
+
+class KnowledgeBaseSessionUnitTest(unittest.TestCase):
+
+    @staticmethod
+    def _session(knowledge_base, **kwargs):
+        from .autonomous_theorem_prover import AutonomousTheoremProverUnitTest
+        problem_state = AutonomousTheoremProverUnitTest._problem_state(knowledge_base, [])
+        return KnowledgeBaseSession(problem_state.knowledge_base_clauses, **kwargs)
+
+    @staticmethod
+    def _query(session, negated_theorem_predicates, **kwargs):
+        from .autonomous_theorem_prover import AutonomousTheoremProverUnitTest
+        problem_state = AutonomousTheoremProverUnitTest._problem_state([], negated_theorem_predicates)
+        return session.query(problem_state.negated_theorem_clauses, **kwargs)
+
+    def test_query(self):
+        session = KnowledgeBaseSessionUnitTest._session(['~p(x),q(x)', 'p(y),r(y)', '~q(z),s(z)', '~r(t),s(t)'])
+        clauses = set(session.clauses)
+        feature_buckets = dict(session.subsumption_index.feature_buckets)
+        result = KnowledgeBaseSessionUnitTest._query(session, ['~s(A)'])
+        self.assertEqual(ProofResult(ProofResult.PROVED), result)
+        # Proof is given by the resolution steps of the query
+        self.assertEqual(Clause([]), result.steps[-1][2])
+        self.assertIn(result.steps[0][1], clauses)
+        self.assertEqual(ProofResult(ProofResult.SATURATED), KnowledgeBaseSessionUnitTest._query(session, ['~t(A)']))
+        self.assertEqual(ProofResult(ProofResult.PROVED),
+                         KnowledgeBaseSessionUnitTest._query(session, ['~q(B)', '~r(B)']))
+        self.assertEqual(ProofResult(ProofResult.SATURATED),
+                         KnowledgeBaseSessionUnitTest._query(session, ['~q(B)']))
+        # Queries do not change the knowledge base
+        self.assertEqual(clauses, session.clauses)
+        self.assertEqual(len(clauses), len(session.subsumption_index))
+        self.assertEqual(feature_buckets, session.subsumption_index.feature_buckets)
+
+    def test_preprocessing(self):
+        session = KnowledgeBaseSessionUnitTest._session(['p(x),~p(x)', 'q(A)', 'q(x)', 'q(A),r(B)'])
+        self.assertEqual(1, len(session.clauses))
+        self.assertIsNone(session.saturation_result)
+
+    def test_saturation(self):
+        from .clause_index import LiteralIndexUnitTest
+
+        knowledge_base = ['p(A)', '~p(x),q(x)', '~q(y),r(y)']
+        session = KnowledgeBaseSessionUnitTest._session(knowledge_base, saturate=True)
+        self.assertEqual(ProofResult(ProofResult.SATURATED), session.saturation_result)
+        self.assertFalse(session.is_inconsistent)
+        self.assertIn(LiteralIndexUnitTest._clause('r(A)'), session.clauses)
+        self.assertEqual(ProofResult(ProofResult.PROVED), KnowledgeBaseSessionUnitTest._query(session, ['~r(A)']))
+        self.assertEqual(ProofResult(ProofResult.SATURATED), KnowledgeBaseSessionUnitTest._query(session, ['~r(B)']))
+
+        session = KnowledgeBaseSessionUnitTest._session(knowledge_base + ['~r(A)'], saturate=True)
+        self.assertTrue(session.is_inconsistent)
+        self.assertEqual(ProofResult(ProofResult.PROVED), KnowledgeBaseSessionUnitTest._query(session, ['~s(A)']))
+
+    def test_resource_limits(self):
+        from .clause_index import LiteralIndexUnitTest
+
+        # Saturation of the knowledge base never ends without limits
+        session = KnowledgeBaseSessionUnitTest._session(['p(A)', '~p(x),p(f(x))'], saturate=True,
+                                                        limits=ResourceLimits(max_generated_clauses=5))
+        self.assertEqual(ProofResult(ProofResult.UNKNOWN, ResourceLimits.MAX_GENERATED_CLAUSES),
+                         session.saturation_result)
+        self.assertIn(LiteralIndexUnitTest._clause('p(f(f(A)))'), session.clauses)
+
+        self.assertEqual(ProofResult(ProofResult.PROVED),
+                         KnowledgeBaseSessionUnitTest._query(session, ['~p(f(f(f(A))))']))
+        self.assertEqual(ProofResult(ProofResult.UNKNOWN, ResourceLimits.MAX_TERM_DEPTH),
+                         KnowledgeBaseSessionUnitTest._query(session, ['~s(A)', 's(x),~s(f(x))'],
+                                                             limits=ResourceLimits(max_term_depth=8)))
+
+        cancellation_token = CancellationToken()
+        cancellation_token.cancel()
+        self.assertEqual(ProofResult(ProofResult.UNKNOWN, ResourceLimits.CANCELLED),
+                         KnowledgeBaseSessionUnitTest._query(session, ['~p(B)'],
+                                                             cancellation_token=cancellation_token))
@@ -0,0 +1,142 @@
+import unittest
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from .entity.clause import Clause
+from .entity.predicate import Predicate
+from .term_ordering import TermOrdering
+
+
+def select_nothing(clause: Clause) -> Sequence[Predicate]:
+    return ()
+
+
+def select_first_negative(clause: Clause) -> Sequence[Predicate]:
+    return next(((predicate,) for predicate in clause.predicates if predicate.is_negated), ())
+
+
+def select_heaviest_negative(clause: Clause) -> Sequence[Predicate]:
+    negative_predicates = [predicate for predicate in clause.predicates if predicate.is_negated]
+    if not negative_predicates:
+        return ()
+    return max(negative_predicates, key=lambda predicate: predicate.get_weight()),
+
+
+def select_all_negative(clause: Clause) -> Sequence[Predicate]:
+    return tuple(predicate for predicate in clause.predicates if predicate.is_negated)
+
+
+class LiteralSelector(object):
+    """
+    Literal Selector
+    ================
+    Eligible literals of the clauses for ordered resolution with selection, only eligible literals of two clauses are
+    resolved upon
+
+    * If the selection function selects any literal of a clause, they are the eligible literals of the clause
+    * Otherwise, literals which are not smaller than any other literal of the clause with respect to the term ordering
+      are eligible, i.e. maximal literals, all the literals are eligible if ordering is not given
+
+    Selection functions take a clause and return negative literals of it as in the ordered resolution calculus, although
+    resolution is not complete without factoring which the prover does not apply. Eligibility
+    is checked before unification, and eligible literals of each clause are computed once. They are kept only as long
+    as the clause is alive, so the selector does not keep the discarded clauses of the search.
+    """
+    NO_SELECTION = 'none'
+    FIRST_NEGATIVE = 'first-negative'
+    HEAVIEST_NEGATIVE = 'heaviest-negative'
+    ALL_NEGATIVE = 'all-negative'
+    SELECTIONS = {
+        NO_SELECTION: select_nothing,
+        FIRST_NEGATIVE: select_first_negative,
+        HEAVIEST_NEGATIVE: select_heaviest_negative,
+        ALL_NEGATIVE: select_all_negative,
+    }
+
+    def __init__(self, ordering: Optional[TermOrdering] = None,
+                 selection: Union[str, Callable[[Clause], Sequence[Predicate]]] = NO_SELECTION):
+        if isinstance(selection, str):
+            if selection not in LiteralSelector.SELECTIONS:
+                raise ValueError('Unknown literal selection: {0}'.format(selection))
+            selection = LiteralSelector.SELECTIONS[selection]
+        self.ordering = ordering
+        self.selection = selection
+        # Variants of a clause are equal, so literals are kept with the predicates of the clause they are computed for
+        self._eligible_literals = WeakKeyDictionary()  # type: WeakKeyDictionary[Clause, Tuple[List[Predicate], Tuple[Predicate, ...]]]
+
+    def eligible_literals(self, clause: Clause) -> Tuple[Predicate, ...]:
+        """
+        Literals of the clause which can be resolved upon
+        :param clause: Clause whose literals are checked
+        :return: Eligible literals in the order of the literals of the clause
+        :raise ValueError: If the selection function selects a positive literal or a literal of another clause
+        """
+        predicates, literals = self._eligible_literals.get(clause, (None, None))
+        if predicates is not clause.predicates:
+            selected = tuple(self.selection(clause))
+            if any(not predicate.is_negated or predicate not in clause.predicates for predicate in selected):
+                raise ValueError('Only negative literals of the clause can be selected: {0}'.format(selected))
+            literals = selected if selected else self.maximal_literals(clause)
+            self._eligible_literals[clause] = clause.predicates, literals
+        return literals
+
+    def maximal_literals(self, clause: Clause) -> Tuple[Predicate, ...]:
+        """
+        Literals of the clause which are not smaller than any other literal of the clause
+        """
+        if self.ordering is None:
+            return tuple(clause.predicates)
+        return tuple(predicate for predicate in clause.predicates if
+                     not any(self.ordering.compare_literals(other, predicate) == TermOrdering.GREATER
+                             for other in clause.predicates))
+
+
+class LiteralSelectorUnitTest(unittest.TestCase):
+
+    def test_maximal_literals(self):
+        from .clause_index import LiteralIndexUnitTest
+        from .term_ordering import KnuthBendixOrdering
+
+        clause = LiteralIndexUnitTest._clause('~p(x), q(f(x)), r(y)')
+        self.assertEqual(tuple(clause.predicates), LiteralSelector().eligible_literals(clause))
+        # q(f(x)) is heavier than ~p(x), but r(y) is incomparable since it has another variable
+        self.assertEqual(('q(f(x))', 'r(y)'),
+                         tuple(map(str, LiteralSelector(KnuthBendixOrdering()).eligible_literals(clause))))
+
+    def test_selection(self):
+        from .clause_index import LiteralIndexUnitTest
+        from .term_ordering import KnuthBendixOrdering
+
+        clause = LiteralIndexUnitTest._clause('~p(x), ~q(f(x)), r(x)')
+        ordering = KnuthBendixOrdering()
+        self.assertEqual(('~p(x)',), tuple(map(str, LiteralSelector(ordering, LiteralSelector.FIRST_NEGATIVE)
+                                               .eligible_literals(clause))))
+        self.assertEqual(('~q(f(x))',), tuple(map(str, LiteralSelector(ordering, LiteralSelector.HEAVIEST_NEGATIVE)
+                                                  .eligible_literals(clause))))
+        self.assertEqual(2, len(LiteralSelector(ordering, LiteralSelector.ALL_NEGATIVE).eligible_literals(clause)))
+        # Maximal literals are eligible if nothing is selected
+        positive_clause = LiteralIndexUnitTest._clause('p(x), q(f(x))')
+        self.assertEqual(('q(f(x))',), tuple(map(str, LiteralSelector(ordering, LiteralSelector.FIRST_NEGATIVE)
+                                                 .eligible_literals(positive_clause))))
+
+        with self.assertRaises(ValueError):
+            _ = LiteralSelector(ordering, 'last-negative')
+        with self.assertRaises(ValueError):
+            LiteralSelector(ordering, lambda c: c.predicates[-1:]).eligible_literals(clause)
+
+    def test_eligible_literals_cache(self):
+        import gc
+        from .clause_index import LiteralIndexUnitTest
+        from .term_ordering import KnuthBendixOrdering
+
+        selector = LiteralSelector(KnuthBendixOrdering())
+        clause = LiteralIndexUnitTest._clause('~p(x), q(f(x))')
+        self.assertIs(selector.eligible_literals(clause), selector.eligible_literals(clause))
+        # Variant of the clause gets its own literals
+        variant = LiteralIndexUnitTest._clause('~p(y), q(f(y))')
+        self.assertEqual(clause, variant)
+        self.assertEqual(('q(f(y))',), tuple(map(str, selector.eligible_literals(variant))))
+        # Literals of the discarded clauses are not kept
+        del clause, variant
+        gc.collect()
+        self.assertEqual(0, len(selector._eligible_literals))
@@ -1,5 +1,5 @@
 import unittest
-from typing import Union, List, Tuple, Optional
+from typing import Union, List, Tuple, Optional, Sequence
 
 from .entity.first_order_predicate_logic_entity import FirstOrderPredicateLogicEntity
 from .entity.constant import Constant
@@ -36,13 +36,9 @@ class Substitution(object):
         return self.substitute == other.substitute and self.variable == other.variable
 
     def apply_substitution(self, applied_substitution: 'Substitution'):
-        # If the current substitute can be replaced then immediately replace it
-        if self.substitute == applied_substitution.variable:
-            self.substitute = applied_substitution.substitute
-        else:
-            # Otherwise, try to replace its children
-            self.substitute.find_variable_and_apply_substitution(applied_substitution.substitute,
-                                                                 applied_substitution.variable)
+        # Entities are immutable, so substitute is replaced with its substitution applied version
+        self.substitute = self.substitute.replace_variable(applied_substitution.substitute,
+                                                           applied_substitution.variable)
 
 
 class SubstitutionUnitTest(unittest.TestCase):
@@ -86,13 +82,13 @@ class MostGeneralUnifier(object):
         :param expression2: The second expression as a first order predicate logic entity
         :return: Composition result of expression in case of SUCCESS otherwise None in case of FAILURE
         """
-        type_expression1 = type(expression1)
-        type_expression2 = type(expression2)
+        is_composite_expression1 = isinstance(expression1, (list, tuple))
+        is_composite_expression2 = isinstance(expression2, (list, tuple))
 
         # If both of them are atomic entities
-        if type_expression1 != list and type_expression2 != list:
+        if not is_composite_expression1 and not is_composite_expression2:
             return MostGeneralUnifier._unify_atomic_entity(expression1, expression2)
-        elif type_expression1 == list and type_expression2 == list:
+        elif is_composite_expression1 and is_composite_expression2:
             # They have to be of the same length
             if len(expression1) != len(expression2):
                 return False, None
@@ -156,12 +152,13 @@ class MostGeneralUnifier(object):
             if expression1 == expression2:
                 # If they are the same, then return EMPTY_SUBSTITUTION
                 return True, []
+            # Occurs check, which never fails for ground expressions since they have no variable
             if type_expression1 == Variable:
-                if expression1 in expression2:
+                if expression1 in expression2.get_variables():
                     return False, None
                 return True, [Substitution(expression2, expression1)]
             else:
-                if expression2 in expression1:
+                if expression2 in expression1.get_variables():
                     return False, None
                 return True, [Substitution(expression1, expression2)]
         elif type_expression1 != type_expression2:
@@ -183,18 +180,18 @@ class MostGeneralUnifier(object):
                 raise ValueError('Unknown type for unification.')
 
     @staticmethod
-    def apply_substitution(elements: List[FirstOrderPredicateLogicEntity], substitutions: List[Substitution]) -> \
+    def apply_substitution(elements: Sequence[FirstOrderPredicateLogicEntity], substitutions: List[Substitution]) -> \
             List[FirstOrderPredicateLogicEntity]:
         """
         Apply all the substitutions to the given list of entities
+        Entities are immutable, so a new list of substitution applied entities is returned
         """
-        for index, element in enumerate(elements):
+        applied_elements = []
+        for element in elements:
             for substitution in substitutions:
-                if element == substitution.variable:
-                    elements[index] = substitution.substitute
-                else:
-                    element.find_variable_and_apply_substitution(substitution.substitute, substitution.variable)
-        return elements
+                element = element.replace_variable(substitution.substitute, substitution.variable)
+            applied_elements.append(element)
+        return applied_elements
 
     @staticmethod
     def apply_composition_to_substitution(first_substitutions: List[Substitution],
@@ -322,9 +319,11 @@ class MGUUnitTest(unittest.TestCase):
             Substitution(Function.build('k(f(h(w)))'), Variable.build('z')),
             Substitution(Function.build('h(w)'), Variable.build('x'))
         ]
-        expected = Function.build('p(f(h(w)), k(f(h(w))), g(k(f(h(w))), h(w)))').get_child()
+        expected = list(Function.build('p(f(h(w)), k(f(h(w))), g(k(f(h(w))), h(w)))').get_child())
         self.assertEqual(expected, MostGeneralUnifier.apply_substitution(expression1, substitutions))
         self.assertEqual(expected, MostGeneralUnifier.apply_substitution(expression2, substitutions))
+        # Given entities are not modified while applying substitutions
+        self.assertEqual(Function.build('p(f(x), y, g(y ,x))').get_child(), expression1)
 
     def test_composition_of_substitution_1(self):
         empty_substitution = []
@@ -410,3 +409,310 @@ class MGUUnitTest(unittest.TestCase):
         output = MostGeneralUnifier.apply_composition_to_substitution(output, third_substitution)
         output = MostGeneralUnifier.apply_composition_to_substitution(output, fourth_substitution)
         self.assertEqual(expected, output)
+
+
+class TriangularUnifier(object):
+    """
+    Unification with Triangular Substitution
+    ========================================
+    Non-destructive alternative of :class:`MostGeneralUnifier` with the same `(bool, substitutions)` contract where
+
+    * Bindings: Variables are bound in a dictionary and a bound value may contain other bound variables, so that
+    bindings are never composed while unifying (triangular substitution). Terms are dereferenced through bindings
+    whenever they are visited.
+    * Work stack: Pairs of terms waiting to be unified are kept in an explicit stack instead of recursion and list
+    slicing.
+    * Trail: Bound variables are recorded in order, so bindings can be undone up to a mark in case of failure.
+
+    Given entities are never modified, and substitutions are resolved into their final form only once at the end.
+    """
+
+    @staticmethod
+    def unify(expression1: Union[FirstOrderPredicateLogicEntity, Sequence[FirstOrderPredicateLogicEntity]],
+              expression2: Union[FirstOrderPredicateLogicEntity, Sequence[FirstOrderPredicateLogicEntity]]) -> \
+            Tuple[bool, Optional[List[Substitution]]]:
+        """
+        Unify two expressions or two lists of expressions
+        :param expression1: The first expression as a first order predicate logic entity or list of them
+        :param expression2: The second expression as a first order predicate logic entity or list of them
+        :return: Substitution list of the most general unifier in case of SUCCESS otherwise None in case of FAILURE
+        """
+        bindings, trail = {}, []
+        if not TriangularUnifier.unify_with_bindings(expression1, expression2, bindings, trail):
+            return False, None
+        return True, TriangularUnifier.to_substitutions(bindings, trail)
+
+    @staticmethod
+    def unify_with_bindings(expression1: Union[FirstOrderPredicateLogicEntity, Sequence[FirstOrderPredicateLogicEntity]],
+                            expression2: Union[FirstOrderPredicateLogicEntity, Sequence[FirstOrderPredicateLogicEntity]],
+                            bindings: dict, trail: list) -> bool:
+        """
+        Extend the given bindings so that both expressions become the same, bindings made by this call are undone in
+        case of failure so the given bindings stay as they were
+        :param expression1: The first expression as a first order predicate logic entity or list of them
+        :param expression2: The second expression as a first order predicate logic entity or list of them
+        :param bindings: Dictionary of variables to their bound values
+        :param trail: Bound variables in order of binding
+        :return: Boolean flag representing whether unification succeeded or not
+        """
+        is_composite_expression1 = isinstance(expression1, (list, tuple))
+        is_composite_expression2 = isinstance(expression2, (list, tuple))
+        if is_composite_expression1 != is_composite_expression2:
+            return False
+        if is_composite_expression1:
+            if len(expression1) != len(expression2):
+                return False
+            work_stack = list(zip(reversed(expression1), reversed(expression2)))
+        else:
+            work_stack = [(expression1, expression2)]
+
+        mark = len(trail)
+        while work_stack:
+            term1, term2 = work_stack.pop()
+            term1 = TriangularUnifier.dereference(term1, bindings)
+            term2 = TriangularUnifier.dereference(term2, bindings)
+            if term1 is term2:
+                continue
+
+            type_term1, type_term2 = type(term1), type(term2)
+            if type_term1 == Variable or type_term2 == Variable:
+                variable, value = (term1, term2) if type_term1 == Variable else (term2, term1)
+                if TriangularUnifier._occurs(variable, value, bindings):
+                    TriangularUnifier.undo(bindings, trail, mark)
+                    return False
+                bindings[variable] = value
+                trail.append(variable)
+            elif type_term1 == Function and type_term2 == Function:
+                children1, children2 = term1.get_child(), term2.get_child()
+                if term1.get_name() != term2.get_name() or len(children1) != len(children2):
+                    TriangularUnifier.undo(bindings, trail, mark)
+                    return False
+                work_stack.extend(zip(reversed(children1), reversed(children2)))
+            elif type_term1 == Constant or type_term2 == Constant or type_term1 == Function or type_term2 == Function:
+                # Different constants or constant - function pairs cannot be unified
+                TriangularUnifier.undo(bindings, trail, mark)
+                return False
+            else:
+                TriangularUnifier.undo(bindings, trail, mark)
+                raise ValueError('Unknown type for unification.')
+        return True
+
+    @staticmethod
+    def match_with_bindings(pattern: Sequence[FirstOrderPredicateLogicEntity],
+                            instance: Sequence[FirstOrderPredicateLogicEntity], bindings: dict, trail: list) -> bool:
+        """
+        One-way matching which extends the given bindings of the variables of the pattern so that the pattern becomes
+        the same as the instance, variables of the instance are never bound, i.e. they are treated as constants.
+        Bindings made by this call are undone in case of failure so the given bindings stay as they were
+        :param pattern: List of entities whose variables are bound
+        :param instance: List of entities which the pattern is matched onto
+        :param bindings: Dictionary of variables of the pattern to the subterms of the instance
+        :param trail: Bound variables in order of binding
+        :return: Boolean flag representing whether matching succeeded or not
+        """
+        if len(pattern) != len(instance):
+            return False
+        work_stack = list(zip(reversed(pattern), reversed(instance)))
+        mark = len(trail)
+        while work_stack:
+            term1, term2 = work_stack.pop()
+            type_term1 = type(term1)
+            if term1 is term2 and term1.is_ground():
+                # Ground subterms are hash-consed, so they match only themselves without being visited
+                continue
+            if type_term1 == Variable:
+                value = bindings.get(term1)
+                if value is None:
+                    bindings[term1] = term2
+                    trail.append(term1)
+                    continue
+                if value is term2:
+                    continue
+            elif type_term1 == Function and type(term2) == Function and not term1.is_ground() and \
+                    term1.get_name() == term2.get_name() and len(term1.get_child()) == len(term2.get_child()) and \
+                    term1.get_depth() <= term2.get_depth():
+                work_stack.extend(zip(reversed(term1.get_child()), reversed(term2.get_child())))
+                continue
+            TriangularUnifier.undo(bindings, trail, mark)
+            return False
+        return True
+
+    @staticmethod
+    def dereference(term: FirstOrderPredicateLogicEntity, bindings: dict) -> FirstOrderPredicateLogicEntity:
+        """
+        Follow the bindings of a variable until an unbound variable or a non variable term is reached
+        """
+        while type(term) == Variable:
+            value = bindings.get(term)
+            if value is None:
+                break
+            term = value
+        return term
+
+    @staticmethod
+    def undo(bindings: dict, trail: list, mark: int):
+        """
+        Remove the bindings recorded after the given mark of the trail
+        """
+        while len(trail) > mark:
+            del bindings[trail.pop()]
+
+    @staticmethod
+    def resolve(term: FirstOrderPredicateLogicEntity, bindings: dict, cache: Optional[dict] = None) -> \
+            FirstOrderPredicateLogicEntity:
+        """
+        Apply the bindings to the term completely where unchanged subterms are shared with the given term
+        Terms are visited in post order with an explicit stack, and resolved terms are kept in the given cache
+        """
+        if cache is None:
+            cache = {}
+        stack = [term]
+        while stack:
+            current = stack[-1]
+            if current in cache:
+                stack.pop()
+            elif type(current) != Variable and bindings.keys().isdisjoint(current.get_variables()):
+                # Terms without bound variables, e.g. ground terms, stay the same
+                cache[current] = current
+                stack.pop()
+            elif type(current) == Variable:
+                value = bindings.get(current)
+                if value is None:
+                    cache[current] = current
+                    stack.pop()
+                elif value in cache:
+                    cache[current] = cache[value]
+                    stack.pop()
+                else:
+                    stack.append(value)
+            elif current.has_child():
+                unresolved_children = [child for child in current.get_child() if child not in cache]
+                if unresolved_children:
+                    stack.extend(unresolved_children)
+                    continue
+                children = tuple(cache[child] for child in current.get_child())
+                if all(child is old_child for child, old_child in zip(children, current.get_child())):
+                    cache[current] = current
+                else:
+                    cache[current] = Function(current.get_name(), children)
+                stack.pop()
+            else:
+                cache[current] = current
+                stack.pop()
+        return cache[term]
+
+    @staticmethod
+    def to_substitutions(bindings: dict, trail: list) -> List[Substitution]:
+        """
+        Convert triangular bindings into idempotent substitution list in order of binding
+        """
+        cache = {}
+        return [Substitution(TriangularUnifier.resolve(variable, bindings, cache), variable) for variable in trail]
+
+    @staticmethod
+    def _occurs(variable: Variable, term: FirstOrderPredicateLogicEntity, bindings: dict) -> bool:
+        """
+        Occurs check of the variable in the term where bound variables in the term are dereferenced
+        Terms are never walked, only the cached variable sets of the term and the values of its bound variables are
+        checked, so ground terms and terms without bound variables are checked at once
+        """
+        stack, visited = [term], set()
+        while stack:
+            variables = stack.pop().get_variables()
+            if variable in variables:
+                return True
+            for bound_variable in variables:
+                value = bindings.get(bound_variable)
+                if value is not None and bound_variable not in visited:
+                    visited.add(bound_variable)
+                    stack.append(value)
+        return False
+
+
+class TriangularUnifierUnitTest(unittest.TestCase):
+
+    def test_unification_readme_example(self):
+        expression1 = Function.build('p(f(h(w)), y, g(k(f(h(w))), x))')
+        expression2 = Function.build('p(u, k(f(h(w))), g(z, h(w)))')
+
+        result, unification_substitution = TriangularUnifier.unify(expression1, expression2)
+        expected_substitutions = [
+            Substitution(Function.build('f(h(w))'), Variable.build('u')),
+            Substitution(Function.build('k(f(h(w)))'), Variable.build('y')),
+            Substitution(Function.build('k(f(h(w)))'), Variable.build('z')),
+            Substitution(Function.build('h(w)'), Variable.build('x'))
+        ]
+
+        self.assertTrue(result)
+        self.assertEqual(expected_substitutions, unification_substitution)
+        # Given entities are not modified
+        self.assertEqual('p(f(h(w)),y,g(k(f(h(w))),x))', str(expression1))
+        self.assertEqual('p(u,k(f(h(w))),g(z,h(w)))', str(expression2))
+
+    def test_same_result_with_most_general_unifier(self):
+        pairs = [
+            ('p(f(x), y, g(y ,x))', 'p(u, k(u), g(z, h(w)))'),
+            ('p(f(x), y, g(y ,x), m(z))', 'p(u, k(u), g(z, h(w)))'),
+            ('p(f(x), Y, g(y ,x))', 'p(u, k(x), g(z, h(w)))'),
+            ('f(ABC, g(h(x, y)), u(k, l))', 'f(ABC, g(h(x, y)), u(k, l))'),
+            ('f(ABC, g(h(x, y)), u(k, l))', 'f(ABC, g(x), u(k, l))'),
+            ('f(ABC, g(x), u(k, l))', 'f(ABC, g(h(x, y)), u(k, l))'),
+            ('f(x, y, z)', 'f(y, z, A)'),
+            ('f(x, g(x))', 'f(g(y), y)'),
+        ]
+        for first, second in pairs:
+            expression1, expression2 = Function.build(first).get_child(), Function.build(second).get_child()
+            self.assertEqual(MostGeneralUnifier.unify(expression1, expression2),
+                             TriangularUnifier.unify(expression1, expression2))
+
+    def test_unification_failures(self):
+        self.assertEqual((False, None), TriangularUnifier.unify(Function.build('f(ABC, x)'),
+                                                                Function.build('g(ABC, x)')))
+        self.assertEqual((False, None), TriangularUnifier.unify(Function.build('f(x)').get_child(),
+                                                                Variable.build('x')))
+        self.assertEqual((False, None), TriangularUnifier.unify(Constant.build('A'), Function.build('f(x)')))
+
+        from .entity.predicate import Predicate
+        with self.assertRaises(ValueError):
+            _, _ = TriangularUnifier.unify(Predicate.build('f(ABC)'), Predicate.build('g(ABC)'))
+
+    def test_undo_on_failure(self):
+        bindings, trail = {}, []
+        self.assertTrue(TriangularUnifier.unify_with_bindings(Variable.build('x'), Constant.build('A'), bindings,
+                                                              trail))
+
+        # Binding of y is undone since x is already bound to A
+        expression1 = Function.build('f(y, x)').get_child()
+        expression2 = Function.build('f(B, B)').get_child()
+        self.assertFalse(TriangularUnifier.unify_with_bindings(expression1, expression2, bindings, trail))
+        self.assertEqual({Variable.build('x'): Constant.build('A')}, bindings)
+        self.assertEqual([Variable.build('x')], trail)
+
+    def test_match_with_bindings(self):
+        bindings, trail = {}, []
+        self.assertTrue(TriangularUnifier.match_with_bindings(Function.build('f(x, g(y), x)').get_child(),
+                                                              Function.build('f(A, g(x), A)').get_child(),
+                                                              bindings, trail))
+        self.assertEqual({Variable.build('x'): Constant.build('A'), Variable.build('y'): Variable.build('x')},
+                         bindings)
+
+        # Bindings are kept consistent and variables of the instance are never bound
+        for pattern, instance in [('f(x, x)', 'f(A, B)'), ('f(A)', 'f(x)'), ('f(g(x))', 'f(y)'), ('f(g(x))', 'f(h(x))'),
+                                  ('f(x, y)', 'f(y, A, B)')]:
+            bindings, trail = {}, []
+            self.assertFalse(TriangularUnifier.match_with_bindings(Function.build(pattern).get_child(),
+                                                                   Function.build(instance).get_child(),
+                                                                   bindings, trail))
+            self.assertEqual(({}, []), (bindings, trail))
+
+    def test_deep_nesting(self):
+        depth = 2000
+        nested = Variable.build('w')
+        for _ in range(depth):
+            nested = Function('f', [nested])
+
+        result, substitutions = TriangularUnifier.unify([Variable.build('u'), Variable.build('u')],
+                                                        [nested, Variable.build('v')])
+        self.assertTrue(result)
+        self.assertEqual([Substitution(nested, Variable.build('u')), Substitution(nested, Variable.build('v'))],
+                         substitutions)
@@ -0,0 +1,112 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from .entity import children_entity_parser
+from .entity.clause import Clause
+from .entity.predicate import Predicate
+from .most_general_unifier import Substitution
+from .search_statistics import SearchStatistics
+
+# Resolution task composed of the first clause, its literal, the second clause and its literal
+ResolutionTask = Tuple[Clause, Predicate, Clause, Predicate]
+ResolutionResult = Tuple[Optional[Clause], Optional[List[Substitution]]]
+
+
+def resolve_tasks(tasks: List[ResolutionTask]) -> List[ResolutionResult]:
+    """
+    Resolve each task on its literals, this is the unit of work sent to the worker processes
+    :param tasks: Resolution tasks
+    :return: Resolvent and substitutions of each task in the same order
+    """
+    return [clause1.resolve_on(clause2, predicate1, predicate2) for clause1, predicate1, clause2, predicate2 in tasks]
+
+
+class ParallelResolver(object):
+    """
+    Resolver which shards resolution tasks into chunks and resolves them in a process pool
+
+    Results are returned in the order of the given tasks regardless of which worker completes first, so the search
+    merges resolvents and their provenance exactly as the sequential resolution does. Entities and clauses are
+    rebuilt through the term bank of the receiving process while unpickling, so hash-consing holds in each process.
+    With a single worker or a few tasks, resolution is done in the current process without any pickling overhead.
+    Resolutions are counted in the current process from the tasks and their results if statistics are given.
+    """
+    MIN_TASKS_PER_CHUNK = 32
+
+    def __init__(self, workers: int = 1, statistics: Optional[SearchStatistics] = None):
+        if workers < 1:
+            raise ValueError('Number of workers should be positive: {0}'.format(workers))
+        self.workers = workers
+        self.statistics = statistics
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Shut down the worker processes if they are started
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def resolve(self, tasks: List[ResolutionTask]) -> List[ResolutionResult]:
+        """
+        Resolve all the tasks
+        :param tasks: Resolution tasks
+        :return: Resolvent and substitutions of each task in the same order
+        """
+        if self.workers == 1 or len(tasks) < 2 * ParallelResolver.MIN_TASKS_PER_CHUNK:
+            results = resolve_tasks(tasks)
+        else:
+            results = self._resolve_in_workers(tasks)
+        if self.statistics is not None:
+            self.statistics.count_resolutions(tasks, results)
+        return results
+
+    def _resolve_in_workers(self, tasks: List[ResolutionTask]) -> List[ResolutionResult]:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        # A few chunks per worker balances the load while keeping pickling overhead per chunk low
+        chunk_size = max(ParallelResolver.MIN_TASKS_PER_CHUNK, -(-len(tasks) // (4 * self.workers)))
+        chunks = [tasks[index: index + chunk_size] for index in range(0, len(tasks), chunk_size)]
+        results = []
+        for chunk_results in self._executor.map(resolve_tasks, chunks):
+            results.extend(chunk_results)
+        return results
+
+
+class ParallelResolverUnitTest(unittest.TestCase):
+
+    @staticmethod
+    def _tasks(count):
+        tasks = []
+        for index in range(count):
+            clause1 = Clause([Predicate.build(predicate) for predicate in
+                              children_entity_parser('p{0}(x, f(y)), q(y)'.format(index % 5))])
+            clause2 = Clause([Predicate.build(predicate) for predicate in
+                              children_entity_parser('~p{0}(A{1}, f(x)), r(x)'.format(index % 5, index))])
+            tasks.append((clause1, clause1.predicates[0], clause2, clause2.predicates[0]))
+        return tasks
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            _ = ParallelResolver(0)
+
+    def test_parallel_resolution_is_deterministic(self):
+        tasks = ParallelResolverUnitTest._tasks(5 * ParallelResolver.MIN_TASKS_PER_CHUNK)
+        expected = resolve_tasks(tasks)
+
+        with ParallelResolver(2) as resolver:
+            results = resolver.resolve(tasks)
+
+        self.assertEqual([resolvent for resolvent, _ in expected], [resolvent for resolvent, _ in results])
+        self.assertEqual([substitutions for _, substitutions in expected],
+                         [substitutions for _, substitutions in results])
+        # Entities of the results are hash-consed in this process as well
+        self.assertIs(expected[0][0].predicates[0], results[0][0].predicates[0])
@@ -0,0 +1,240 @@
+import heapq
+import unittest
+from collections import deque
+from typing import Iterable, Iterator, Optional, Tuple
+
+from .entity.clause import Clause
+
+
+class BestFirstQueue(object):
+    """
+    Best First Queue
+    ================
+    Clauses waiting to be selected, ordered both by age and by priority where light clauses close to the goal are
+    selected first
+
+    Priority of a clause is its weight, i.e. number of symbols, minus its goal bonus. A clause derived from the goal
+    clauses in d inferences gets max(0, goal_distance_bonus - d) bonus, the other clauses get none. Picks alternate
+    between the two orders with the age to weight ratio, e.g. (1, 5) selects the oldest clause once after every five
+    clauses of the lowest priority, so heavy clauses are selected eventually and the search stays fair. Each clause is
+    kept in both orders, clauses selected in one order are skipped lazily in the other one.
+    """
+
+    def __init__(self, age_weight_ratio: Tuple[int, int], goal_distance_bonus: int = 0):
+        age_picks, weight_picks = age_weight_ratio
+        if age_picks < 0 or weight_picks < 0 or age_picks + weight_picks == 0:
+            raise ValueError('Age to weight ratio should be non-negative and not all zero: {0}'
+                             .format(age_weight_ratio))
+        if goal_distance_bonus < 0:
+            raise ValueError('Goal distance bonus should be non-negative: {0}'.format(goal_distance_bonus))
+        self.age_weight_ratio = age_picks, weight_picks
+        self.goal_distance_bonus = goal_distance_bonus
+        self._by_age = deque()
+        self._by_priority = []
+        # Ages of the clauses selected in one order but not yet skipped in the other one
+        self._selected = set()
+        self._age = 0
+        self._picks = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[Clause]:
+        return (clause for age, clause in self._by_age if age not in self._selected)
+
+    def priority(self, clause: Clause, goal_distance: Optional[int] = None) -> int:
+        """
+        Priority of the clause, the lower the better
+        :param clause: Clause to be selected
+        :param goal_distance: Number of inferences from the goal clauses to the clause, None if it is not derived from
+        them
+        """
+        if goal_distance is None:
+            return clause.get_weight()
+        return clause.get_weight() - max(0, self.goal_distance_bonus - goal_distance)
+
+    def append(self, clause: Clause, goal_distance: Optional[int] = None):
+        self._by_age.append((self._age, clause))
+        heapq.heappush(self._by_priority, (self.priority(clause, goal_distance), self._age, clause))
+        self._age += 1
+        self._size += 1
+
+    def popleft(self) -> Clause:
+        """
+        Select the next clause
+        :return: Oldest clause if it is the turn of the age order, otherwise the clause with the lowest priority where
+        the oldest one is selected among equal priorities
+        :raise IndexError: If the queue is empty
+        """
+        if not self:
+            raise IndexError('pop from an empty queue')
+        age_picks, weight_picks = self.age_weight_ratio
+        is_age_pick = self._picks < age_picks
+        self._picks = (self._picks + 1) % (age_picks + weight_picks)
+        if is_age_pick:
+            age, clause = BestFirstQueue._pop_unselected(self._by_age, deque.popleft, self._selected)
+        else:
+            _, age, clause = BestFirstQueue._pop_unselected(self._by_priority, heapq.heappop, self._selected)
+        self._selected.add(age)
+        self._size -= 1
+        return clause
+
+    @staticmethod
+    def _pop_unselected(entries, pop, selected: set):
+        """
+        Pop entries until the first one which is not selected yet, i.e. age is the second last item of each entry
+        """
+        while True:
+            entry = pop(entries)
+            if entry[-2] in selected:
+                selected.remove(entry[-2])
+            else:
+                return entry
+
+
+class PassiveQueue(object):
+    """
+    Passive Queue
+    =============
+    Clauses waiting to be selected by the given clause algorithm
+
+    Without unit preference, clauses are selected in first in first out order. With unit preference, unit clauses
+    and the other clauses are kept in separate first in first out queues and unit clauses are selected first, since
+    resolving with a unit clause shortens the other clause. To keep the search fair, i.e. every kept clause is
+    selected eventually even if units are generated endlessly, the oldest non-unit clause is selected after every
+    UNIT_PICK_RATIO consecutive unit clauses.
+
+    With best first selection, clauses are selected by priority instead of first in first out order, see
+    :class:`BestFirstQueue`, where unit clauses are still selected first if unit preference is used. Goal distance of
+    each appended clause is one more than the smallest goal distance of its parents, goal clauses are at distance zero.
+    """
+    UNIT_PICK_RATIO = 4
+
+    def __init__(self, clauses: Iterable[Clause] = (), unit_preference: bool = False,
+                 age_weight_ratio: Optional[Tuple[int, int]] = None, goal_clauses: Iterable[Clause] = (),
+                 goal_distance_bonus: int = 0):
+        self.unit_preference = unit_preference
+        self.is_best_first = age_weight_ratio is not None
+        if self.is_best_first:
+            self.units = BestFirstQueue(age_weight_ratio, goal_distance_bonus)
+            self.non_units = BestFirstQueue(age_weight_ratio, goal_distance_bonus)
+        else:
+            self.units = deque()
+            self.non_units = deque()
+        # Goal distances are kept only for the clauses derived from the goal clauses
+        self.goal_distances = {clause: 0 for clause in goal_clauses} if goal_distance_bonus else {}
+        self._unit_picks = 0
+        for clause in clauses:
+            self.append(clause)
+
+    def __len__(self):
+        return len(self.units) + len(self.non_units)
+
+    def __bool__(self):
+        return bool(self.units) or bool(self.non_units)
+
+    def __iter__(self) -> Iterator[Clause]:
+        yield from self.units
+        yield from self.non_units
+
+    def append(self, clause: Clause, parents: Iterable[Clause] = ()):
+        """
+        Append the clause to be selected later
+        :param clause: Clause to be appended
+        :param parents: Clauses which the clause is derived from, only used for the goal distance in best first
+        selection
+        """
+        queue = self.units if self.unit_preference and clause.get_clause_length() <= 1 else self.non_units
+        if not self.is_best_first:
+            queue.append(clause)
+            return
+        goal_distance = self.goal_distances.get(clause)
+        if goal_distance is None and self.goal_distances:
+            goal_distance = min((self.goal_distances[parent] + 1 for parent in parents if
+                                 parent in self.goal_distances), default=None)
+            if goal_distance is not None:
+                self.goal_distances[clause] = goal_distance
+        queue.append(clause, goal_distance)
+
+    def popleft(self) -> Clause:
+        """
+        Select the next clause
+        :return: Next unit clause if unit clauses are preferred and it is not the turn of the non-unit clauses,
+        otherwise the next clause, where the next clause is the oldest one unless best first selection is used
+        :raise IndexError: If the queue is empty
+        """
+        if self.units and (not self.non_units or self._unit_picks < PassiveQueue.UNIT_PICK_RATIO):
+            self._unit_picks += 1
+            return self.units.popleft()
+        self._unit_picks = 0
+        return self.non_units.popleft()
+
+
+class PassiveQueueUnitTest(unittest.TestCase):
+
+    def test_first_in_first_out(self):
+        from .clause_index import LiteralIndexUnitTest
+
+        clauses = [LiteralIndexUnitTest._clause(text) for text in ['p(x), q(x)', 'p(A)', 'q(B), r(B)', 'r(C)']]
+        queue = PassiveQueue(clauses)
+        self.assertEqual(4, len(queue))
+        self.assertEqual(clauses, [queue.popleft() for _ in range(4)])
+        self.assertFalse(queue)
+        with self.assertRaises(IndexError):
+            queue.popleft()
+
+    def test_unit_preference(self):
+        from .clause_index import LiteralIndexUnitTest
+
+        non_units = [LiteralIndexUnitTest._clause('p{0}(x), q(x)'.format(index)) for index in range(2)]
+        units = [LiteralIndexUnitTest._clause('p(C{0})'.format(index)) for index in range(6)]
+        queue = PassiveQueue(non_units + units, unit_preference=True)
+        self.assertEqual(units + non_units, list(queue))
+
+        # Non-unit clauses are not starved by the unit clauses
+        selected = [queue.popleft() for _ in range(len(non_units) + len(units))]
+        self.assertEqual(units[:4] + non_units[:1] + units[4:] + non_units[1:], selected)
+
+    def test_best_first(self):
+        from .clause_index import LiteralIndexUnitTest
+
+        clauses = [LiteralIndexUnitTest._clause(text) for text in
+                   ['p(f(f(x))), q(x)', 'p(f(x)), q(x)', 'p(x), q(x)', 'p(A)', 'q(f(B))']]
+        # Only the lightest clauses are selected without age picks, the oldest one first among equal weights
+        queue = PassiveQueue(clauses, age_weight_ratio=(0, 1))
+        self.assertEqual(5, len(queue))
+        self.assertEqual([clauses[index] for index in (3, 4, 2, 1, 0)], [queue.popleft() for _ in range(5)])
+        self.assertFalse(queue)
+        with self.assertRaises(IndexError):
+            queue.popleft()
+
+        # Oldest clause is selected after every two lightest clauses, clauses selected by weight are skipped by age
+        queue = PassiveQueue(clauses, age_weight_ratio=(1, 2))
+        self.assertEqual([clauses[index] for index in (0, 3, 4, 1, 2)], [queue.popleft() for _ in range(5)])
+        queue = PassiveQueue(clauses, age_weight_ratio=(1, 2))
+        _ = queue.popleft(), queue.popleft()
+        self.assertEqual([clauses[index] for index in (1, 2, 4)], list(queue))
+
+        with self.assertRaises(ValueError):
+            _ = PassiveQueue(clauses, age_weight_ratio=(0, 0))
+        with self.assertRaises(ValueError):
+            _ = PassiveQueue(clauses, age_weight_ratio=(1, -1))
+
+    def test_goal_distance(self):
+        from .clause_index import LiteralIndexUnitTest
+
+        goal, fact, rule, other_rule = [LiteralIndexUnitTest._clause(text) for text in
+                                        ['~r(A)', 'p(A)', '~p(x), q(x), r(x)', '~q(x), s(x)']]
+        queue = PassiveQueue([goal, fact, rule, other_rule], age_weight_ratio=(0, 1), goal_clauses=[goal],
+                             goal_distance_bonus=3)
+        self.assertEqual(0, queue.goal_distances[goal])
+        # Clauses derived from the goal get smaller bonus the farther they are from it
+        close_clause, far_clause = [LiteralIndexUnitTest._clause(text) for text in ['~p(A), q(A)', 's(A), t(A)']]
+        queue.append(close_clause, [goal, rule])
+        queue.append(far_clause, [close_clause, other_rule])
+        self.assertEqual({goal: 0, close_clause: 1, far_clause: 2}, queue.goal_distances)
+        self.assertEqual([goal, fact, close_clause, far_clause, other_rule, rule], [queue.popleft() for _ in range(6)])
@@ -0,0 +1,155 @@
+import unittest
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .entity.clause import Clause
+from .most_general_unifier import Substitution
+
+
+class ProofGraph(object):
+    """
+    Proof Graph
+    ===========
+    Provenance of the generated clauses kept as a directed acyclic graph over integer clause ids
+
+    Each clause gets an id when it is first seen, parents, level and substitutions of its first derivation are stored
+    in flat arrays indexed by the id. Input clauses do not have any parent. Nothing is formatted while searching,
+    proof is reconstructed only when it is requested, e.g. after EMPTY_CLAUSE is reached.
+    """
+    NO_PARENT = -1
+
+    def __init__(self):
+        self.clause_ids: Dict[Clause, int] = {}
+        self.clauses: List[Clause] = []
+        self.first_parents = array('i')
+        self.second_parents = array('i')
+        self.levels = array('i')
+        self.substitutions: List[Optional[List[Substitution]]] = []
+
+    def __len__(self):
+        return len(self.clauses)
+
+    def __contains__(self, clause: Clause) -> bool:
+        return clause in self.clause_ids
+
+    def get_id(self, clause: Clause) -> int:
+        """
+        Id of the clause where unseen clauses are added as input clauses
+        """
+        clause_id = self.clause_ids.get(clause)
+        if clause_id is None:
+            clause_id = self._append(clause, ProofGraph.NO_PARENT, ProofGraph.NO_PARENT, None, 0)
+        return clause_id
+
+    def add_resolvent(self, resolvent: Clause, first_parent: Clause, second_parent: Clause,
+                      substitutions: List[Substitution], level: int) -> bool:
+        """
+        Record derivation of the resolvent, only the first derivation of a clause is kept
+        :param resolvent: Generated clause
+        :param first_parent: First resolved clause
+        :param second_parent: Second resolved clause
+        :param substitutions: Substitutions of the resolution
+        :param level: Level or iteration of the search in which the resolvent is generated
+        :return: Boolean flag representing whether the derivation is recorded or not
+        """
+        if resolvent in self.clause_ids:
+            return False
+        self._append(resolvent, self.get_id(first_parent), self.get_id(second_parent), substitutions, level)
+        return True
+
+    def is_derived(self, clause_id: int) -> bool:
+        return self.first_parents[clause_id] != ProofGraph.NO_PARENT
+
+    def iterate_resolutions(self) -> Iterator[Tuple[int, Clause, Clause, Clause]]:
+        """
+        Derived clauses grouped by their levels
+        :return: Generator of level, first parent, second parent and resolvent
+        """
+        derived_ids = [clause_id for clause_id in range(len(self.clauses)) if self.is_derived(clause_id)]
+        # Sort is stable, so clauses of the same level are in the order of generation
+        for clause_id in sorted(derived_ids, key=self.levels.__getitem__):
+            yield (self.levels[clause_id], self.clauses[self.first_parents[clause_id]],
+                   self.clauses[self.second_parents[clause_id]], self.clauses[clause_id])
+
+    def proof_steps(self, clause: Clause) -> List[Tuple[Clause, Clause, Clause, List[Substitution]]]:
+        """
+        Reconstruct the derivation of the clause from the input clauses
+        Every step is given after the steps of its parents and each derived clause is given only once
+        :param clause: Clause whose derivation is reconstructed, e.g. EMPTY_CLAUSE
+        :return: List of first parent, second parent, resolvent and substitutions
+        """
+        clause_id = self.clause_ids.get(clause)
+        if clause_id is None:
+            return []
+
+        # Breadth first order from the clause, steps are given in reverse order so that parents come first
+        order, queue_index = [clause_id], 0
+        while queue_index < len(order):
+            current_id = order[queue_index]
+            queue_index += 1
+            if self.is_derived(current_id):
+                order.append(self.first_parents[current_id])
+                order.append(self.second_parents[current_id])
+
+        steps, shown_ids = [], set()
+        for current_id in reversed(order):
+            if not self.is_derived(current_id) or current_id in shown_ids:
+                continue
+            shown_ids.add(current_id)
+            steps.append((self.clauses[self.first_parents[current_id]], self.clauses[self.second_parents[current_id]],
+                          self.clauses[current_id], self.substitutions[current_id]))
+        return steps
+
+    def _append(self, clause: Clause, first_parent_id: int, second_parent_id: int,
+                substitutions: Optional[List[Substitution]], level: int) -> int:
+        clause_id = len(self.clauses)
+        self.clause_ids[clause] = clause_id
+        self.clauses.append(clause)
+        self.first_parents.append(first_parent_id)
+        self.second_parents.append(second_parent_id)
+        self.levels.append(level)
+        self.substitutions.append(substitutions)
+        return clause_id
+
+
+class ProofGraphUnitTest(unittest.TestCase):
+
+    def test_proof_steps(self):
+        from .clause_index import LiteralIndexUnitTest
+
+        clauses = [LiteralIndexUnitTest._clause(text) for text in ['p(A)', '~p(x), q(x)', '~q(A)', 'q(A)', '~p(y)']]
+        empty_clause = Clause([])
+        graph = ProofGraph()
+        graph.get_id(clauses[2])
+        self.assertTrue(graph.add_resolvent(clauses[3], clauses[0], clauses[1], [], 1))
+        self.assertTrue(graph.add_resolvent(clauses[4], clauses[1], clauses[2], [], 1))
+        self.assertTrue(graph.add_resolvent(empty_clause, clauses[3], clauses[2], [], 2))
+        # First derivation is kept
+        self.assertFalse(graph.add_resolvent(empty_clause, clauses[0], clauses[4], [], 2))
+
+        self.assertEqual(6, len(graph))
+        self.assertEqual(0, graph.get_id(clauses[2]))
+        self.assertEqual([(clauses[0], clauses[1], clauses[3], []), (clauses[3], clauses[2], empty_clause, [])],
+                         graph.proof_steps(empty_clause))
+        self.assertEqual([], graph.proof_steps(clauses[0]))
+        self.assertEqual([], graph.proof_steps(LiteralIndexUnitTest._clause('r(B)')))
+        self.assertEqual([1, 1, 2], [level for level, _, _, _ in graph.iterate_resolutions()])
+
+    def test_shared_lemma(self):
+        from .clause_index import LiteralIndexUnitTest
+
+        # Lemma q(A) is used twice, it is derived only once and before both of its usages
+        p, q_rule, lemma = [LiteralIndexUnitTest._clause(text) for text in ['p(A)', '~p(x), q(x)', 'q(A)']]
+        r_rule, r, final_rule = [LiteralIndexUnitTest._clause(text) for text in
+                                 ['~q(y), r(y)', 'r(A)', '~q(z), ~r(z)']]
+        almost_empty, empty_clause = LiteralIndexUnitTest._clause('~r(A)'), Clause([])
+        graph = ProofGraph()
+        graph.add_resolvent(lemma, p, q_rule, [], 1)
+        graph.add_resolvent(r, lemma, r_rule, [], 2)
+        graph.add_resolvent(almost_empty, lemma, final_rule, [], 2)
+        graph.add_resolvent(empty_clause, r, almost_empty, [], 3)
+
+        resolvents = [resolvent for _, _, resolvent, _ in graph.proof_steps(empty_clause)]
+        self.assertEqual(4, len(resolvents))
+        self.assertEqual(lemma, resolvents[0])
+        self.assertEqual(empty_clause, resolvents[-1])
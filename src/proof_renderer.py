@@ -0,0 +1,86 @@
+import logging
+import unittest
+from typing import Optional
+
+from . import ProblemState
+from .proof_graph import ProofGraph
+from .proof_result import ProofResult
+
+
+class ProofRenderer(object):
+    """
+    Proof Renderer
+    ==============
+    Presentation of the proof results which is kept apart from the search, so that proving does not pay for any output
+
+    Results are written as log records, so verbosity is chosen by the level of the logger
+    * Info: Initial clauses, result and resolution steps of the proof
+    * Debug: Additionally, every generated resolvent grouped by the level or iteration of the search
+    """
+
+    @staticmethod
+    def show(problem_state: ProblemState, result: ProofResult, proof_graph: Optional[ProofGraph] = None,
+             logger: logging.Logger = logging.getLogger()):
+        """
+        Functionality to show result where if we reach aim then show resolvent set of the EMPTY_CLAUSE, otherwise show
+        all the generated resolvent set
+        :param problem_state: Problem state whose clauses are shown as the initial knowledge base
+        :param result: Result of the search which is truthy only if EMPTY_CLAUSE is reached
+        :param proof_graph: Proof graph of the generated resolvents, they are shown at debug level if given
+        :param logger: Logger to write the records into
+        :return: None
+        """
+        # Initial knowledge base
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('Initial knowledge base clauses are:')
+            for index, clause in enumerate(problem_state.clauses):
+                logger.info('Clause {0} \t| {1}'.format(index, clause))
+
+        # Level-wise generation of clauses
+        if proof_graph is not None and logger.isEnabledFor(logging.DEBUG):
+            shown_level = None
+            for level, first_resolver, second_resolver, resolvent in proof_graph.iterate_resolutions():
+                if level != shown_level:
+                    logger.debug('Level {0} generated clauses:'.format(level))
+                    shown_level = level
+                logger.debug('{0} | {1} -> {2}'.format(first_resolver, second_resolver, resolvent))
+
+        # If EMPTY_CLAUSE is reached, show path to resolution
+        if result:
+            logger.info('Knowledge base contradicts, so inverse of the negated target clause is provable.')
+            logger.info('Prove by refutation resolution order will be shown.')
+            for first_resolver, second_resolver, resolvent, substitution in result.steps:
+                logger.info('{0} | {1} -> {2} with substitution {3}'.format(first_resolver, second_resolver, resolvent,
+                                                                            substitution))
+        elif result.is_unknown():
+            logger.warning('Search is stopped before reaching EMPTY_CLAUSE or saturation: {0}'.format(result.reason))
+        else:
+            logger.warning(
+                'Knowledge base does not have contradiction resulting into the fact that we cannot prove the negated target clause.')
+
+
+class ProofRendererUnitTest(unittest.TestCase):
+
+    def test_show(self):
+        from .autonomous_theorem_prover import AutonomousTheoremProver, AutonomousTheoremProverUnitTest
+
+        problem_state = AutonomousTheoremProverUnitTest._problem_state(['p(A)', 'q(z),~p(z)'], ['~q(A)'])
+        prover = AutonomousTheoremProver(problem_state)
+        result = prover.prove()
+
+        with self.assertLogs(level=logging.DEBUG) as logs:
+            ProofRenderer.show(problem_state, result, prover.proof_graph)
+        messages = [record.getMessage() for record in logs.records]
+        self.assertEqual('Clause 2 \t| [~q(A)]', messages[3])
+        self.assertIn('Level 1 generated clauses:', messages)
+        self.assertTrue(messages[-1].endswith('-> [] with substitution []'))
+
+        # Generated clauses are not formatted at info level
+        with self.assertLogs(level=logging.INFO) as logs:
+            ProofRenderer.show(problem_state, result, prover.proof_graph)
+        self.assertEqual(len(result.steps) + 6, len(logs.records))
+
+        with self.assertLogs(level=logging.WARNING) as logs:
+            ProofRenderer.show(problem_state, ProofResult(ProofResult.UNKNOWN, 'timeout'))
+        self.assertEqual(['Search is stopped before reaching EMPTY_CLAUSE or saturation: timeout'],
+                         [record.getMessage() for record in logs.records])
@@ -0,0 +1,79 @@
+import unittest
+from typing import Dict, List, Optional, Tuple
+
+from .entity.clause import Clause
+from .most_general_unifier import Substitution
+
+# First parent, second parent, resolvent and substitutions of a single resolution
+ProofStep = Tuple[Clause, Clause, Clause, List[Substitution]]
+
+
+class ProofResult(object):
+    """
+    Outcome of the search for a proof
+
+    * Proved: EMPTY_CLAUSE is reached, so the theorem is provable
+    * Saturated: All the resolvents are generated without reaching EMPTY_CLAUSE, i.e. no refutation is found by this
+      calculus, which does not show that the theorem is not provable since resolvents are never factored
+    * Unknown: Search is stopped before reaching either of them, reason keeps which resource limit is exceeded
+
+    Proved result keeps the resolution steps reaching EMPTY_CLAUSE where parents of each step are either input clauses
+    or resolvents of the previous steps. Statistics of the search, e.g. number of generated clauses, are kept as a
+    dictionary of numbers. Results are compared only by their status and reason.
+    """
+    PROVED = 'proved'
+    SATURATED = 'saturated'
+    UNKNOWN = 'unknown'
+
+    def __init__(self, status: str, reason: Optional[str] = None, steps: Optional[List[ProofStep]] = None,
+                 stats: Optional[Dict[str, float]] = None):
+        if status not in (ProofResult.PROVED, ProofResult.SATURATED, ProofResult.UNKNOWN):
+            raise ValueError('Unknown proof status: {0}'.format(status))
+        self.status = status
+        self.reason = reason
+        self.steps = steps if steps is not None else []
+        self.stats = stats if stats is not None else {}
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        if self.reason is None:
+            return self.status
+        return '{0} ({1})'.format(self.status, self.reason)
+
+    def __bool__(self):
+        return self.is_proved()
+
+    def __eq__(self, other):
+        if not isinstance(other, ProofResult):
+            return False
+        return self.status == other.status and self.reason == other.reason
+
+    def __hash__(self):
+        return hash((self.status, self.reason))
+
+    def is_proved(self) -> bool:
+        return self.status == ProofResult.PROVED
+
+    def is_unknown(self) -> bool:
+        return self.status == ProofResult.UNKNOWN
+
+
+class ProofResultUnitTest(unittest.TestCase):
+
+    def test_status(self):
+        self.assertTrue(ProofResult(ProofResult.PROVED))
+        self.assertFalse(ProofResult(ProofResult.SATURATED))
+        self.assertFalse(ProofResult(ProofResult.UNKNOWN, 'timeout'))
+        self.assertTrue(ProofResult(ProofResult.UNKNOWN, 'timeout').is_unknown())
+        self.assertFalse(ProofResult(ProofResult.SATURATED).is_unknown())
+        with self.assertRaises(ValueError):
+            _ = ProofResult('disproved')
+
+    def test_string(self):
+        self.assertEqual('proved', str(ProofResult(ProofResult.PROVED)))
+        self.assertEqual('unknown (timeout)', str(ProofResult(ProofResult.UNKNOWN, 'timeout')))
+        self.assertEqual(ProofResult(ProofResult.UNKNOWN, 'timeout'), ProofResult(ProofResult.UNKNOWN, 'timeout'))
+        self.assertNotEqual(ProofResult(ProofResult.UNKNOWN, 'timeout'), ProofResult(ProofResult.UNKNOWN))
+        self.assertEqual(ProofResult(ProofResult.PROVED), ProofResult(ProofResult.PROVED, stats={'iterations': 2}))
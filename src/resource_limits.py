@@ -0,0 +1,207 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from typing import Optional
+
+from .entity.clause import Clause
+
+try:
+    import resource
+except ImportError:
+    # Resource module is not available in every platform, peak memory cannot be measured without it
+    resource = None
+
+
+class ResourceLimitExceeded(Exception):
+    """
+    Exception raised inside the search when one of the resource limits is exceeded or search is cancelled
+    """
+
+    def __init__(self, reason: str):
+        super().__init__('Search is stopped: {0}'.format(reason))
+        self.reason = reason
+
+
+class CancellationToken(object):
+    """
+    Token to cancel a running search cooperatively from another thread, the search checks the token regularly and
+    stops with unknown result after cancellation
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class ResourceLimits(object):
+    """
+    Configurable limits of the search where None means unlimited
+
+    * Timeout: Wall-clock time limit of the search in seconds
+    * Max generated clauses: Maximum number of resolvents generated during the search
+    * Max term depth: Resolvents containing deeper terms are discarded, which makes the search incomplete
+    * Max resident memory: Maximum resident memory of the process in megabytes
+    """
+    TIMEOUT = 'timeout'
+    MAX_GENERATED_CLAUSES = 'max_generated_clauses'
+    MAX_TERM_DEPTH = 'max_term_depth'
+    MAX_RESIDENT_MEMORY = 'max_resident_memory'
+    CANCELLED = 'cancelled'
+
+    def __init__(self, timeout: Optional[float] = None, max_generated_clauses: Optional[int] = None,
+                 max_term_depth: Optional[int] = None, max_resident_memory_mb: Optional[float] = None):
+        self.timeout = timeout
+        self.max_generated_clauses = max_generated_clauses
+        self.max_term_depth = max_term_depth
+        self.max_resident_memory_mb = max_resident_memory_mb
+
+
+class ResourceMonitor(object):
+    """
+    Checker of the resource limits and the cancellation token which is called inside the hot loop of the search
+    Elapsed time and cancellation are checked at each call, resident memory is checked once in a while since it is
+    relatively expensive to measure
+    """
+    MEMORY_CHECK_INTERVAL = 256
+
+    def __init__(self, limits: Optional[ResourceLimits] = None,
+                 cancellation_token: Optional[CancellationToken] = None):
+        self.limits = limits or ResourceLimits()
+        self.cancellation_token = cancellation_token
+        self.generated_clauses = 0
+        # Whether any resolvent is discarded due to limits, then saturation does not mean the theorem is unprovable
+        self.is_incomplete = False
+        self._deadline = None
+        self._check_count = 0
+
+    def start(self):
+        """
+        Start measuring the elapsed time of the search
+        """
+        if self.limits.timeout is not None:
+            self._deadline = time.monotonic() + self.limits.timeout
+        self.generated_clauses = 0
+        self.is_incomplete = False
+        self._check_count = 0
+
+    def check(self):
+        """
+        Check cancellation, elapsed time and resident memory
+        :raise ResourceLimitExceeded: If any of them exceeds its limit
+        """
+        if self.cancellation_token is not None and self.cancellation_token.is_cancelled():
+            raise ResourceLimitExceeded(ResourceLimits.CANCELLED)
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise ResourceLimitExceeded(ResourceLimits.TIMEOUT)
+        if self.limits.max_resident_memory_mb is not None:
+            self._check_count += 1
+            if self._check_count % ResourceMonitor.MEMORY_CHECK_INTERVAL == 1:
+                resident_memory = ResourceMonitor.resident_memory_mb()
+                if resident_memory is not None and resident_memory > self.limits.max_resident_memory_mb:
+                    raise ResourceLimitExceeded(ResourceLimits.MAX_RESIDENT_MEMORY)
+
+    def accept_resolvent(self, resolvent: Clause) -> bool:
+        """
+        Count the generated resolvent and check whether it can be kept with respect to the limits
+        :param resolvent: Newly generated resolvent
+        :return: Boolean flag representing that the resolvent can be kept
+        :raise ResourceLimitExceeded: If maximum number of generated clauses is exceeded
+        """
+        self.generated_clauses += 1
+        if self.limits.max_generated_clauses is not None and \
+                self.generated_clauses > self.limits.max_generated_clauses:
+            raise ResourceLimitExceeded(ResourceLimits.MAX_GENERATED_CLAUSES)
+        if self.limits.max_term_depth is not None and resolvent.get_term_depth() > self.limits.max_term_depth:
+            self.is_incomplete = True
+            return False
+        return True
+
+    @staticmethod
+    def resident_memory_mb() -> Optional[float]:
+        """
+        Current resident memory of the process in megabytes, peak resident memory is used if current one cannot be
+        read and None is returned if neither of them is available
+        """
+        try:
+            with open('/proc/self/statm') as statm:
+                return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+        except (OSError, ValueError, IndexError, AttributeError):
+            pass
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Peak resident memory is in bytes on macOS and in kilobytes on the other platforms
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class ResourceMonitorUnitTest(unittest.TestCase):
+
+    @staticmethod
+    def _clause(predicates):
+        from .entity import children_entity_parser
+        from .entity.predicate import Predicate
+        return Clause([Predicate.build(predicate) for predicate in children_entity_parser(predicates)])
+
+    def test_unlimited(self):
+        monitor = ResourceMonitor()
+        monitor.start()
+        for _ in range(1000):
+            monitor.check()
+            self.assertTrue(monitor.accept_resolvent(ResourceMonitorUnitTest._clause('p(f(f(f(x))))')))
+        self.assertEqual(1000, monitor.generated_clauses)
+        self.assertFalse(monitor.is_incomplete)
+
+    def test_cancellation(self):
+        token = CancellationToken()
+        monitor = ResourceMonitor(cancellation_token=token)
+        monitor.start()
+        monitor.check()
+
+        thread = threading.Thread(target=token.cancel)
+        thread.start()
+        thread.join()
+        with self.assertRaises(ResourceLimitExceeded) as context:
+            monitor.check()
+        self.assertEqual(ResourceLimits.CANCELLED, context.exception.reason)
+
+    def test_timeout(self):
+        monitor = ResourceMonitor(ResourceLimits(timeout=0))
+        monitor.start()
+        time.sleep(0.01)
+        with self.assertRaises(ResourceLimitExceeded) as context:
+            monitor.check()
+        self.assertEqual(ResourceLimits.TIMEOUT, context.exception.reason)
+
+    def test_max_generated_clauses(self):
+        monitor = ResourceMonitor(ResourceLimits(max_generated_clauses=2))
+        monitor.start()
+        clause = ResourceMonitorUnitTest._clause('p(x)')
+        self.assertTrue(monitor.accept_resolvent(clause))
+        self.assertTrue(monitor.accept_resolvent(clause))
+        with self.assertRaises(ResourceLimitExceeded) as context:
+            monitor.accept_resolvent(clause)
+        self.assertEqual(ResourceLimits.MAX_GENERATED_CLAUSES, context.exception.reason)
+
+    def test_max_term_depth(self):
+        monitor = ResourceMonitor(ResourceLimits(max_term_depth=2))
+        monitor.start()
+        self.assertTrue(monitor.accept_resolvent(ResourceMonitorUnitTest._clause('p(f(g(x)), A)')))
+        self.assertFalse(monitor.is_incomplete)
+        self.assertFalse(monitor.accept_resolvent(ResourceMonitorUnitTest._clause('q(A), p(f(g(h(x))))')))
+        self.assertTrue(monitor.is_incomplete)
+
+    def test_max_resident_memory(self):
+        if ResourceMonitor.resident_memory_mb() is None:
+            self.skipTest('Resident memory cannot be measured in this platform')
+        monitor = ResourceMonitor(ResourceLimits(max_resident_memory_mb=0))
+        monitor.start()
+        with self.assertRaises(ResourceLimitExceeded) as context:
+            monitor.check()
+        self.assertEqual(ResourceLimits.MAX_RESIDENT_MEMORY, context.exception.reason)
@@ -0,0 +1,176 @@
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+
+class SearchProfiler(object):
+    """
+    Search Profiler
+    ===============
+    Timeline of the phases of a proof, e.g. parsing, preprocessing, each level of breadth first search, batches of
+    given clause iterations, subsumption and proof reconstruction
+
+    Phases are written in Chrome trace event format, which can be opened with chrome://tracing or Perfetto. Nested
+    phases are shown as a stack on the timeline of the thread they run in.
+    """
+    # Number of given clause iterations shown as a single phase, so that traces of long searches stay small
+    ITERATION_BATCH_SIZE = 256
+
+    def __init__(self):
+        self.events: List[dict] = []
+        self._origin = time.perf_counter()
+        self._process_id = os.getpid()
+
+    @contextmanager
+    def span(self, name: str, category: str = 'search', **args):
+        """
+        Record the code run within the context as a phase
+        :param name: Name of the phase
+        :param category: Category of the phase which can be used to filter phases in the viewer
+        :param args: Additional information shown with the phase, e.g. number of clauses
+        """
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.add_span(name, start, time.perf_counter(), category, **args)
+
+    def add_span(self, name: str, start: float, end: float, category: str = 'search', **args):
+        """
+        Record a phase which is already completed in the current thread
+        :param name: Name of the phase
+        :param start: Start time of the phase given by `time.perf_counter`
+        :param end: End time of the phase given by `time.perf_counter`
+        :param category: Category of the phase
+        :param args: Additional information shown with the phase
+        """
+        self.events.append({'name': name, 'cat': category, 'ph': 'X', 'ts': (start - self._origin) * 1e6,
+                            'dur': (end - start) * 1e6, 'pid': self._process_id, 'tid': threading.get_ident(),
+                            'args': args})
+
+    def trace_iterator(self, iterable: Iterable, name: str, category: str = 'input') -> Iterator:
+        """
+        Record producing each item of the iterable as a phase, e.g. parsing problems lazily
+        """
+        iterator = iter(iterable)
+        while True:
+            with self.span(name, category):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def to_chrome_trace(self) -> dict:
+        return {'traceEvents': sorted(self.events, key=lambda event: event['ts']), 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, file: TextIO):
+        json.dump(self.to_chrome_trace(), file)
+
+
+class StackSampler(object):
+    """
+    Stack Sampler
+    =============
+    Sampling profiler which records the call stack of a thread at regular intervals from a background thread
+
+    Samples are written in collapsed stack format, i.e. frames of a stack joined with ';' from the outermost frame
+    followed by the number of samples, which is the input format of flamegraph tools. Sampling does not slow down the
+    sampled thread apart from sharing the interpreter lock with the sampler thread.
+    """
+    INTERVAL = 0.001
+
+    def __init__(self, interval: float = INTERVAL, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.samples = Counter()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sample(self):
+        """
+        Record the current stack of the sampled thread
+        """
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        frames = []
+        while frame is not None:
+            frames.append(StackSampler._frame_label(frame))
+            frame = frame.f_back
+        self.samples[';'.join(reversed(frames))] += 1
+
+    def write_collapsed_stacks(self, file: TextIO):
+        for stack, count in sorted(self.samples.items()):
+            file.write('{0} {1}\n'.format(stack, count))
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    @staticmethod
+    def _frame_label(frame) -> str:
+        code = frame.f_code
+        return '{0} ({1}:{2})'.format(code.co_name, os.path.basename(code.co_filename), code.co_firstlineno)
+
+
+class SearchProfilerUnitTest(unittest.TestCase):
+
+    def test_chrome_trace(self):
+        from io import StringIO
+
+        profiler = SearchProfiler()
+        with profiler.span('level 1', clauses=3) as args:
+            with profiler.span('subsumption'):
+                pass
+            args['kept_clauses'] = 2
+        self.assertEqual(['a', 'b'], list(profiler.trace_iterator(['a', 'b'], 'parse')))
+
+        file = StringIO()
+        profiler.write_chrome_trace(file)
+        events = json.loads(file.getvalue())['traceEvents']
+        self.assertEqual(['level 1', 'subsumption', 'parse', 'parse', 'parse'], [event['name'] for event in events])
+        self.assertEqual({'clauses': 3, 'kept_clauses': 2}, events[0]['args'])
+        # Nested phase is within its parent
+        self.assertLessEqual(events[0]['ts'], events[1]['ts'])
+        self.assertLessEqual(events[1]['ts'] + events[1]['dur'], events[0]['ts'] + events[0]['dur'])
+        self.assertTrue(all(event['ph'] == 'X' for event in events))
+
+    def test_stack_sampler(self):
+        from io import StringIO
+
+        sampler = StackSampler()
+        sampler.sample()
+        with sampler:
+            time.sleep(0.01)
+        file = StringIO()
+        sampler.write_collapsed_stacks(file)
+        lines = file.getvalue().splitlines()
+        self.assertGreater(len(lines), 0)
+        stack, count = lines[0].rsplit(' ', 1)
+        self.assertIn('test_stack_sampler (search_profiler.py:', stack)
+        self.assertGreater(int(count), 0)
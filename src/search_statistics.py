@@ -0,0 +1,122 @@
+import json
+import unittest
+from typing import Dict, List, Sequence, Tuple
+
+
+class SearchStatistics(object):
+    """
+    Search Statistics
+    =================
+    Counters of the hot paths of the prover and timings of each search iteration, i.e. level of breadth first search
+    or given clause iteration
+
+    Counters are incremented at the call sites by the components which are given the statistics object of the prover,
+    i.e. resolvers, subsumption indices and the search itself, so provers collecting their own statistics do not
+    affect each other. Resolutions done by the worker processes of parallel resolution are counted in the current
+    process from their tasks and results. Unification counters cover the unifications of resolution steps, each of
+    which unifies its complementary literals once.
+    """
+    UNIFICATION_ATTEMPTS = 'unification_attempts'
+    UNIFICATION_SUCCESSES = 'unification_successes'
+    RESOLUTION_ATTEMPTS = 'resolution_attempts'
+    RESOLVENTS_GENERATED = 'resolvents_generated'
+    RESOLVENTS_KEPT = 'resolvents_kept'
+    SUBSUMPTION_CHECKS = 'subsumption_checks'
+    SUBSUMPTIONS = 'subsumptions'
+    TAUTOLOGY_CHECKS = 'tautology_checks'
+    TAUTOLOGIES = 'tautologies'
+    COUNTERS = [UNIFICATION_ATTEMPTS, UNIFICATION_SUCCESSES, RESOLUTION_ATTEMPTS, RESOLVENTS_GENERATED,
+                RESOLVENTS_KEPT, SUBSUMPTION_CHECKS, SUBSUMPTIONS, TAUTOLOGY_CHECKS, TAUTOLOGIES]
+    # Fields of each iteration record
+    ITERATION_FIELDS = ['iteration', 'time_s', 'clause_store_size', 'generated_clauses', 'kept_clauses']
+
+    def __init__(self):
+        self.counters: Dict[str, int] = dict.fromkeys(SearchStatistics.COUNTERS, 0)
+        self.iterations: List[Tuple[int, float, int, int, int]] = []
+        self.max_clause_store_size = 0
+
+    def increment(self, counter: str, amount: int = 1):
+        self.counters[counter] += amount
+
+    def record_iteration(self, iteration: int, elapsed_time: float, clause_store_size: int, generated_clauses: int,
+                         kept_clauses: int):
+        """
+        Record a single iteration of the search
+        :param iteration: Level or iteration number of the search
+        :param elapsed_time: Duration of the iteration in seconds
+        :param clause_store_size: Number of clauses kept by the search after the iteration
+        :param generated_clauses: Number of resolvents generated in the iteration
+        :param kept_clauses: Number of generated resolvents kept after redundancy elimination
+        """
+        self.iterations.append((iteration, elapsed_time, clause_store_size, generated_clauses, kept_clauses))
+        self.max_clause_store_size = max(self.max_clause_store_size, clause_store_size)
+        self.counters[SearchStatistics.RESOLVENTS_GENERATED] += generated_clauses
+        self.counters[SearchStatistics.RESOLVENTS_KEPT] += kept_clauses
+
+    def count(self, counter: str, success_counter: str, is_success: bool) -> bool:
+        """
+        Count a single check and its success
+        :param counter: Counter of the checks
+        :param success_counter: Counter of the successful checks
+        :param is_success: Result of the check
+        :return: Result of the check
+        """
+        self.counters[counter] += 1
+        if is_success:
+            self.counters[success_counter] += 1
+        return is_success
+
+    def count_resolutions(self, tasks: Sequence[tuple], results: Sequence[tuple]):
+        """
+        Count the resolution attempts and the unifications of their literals
+        :param tasks: Resolution tasks as the first clause, its literal, the second clause and its literal
+        :param results: Resolvent and substitutions of each task in the same order
+        """
+        self.counters[SearchStatistics.RESOLUTION_ATTEMPTS] += len(tasks)
+        for (_, predicate, _, other_predicate), (resolvent, _) in zip(tasks, results):
+            # Literals are unified only if they are complementary, and resolution fails only if they are not unifiable
+            if predicate.get_name() == other_predicate.get_name() and \
+                    predicate.is_negated != other_predicate.is_negated:
+                self.count(SearchStatistics.UNIFICATION_ATTEMPTS, SearchStatistics.UNIFICATION_SUCCESSES,
+                           resolvent is not None)
+
+    def to_dict(self) -> dict:
+        return {
+            'counters': dict(self.counters),
+            'max_clause_store_size': self.max_clause_store_size,
+            'iterations': [dict(zip(SearchStatistics.ITERATION_FIELDS, record)) for record in self.iterations]
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+class SearchStatisticsUnitTest(unittest.TestCase):
+
+    def test_count_resolutions(self):
+        from .clause_index import LiteralIndexUnitTest
+        from .parallel_resolution import resolve_tasks
+
+        clause1 = LiteralIndexUnitTest._clause('p(x, x), q(x)')
+        clause2 = LiteralIndexUnitTest._clause('~p(A, B), ~q(A), r(y)')
+        tasks = [(clause1, clause1.predicates[0], clause2, clause2.predicates[0]),
+                 (clause1, clause1.predicates[1], clause2, clause2.predicates[1]),
+                 (clause1, clause1.predicates[0], clause2, clause2.predicates[2])]
+        statistics = SearchStatistics()
+        statistics.count_resolutions(tasks, resolve_tasks(tasks))
+        self.assertTrue(statistics.count(SearchStatistics.SUBSUMPTION_CHECKS, SearchStatistics.SUBSUMPTIONS, True))
+        self.assertFalse(statistics.count(SearchStatistics.TAUTOLOGY_CHECKS, SearchStatistics.TAUTOLOGIES, False))
+        self.assertEqual({'unification_attempts': 2, 'unification_successes': 1, 'resolution_attempts': 3,
+                          'resolvents_generated': 0, 'resolvents_kept': 0, 'subsumption_checks': 1,
+                          'subsumptions': 1, 'tautology_checks': 1, 'tautologies': 0}, statistics.counters)
+
+    def test_to_json(self):
+        statistics = SearchStatistics()
+        statistics.record_iteration(1, 0.5, 10, 4, 3)
+        statistics.record_iteration(2, 0.25, 8, 2, 0)
+        report = json.loads(statistics.to_json())
+        self.assertEqual(10, report['max_clause_store_size'])
+        self.assertEqual(6, report['counters'][SearchStatistics.RESOLVENTS_GENERATED])
+        self.assertEqual(3, report['counters'][SearchStatistics.RESOLVENTS_KEPT])
+        self.assertEqual({'iteration': 2, 'time_s': 0.25, 'clause_store_size': 8, 'generated_clauses': 2,
+                          'kept_clauses': 0}, report['iterations'][1])
@@ -0,0 +1,293 @@
+import mmap
+import struct
+import sys
+import unittest
+from array import array
+from typing import BinaryIO, Dict, List
+
+from . import ProblemState
+from .entity.constant import Constant
+from .entity.first_order_predicate_logic_entity import FirstOrderPredicateLogicEntity
+from .entity.function import Function
+from .entity.predicate import Predicate
+from .entity.variable import Variable
+
+
+class SnapshotError(ValueError):
+    """
+    Error raised when a file is not a valid snapshot
+    """
+
+
+class ProblemSnapshot(object):
+    """
+    Problem Snapshot
+    ================
+    Compact binary format of a problem state which is loaded without parsing any clause text
+
+    Every distinct entity is stored once since entities are hash-consed, children are stored before their parents and
+    entities refer to their children and names with indexes. All the numbers are little-endian unsigned 32-bit
+    integers, so sections are read directly from the memory mapped file.
+
+    Layout:
+        * Header: Magic, version, flags and sizes of the sections
+        * Symbols: Offsets of the names in the name blob followed by the UTF-8 name blob padded to 4 bytes
+        * Entities: Symbol index and kind of each entity, offsets of their children and the child entity indexes
+        * Clauses: Group of each clause, offsets of their literals and the literal entity indexes
+    """
+    MAGIC = b'FOPLSNAP'
+    VERSION = 1
+    PREPROCESSED_FLAG = 1
+    _HEADER = struct.Struct('<8s8I')
+
+    VARIABLE_KIND = 0
+    CONSTANT_KIND = 1
+    FUNCTION_KIND = 2
+    PREDICATE_KIND = 3
+    NEGATED_PREDICATE_KIND = 4
+    # Number of bits of the kind in the entity information
+    KIND_BITS = 3
+
+    KNOWLEDGE_BASE_GROUP = 0
+    NEGATED_THEOREM_GROUP = 1
+
+    @staticmethod
+    def write(problem_state: ProblemState, file: BinaryIO):
+        """
+        Write the problem state as snapshot
+        :param problem_state: Problem state to write, it is marked as preprocessed in the snapshot if it is so
+        :param file: Binary file to write into
+        """
+        symbols: Dict[str, int] = {}
+        entities: Dict[FirstOrderPredicateLogicEntity, int] = {}
+        entity_information, child_offsets, children = array('I'), array('I', [0]), array('I')
+        clause_groups, literal_offsets, literals = array('I'), array('I', [0]), array('I')
+
+        def add_entity(root):
+            # Entities are visited in post order, so children always precede their parents
+            stack = [(root, False)]
+            while stack:
+                entity, is_expanded = stack.pop()
+                if entity in entities:
+                    continue
+                if entity.has_child() and not is_expanded:
+                    stack.append((entity, True))
+                    stack.extend((child, False) for child in reversed(entity.get_child()))
+                    continue
+                if isinstance(entity, Variable):
+                    kind = ProblemSnapshot.VARIABLE_KIND
+                elif isinstance(entity, Constant):
+                    kind = ProblemSnapshot.CONSTANT_KIND
+                elif isinstance(entity, Function):
+                    kind = ProblemSnapshot.FUNCTION_KIND
+                else:
+                    kind = ProblemSnapshot.NEGATED_PREDICATE_KIND if entity.is_negated else \
+                        ProblemSnapshot.PREDICATE_KIND
+                symbol = symbols.setdefault(entity.get_name(), len(symbols))
+                entity_information.append(symbol << ProblemSnapshot.KIND_BITS | kind)
+                if entity.has_child():
+                    children.extend(entities[child] for child in entity.get_child())
+                child_offsets.append(len(children))
+                entities[entity] = len(entities)
+
+        for group, clauses in ((ProblemSnapshot.KNOWLEDGE_BASE_GROUP, problem_state.knowledge_base_clauses),
+                               (ProblemSnapshot.NEGATED_THEOREM_GROUP, problem_state.negated_theorem_clauses)):
+            for clause in clauses:
+                for predicate in clause.predicates:
+                    add_entity(predicate)
+                    literals.append(entities[predicate])
+                clause_groups.append(group)
+                literal_offsets.append(len(literals))
+
+        encoded_symbols = [symbol.encode('utf-8') for symbol in symbols]
+        symbol_offsets = array('I', [0])
+        for encoded_symbol in encoded_symbols:
+            symbol_offsets.append(symbol_offsets[-1] + len(encoded_symbol))
+        blob = b''.join(encoded_symbols)
+        blob += b'\0' * (-len(blob) % 4)
+
+        flags = ProblemSnapshot.PREPROCESSED_FLAG if problem_state.is_preprocessed else 0
+        file.write(ProblemSnapshot._HEADER.pack(ProblemSnapshot.MAGIC, ProblemSnapshot.VERSION, flags, len(symbols),
+                                                len(blob), len(entities), len(children), len(clause_groups),
+                                                len(literals)))
+        for section in (symbol_offsets, blob, entity_information, child_offsets, children, clause_groups,
+                        literal_offsets, literals):
+            if isinstance(section, array) and sys.byteorder != 'little':
+                section.byteswap()
+            file.write(section if isinstance(section, bytes) else section.tobytes())
+
+    @staticmethod
+    def read(path: str) -> ProblemState:
+        """
+        Read problem state from the snapshot file by mapping it into memory
+        :param path: Path of the snapshot file
+        :return: Problem state of the snapshot
+        :raise SnapshotError: If the file is not a valid snapshot
+        """
+        with open(path, 'rb') as file:
+            try:
+                mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise SnapshotError('Snapshot is empty: {0}'.format(path)) from e
+        with mapped_file:
+            try:
+                return ProblemSnapshot.load(memoryview(mapped_file))
+            except SnapshotError as e:
+                # Views of the mapped file are kept alive by the traceback, so the error is raised again only after the
+                # traceback is released, otherwise the mapped file cannot be closed
+                message = str(e)
+        raise SnapshotError('{0}: {1}'.format(message, path))
+
+    @staticmethod
+    def load(data) -> ProblemState:
+        """
+        Load problem state from the snapshot bytes
+        :param data: Bytes-like object of the snapshot
+        :return: Problem state of the snapshot
+        :raise SnapshotError: If the data is not a valid snapshot
+        """
+        data = memoryview(data)
+        if len(data) < ProblemSnapshot._HEADER.size:
+            raise SnapshotError('Snapshot is truncated')
+        magic, version, flags, symbol_count, blob_size, entity_count, child_count, clause_count, literal_count = \
+            ProblemSnapshot._HEADER.unpack_from(data)
+        if magic != ProblemSnapshot.MAGIC:
+            raise SnapshotError('Not a snapshot file')
+        if version != ProblemSnapshot.VERSION:
+            raise SnapshotError('Unsupported snapshot version: {0}'.format(version))
+
+        sections, position = [], ProblemSnapshot._HEADER.size
+        for size, is_blob in ((symbol_count + 1, False), (blob_size, True), (entity_count, False),
+                              (entity_count + 1, False), (child_count, False), (clause_count, False),
+                              (clause_count + 1, False), (literal_count, False)):
+            end = position + (size if is_blob else 4 * size)
+            if end > len(data):
+                raise SnapshotError('Snapshot is truncated')
+            section = data[position: end]
+            if not is_blob:
+                section = ProblemSnapshot._integers(section)
+            sections.append(section)
+            position = end
+        symbol_offsets, blob, entity_information, child_offsets, children, clause_groups, literal_offsets, literals = \
+            sections
+
+        try:
+            symbols = [str(blob[symbol_offsets[index]: symbol_offsets[index + 1]], 'utf-8') for index in
+                       range(symbol_count)]
+            entities: List[FirstOrderPredicateLogicEntity] = []
+            for index in range(entity_count):
+                information = entity_information[index]
+                kind, name = information & ((1 << ProblemSnapshot.KIND_BITS) - 1), \
+                    symbols[information >> ProblemSnapshot.KIND_BITS]
+                if kind == ProblemSnapshot.VARIABLE_KIND:
+                    entities.append(Variable(name))
+                elif kind == ProblemSnapshot.CONSTANT_KIND:
+                    entities.append(Constant(name))
+                else:
+                    entity_children = [entities[child] for child in
+                                       children[child_offsets[index]: child_offsets[index + 1]]]
+                    if kind == ProblemSnapshot.FUNCTION_KIND:
+                        entities.append(Function(name, entity_children))
+                    else:
+                        entities.append(Predicate(name, entity_children,
+                                                  kind == ProblemSnapshot.NEGATED_PREDICATE_KIND))
+
+            groups = ([], [])
+            for index in range(clause_count):
+                groups[clause_groups[index]].append(
+                    [entities[literal] for literal in literals[literal_offsets[index]: literal_offsets[index + 1]]])
+        except (IndexError, UnicodeDecodeError) as e:
+            raise SnapshotError('Snapshot is corrupted') from e
+        return ProblemState(groups[ProblemSnapshot.KNOWLEDGE_BASE_GROUP],
+                            groups[ProblemSnapshot.NEGATED_THEOREM_GROUP],
+                            is_preprocessed=bool(flags & ProblemSnapshot.PREPROCESSED_FLAG))
+
+    @staticmethod
+    def _integers(section: memoryview):
+        """
+        View of the section as unsigned integers, the section is copied only if the platform is not little-endian
+        """
+        if sys.byteorder == 'little' and array('I').itemsize == 4:
+            return section.cast('I')
+        integers = array('L' if array('I').itemsize != 4 else 'I')
+        integers.frombytes(section.tobytes())
+        if sys.byteorder != 'little':
+            integers.byteswap()
+        return integers
+
+
+class ProblemSnapshotUnitTest(unittest.TestCase):
+
+    @staticmethod
+    def _round_trip(problem_state):
+        from io import BytesIO
+        file = BytesIO()
+        ProblemSnapshot.write(problem_state, file)
+        return ProblemSnapshot.load(file.getvalue())
+
+    def test_round_trip(self):
+        from .autonomous_theorem_prover import AutonomousTheoremProverUnitTest
+        problem_state = AutonomousTheoremProverUnitTest._problem_state(
+            ['~p(x),q(x)', 'p(A,f(t, g(f(t, B))))', 'q(z),~p(z,f(B, C))', 'r(Ünïcode)'], ['~r(A)', '~s(x, f(x, y))'])
+        loaded_state = ProblemSnapshotUnitTest._round_trip(problem_state)
+
+        # Entities are hash-consed, so loaded clauses are made of the very same entities
+        self.assertEqual(problem_state.knowledge_base_clauses, loaded_state.knowledge_base_clauses)
+        self.assertEqual(problem_state.negated_theorem_clauses, loaded_state.negated_theorem_clauses)
+        self.assertIs(problem_state.clauses[1].predicates[0], loaded_state.clauses[1].predicates[0])
+        self.assertFalse(loaded_state.is_preprocessed)
+
+    def test_preprocessed_snapshot(self):
+        import os
+        import tempfile
+        from .autonomous_theorem_prover import AutonomousTheoremProver, AutonomousTheoremProverUnitTest
+
+        problem_state = AutonomousTheoremProver.preprocess(AutonomousTheoremProverUnitTest._problem_state(
+            ['p(A)', 'p(x)', 'q(x),~q(x)', 'q(z),~p(z)'], ['~q(B)']))
+        self.assertEqual(3, len(problem_state.clauses))
+
+        file_descriptor, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                ProblemSnapshot.write(problem_state, file)
+            loaded_state = ProblemSnapshot.read(path)
+        finally:
+            os.remove(path)
+
+        self.assertTrue(loaded_state.is_preprocessed)
+        self.assertEqual(problem_state.clauses, loaded_state.clauses)
+        self.assertTrue(AutonomousTheoremProver(loaded_state).prove())
+
+    def test_invalid_snapshot(self):
+        from .autonomous_theorem_prover import AutonomousTheoremProverUnitTest
+        from io import BytesIO
+
+        file = BytesIO()
+        ProblemSnapshot.write(AutonomousTheoremProverUnitTest._problem_state(['p(x)'], ['~p(A)']), file)
+        data = file.getvalue()
+
+        invalid_data = [b'', b'FOPLSNAP', b'NOTSNAPS' + data[8:], data[:8] + struct.pack('<I', 2) + data[12:],
+                        data[:-4]]
+        for invalid in invalid_data:
+            with self.assertRaises(SnapshotError):
+                ProblemSnapshot.load(invalid)
+
+    def test_invalid_snapshot_file(self):
+        import os
+        import tempfile
+        from .autonomous_theorem_prover import AutonomousTheoremProverUnitTest
+        from io import BytesIO
+
+        file = BytesIO()
+        ProblemSnapshot.write(AutonomousTheoremProverUnitTest._problem_state(['p(x)'], ['~p(A)']), file)
+        data = file.getvalue()
+
+        for invalid in [data[:-4], b'NOTSNAPS' + data[8:], data[:8] + struct.pack('<I', 2) + data[12:], data[:4]]:
+            file_descriptor, path = tempfile.mkstemp()
+            try:
+                with os.fdopen(file_descriptor, 'wb') as snapshot_file:
+                    snapshot_file.write(invalid)
+                with self.assertRaises(SnapshotError):
+                    ProblemSnapshot.read(path)
+            finally:
+                os.remove(path)
@@ -0,0 +1,229 @@
+import unittest
+from abc import ABCMeta, abstractmethod
+from collections import Counter
+from typing import Dict, Optional, Sequence, Tuple
+
+from .entity.first_order_predicate_logic_entity import FirstOrderPredicateLogicEntity
+from .entity.predicate import Predicate
+from .entity.variable import Variable
+
+
+class TermOrdering(metaclass=ABCMeta):
+    """
+    Term Ordering
+    =============
+    Simplification ordering of terms and literals which is used to restrict resolution to the maximal literals
+
+    Symbols are compared with their precedence where the symbols given in the precedence list are greater than the
+    others and among them later ones are greater. The rest of the symbols are compared by their arity and then by
+    their names. Literals are compared by their atoms, i.e. predicates as if they are function symbols, and a negative
+    literal is greater than the positive literal of the same atom.
+    """
+    GREATER = '>'
+    EQUAL = '='
+    LESS = '<'
+    INCOMPARABLE = '?'
+
+    def __init__(self, precedence: Sequence[str] = ()):
+        self.precedence = {name: index for index, name in enumerate(precedence)}
+
+    @abstractmethod
+    def compare(self, term1: FirstOrderPredicateLogicEntity, term2: FirstOrderPredicateLogicEntity) -> str:
+        """
+        Compare two terms or two atoms
+        :return: One of GREATER, EQUAL, LESS and INCOMPARABLE
+        """
+
+    def is_greater(self, term1: FirstOrderPredicateLogicEntity, term2: FirstOrderPredicateLogicEntity) -> bool:
+        return self.compare(term1, term2) == TermOrdering.GREATER
+
+    def compare_literals(self, literal1: Predicate, literal2: Predicate) -> str:
+        """
+        Compare two literals by their atoms where negation breaks the tie of the same atoms
+        """
+        if literal1.get_name() != literal2.get_name() or literal1.get_child() != literal2.get_child():
+            return self.compare(literal1, literal2)
+        if literal1.is_negated == literal2.is_negated:
+            return TermOrdering.EQUAL
+        return TermOrdering.GREATER if literal1.is_negated else TermOrdering.LESS
+
+    def symbol_key(self, entity: FirstOrderPredicateLogicEntity) -> Tuple[bool, int, int, str]:
+        """
+        Precedence key of the head symbol of the entity, greater key means greater symbol
+        """
+        arity = len(entity.get_child()) if entity.has_child() else 0
+        index = self.precedence.get(entity.get_name())
+        return index is not None, index if index is not None else 0, arity, entity.get_name()
+
+    @staticmethod
+    def _arguments(entity: FirstOrderPredicateLogicEntity) -> Tuple[FirstOrderPredicateLogicEntity, ...]:
+        return entity.get_child() if entity.has_child() else ()
+
+
+class KnuthBendixOrdering(TermOrdering):
+    """
+    Knuth-Bendix ordering (KBO) where each symbol and variable weighs one unless another weight is given for the symbol
+
+    A term is greater than another one if it has each variable at least as many times as the other term and either it
+    is heavier or they weigh the same and it is greater by the precedence of the head symbols or by the arguments
+    compared lexicographically.
+    """
+    VARIABLE_WEIGHT = 1
+
+    def __init__(self, precedence: Sequence[str] = (), weights: Optional[Dict[str, int]] = None):
+        super().__init__(precedence)
+        self.weights = dict(weights) if weights is not None else {}
+        if any(weight < 1 for weight in self.weights.values()):
+            raise ValueError('Weights of the symbols should be positive: {0}'.format(self.weights))
+
+    def compare(self, term1: FirstOrderPredicateLogicEntity, term2: FirstOrderPredicateLogicEntity) -> str:
+        if term1 is term2:
+            return TermOrdering.EQUAL
+        if isinstance(term2, Variable):
+            return TermOrdering.GREATER if term2 in term1 else TermOrdering.INCOMPARABLE
+        if isinstance(term1, Variable):
+            return TermOrdering.LESS if term1 in term2 else TermOrdering.INCOMPARABLE
+
+        weight1, variables1 = self._weight_and_variables(term1)
+        weight2, variables2 = self._weight_and_variables(term2)
+        # Variable condition, a greater term has each variable of the smaller one at least as many times
+        covers1 = all(variables1[variable] >= count for variable, count in variables2.items())
+        covers2 = all(variables2[variable] >= count for variable, count in variables1.items())
+
+        if weight1 != weight2:
+            result = TermOrdering.GREATER if weight1 > weight2 else TermOrdering.LESS
+        else:
+            key1, key2 = self.symbol_key(term1), self.symbol_key(term2)
+            if key1 != key2:
+                result = TermOrdering.GREATER if key1 > key2 else TermOrdering.LESS
+            else:
+                result = TermOrdering.EQUAL
+                for argument1, argument2 in zip(self._arguments(term1), self._arguments(term2)):
+                    result = self.compare(argument1, argument2)
+                    if result != TermOrdering.EQUAL:
+                        break
+                if result in (TermOrdering.EQUAL, TermOrdering.INCOMPARABLE):
+                    return result
+        if result == TermOrdering.GREATER:
+            return result if covers1 else TermOrdering.INCOMPARABLE
+        return result if covers2 else TermOrdering.INCOMPARABLE
+
+    def _weight_and_variables(self, entity: FirstOrderPredicateLogicEntity) -> Tuple[int, Counter]:
+        weight, variables = 0, Counter()
+        stack = [entity]
+        while stack:
+            entity = stack.pop()
+            if isinstance(entity, Variable):
+                weight += KnuthBendixOrdering.VARIABLE_WEIGHT
+                variables[entity] += 1
+                continue
+            weight += self.weights.get(entity.get_name(), 1)
+            if entity.has_child():
+                stack.extend(entity.get_child())
+        return weight, variables
+
+
+class LexicographicPathOrdering(TermOrdering):
+    """
+    Lexicographic path ordering (LPO) where a term is greater than another one if any of its arguments is greater than
+    or equal to the other term, or it is greater than all the arguments of the other term and either its head symbol
+    has greater precedence or the heads are the same and its arguments are lexicographically greater
+    """
+
+    def compare(self, term1: FirstOrderPredicateLogicEntity, term2: FirstOrderPredicateLogicEntity) -> str:
+        if term1 is term2:
+            return TermOrdering.EQUAL
+        if isinstance(term2, Variable):
+            return TermOrdering.GREATER if term2 in term1 else TermOrdering.INCOMPARABLE
+        if isinstance(term1, Variable):
+            return TermOrdering.LESS if term1 in term2 else TermOrdering.INCOMPARABLE
+        if self._dominates(term1, term2):
+            return TermOrdering.GREATER
+        if self._dominates(term2, term1):
+            return TermOrdering.LESS
+        return TermOrdering.INCOMPARABLE
+
+    def _dominates(self, term1: FirstOrderPredicateLogicEntity, term2: FirstOrderPredicateLogicEntity) -> bool:
+        """
+        Check whether the first term is greater than the second one where neither of them is a variable
+        """
+        arguments1, arguments2 = self._arguments(term1), self._arguments(term2)
+        if any(self.compare(argument, term2) in (TermOrdering.GREATER, TermOrdering.EQUAL) for argument in arguments1):
+            return True
+        key1, key2 = self.symbol_key(term1), self.symbol_key(term2)
+        if key1 < key2:
+            return False
+        if key1 == key2:
+            for index, (argument1, argument2) in enumerate(zip(arguments1, arguments2)):
+                result = self.compare(argument1, argument2)
+                if result == TermOrdering.EQUAL:
+                    continue
+                if result != TermOrdering.GREATER:
+                    return False
+                arguments2 = arguments2[index + 1:]
+                break
+            else:
+                return False
+        return all(self.compare(term1, argument) == TermOrdering.GREATER for argument in arguments2)
+
+
+TERM_ORDERINGS = {
+    'kbo': KnuthBendixOrdering,
+    'lpo': LexicographicPathOrdering,
+}
+
+
+class TermOrderingUnitTest(unittest.TestCase):
+
+    @staticmethod
+    def _term(value):
+        from .entity.entity_parser import EntityParser
+        return EntityParser.parse_predicate('p({0})'.format(value)).get_child()[0]
+
+    def test_knuth_bendix_ordering(self):
+        ordering = KnuthBendixOrdering()
+        f_x, x, y = self._term('f(x)'), self._term('x'), self._term('y')
+        self.assertEqual(TermOrdering.GREATER, ordering.compare(f_x, x))
+        self.assertEqual(TermOrdering.LESS, ordering.compare(x, f_x))
+        self.assertEqual(TermOrdering.INCOMPARABLE, ordering.compare(f_x, y))
+        self.assertEqual(TermOrdering.EQUAL, ordering.compare(f_x, self._term('f(x)')))
+        # Heavier term is greater only if it has all the variables of the other term
+        self.assertEqual(TermOrdering.GREATER, ordering.compare(self._term('g(f(x), A)'), self._term('g(x, A)')))
+        self.assertEqual(TermOrdering.LESS, ordering.compare(self._term('f(f(x))'), self._term('g(x, y)')))
+        self.assertEqual(TermOrdering.INCOMPARABLE, ordering.compare(self._term('f(f(x))'), self._term('g(y, A)')))
+        # Terms of the same weight are compared by precedence, where greater arity is greater by default
+        self.assertEqual(TermOrdering.GREATER, ordering.compare(self._term('g(x, A)'), self._term('f(f(x))')))
+        self.assertEqual(TermOrdering.GREATER, ordering.compare(self._term('B'), self._term('A')))
+        self.assertEqual(TermOrdering.LESS, KnuthBendixOrdering(precedence=['B', 'A']).compare(self._term('B'),
+                                                                                               self._term('A')))
+        self.assertEqual(TermOrdering.LESS, KnuthBendixOrdering(weights={'A': 3}).compare(self._term('f(B)'),
+                                                                                          self._term('A')))
+        # Same head symbols are compared by their arguments
+        self.assertEqual(TermOrdering.GREATER, ordering.compare(self._term('g(B, x)'), self._term('g(A, x)')))
+        with self.assertRaises(ValueError):
+            _ = KnuthBendixOrdering(weights={'A': 0})
+
+    def test_lexicographic_path_ordering(self):
+        ordering = LexicographicPathOrdering()
+        f_x, x, y = self._term('f(x)'), self._term('x'), self._term('y')
+        self.assertEqual(TermOrdering.GREATER, ordering.compare(f_x, x))
+        self.assertEqual(TermOrdering.INCOMPARABLE, ordering.compare(f_x, y))
+        # Greater head symbol dominates the arguments of the other term regardless of the size
+        self.assertEqual(TermOrdering.GREATER, ordering.compare(self._term('g(x, A)'), self._term('f(f(f(x)))')))
+        self.assertEqual(TermOrdering.LESS, ordering.compare(self._term('g(x, y)'), self._term('f(g(x, y))')))
+        self.assertEqual(TermOrdering.GREATER, ordering.compare(self._term('g(f(x), y)'), self._term('g(x, f(y))')))
+        self.assertEqual(TermOrdering.INCOMPARABLE, ordering.compare(self._term('g(x, y)'), self._term('g(y, x)')))
+
+    def test_compare_literals(self):
+        from .entity.entity_parser import EntityParser
+
+        p_a, not_p_a = EntityParser.parse_predicate('p(A)'), EntityParser.parse_predicate('~p(A)')
+        # Orderings define their own comparison of terms
+        with self.assertRaises(TypeError):
+            _ = TermOrdering()
+        for ordering in (KnuthBendixOrdering(), LexicographicPathOrdering()):
+            self.assertEqual(TermOrdering.GREATER, ordering.compare_literals(not_p_a, p_a))
+            self.assertEqual(TermOrdering.LESS, ordering.compare_literals(p_a, not_p_a))
+            self.assertEqual(TermOrdering.EQUAL, ordering.compare_literals(p_a, p_a))
+            self.assertEqual(TermOrdering.GREATER,
+                             ordering.compare_literals(EntityParser.parse_predicate('q(f(A))'), not_p_a))
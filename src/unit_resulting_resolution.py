@@ -0,0 +1,168 @@
+import unittest
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .clause_index import GroundUnitIndex, LiteralIndex
+from .entity.clause import Clause
+from .entity.predicate import Predicate
+from .proof_result import ProofStep
+from .search_statistics import SearchStatistics
+
+
+class UnitResultingResolver(object):
+    """
+    Unit Resulting Resolution
+    =========================
+    Inference which resolves all but one literal of a nucleus clause with unit clauses, i.e. electrons, so that the
+    result is a unit clause, e.g. nucleus ~p(x), ~q(x), r(x) with electrons p(A) and q(A) results into r(A)
+
+    Electrons are resolved one at a time by binary resolution, so each UR resolvent comes with the chain of binary
+    resolution steps deriving it, and the intermediate clauses are never kept by the search. Ground literals of the
+    nucleus are resolved first, since their only ground electron is found by a hash lookup and they fail fast when
+    the fact does not exist. Non-ground literals are looked up in the literal indices of the electrons. Binary
+    resolution steps are counted if statistics are given.
+    """
+
+    def __init__(self, clauses: Iterable[Clause] = (), statistics: Optional[SearchStatistics] = None):
+        self.statistics = statistics
+        self.ground_units = GroundUnitIndex()
+        # Literal indices of ground and non-ground electrons, ground ones are also kept in the hash index
+        self.ground_unit_index = LiteralIndex()
+        self.non_ground_unit_index = LiteralIndex()
+        for clause in clauses:
+            self.add(clause)
+
+    def add(self, clause: Clause) -> bool:
+        """
+        Insert the clause as an electron if it is a unit clause
+        :param clause: Clause to be indexed
+        :return: Boolean flag representing whether the clause is a unit clause or not
+        """
+        if clause.get_clause_length() != 1:
+            return False
+        if GroundUnitIndex.is_ground_unit(clause):
+            if self.ground_units.add(clause):
+                self.ground_unit_index.add(clause)
+        else:
+            self.non_ground_unit_index.add(clause)
+        return True
+
+    def remove(self, clause: Clause):
+        """
+        Remove the clause from the electrons if it is indexed
+        :param clause: Clause to be removed
+        """
+        if clause.get_clause_length() != 1:
+            return
+        if self.ground_units.remove(clause):
+            self.ground_unit_index.remove(clause)
+        else:
+            self.non_ground_unit_index.remove(clause)
+
+    def resolve(self, nucleus: Clause) -> Iterator[List[ProofStep]]:
+        """
+        UR resolvents of the nucleus with the indexed electrons
+        :param nucleus: Clause whose all literals except for one are resolved
+        :return: Generator of the binary resolution steps of each UR resolvent where the first step resolves the
+        nucleus and the last step derives the unit clause
+        """
+        if nucleus.get_clause_length() < 2:
+            return
+        for kept_index, kept_predicate in enumerate(nucleus.predicates):
+            # Repeated literals result into the same resolvents
+            if kept_predicate in nucleus.predicates[:kept_index]:
+                continue
+            pending = nucleus.predicates[:kept_index] + nucleus.predicates[kept_index + 1:]
+            yield from self._resolve_pending(nucleus, pending, [])
+
+    def find_electrons(self, predicate: Predicate) -> Iterator[Tuple[Clause, Predicate]]:
+        """
+        Electrons whose literals may be resolved with the given literal
+        :param predicate: Literal of a nucleus
+        :return: Iterator of electrons and their literals
+        """
+        if predicate.is_ground():
+            electron = self.ground_units.find_complementary_unit(predicate)
+            if electron is not None:
+                yield electron, electron.predicates[0]
+        else:
+            yield from self.ground_unit_index.find_complementary_literals(predicate)
+        yield from self.non_ground_unit_index.find_complementary_literals(predicate)
+
+    def _resolve_pending(self, clause: Clause, pending: List[Predicate],
+                         steps: List[ProofStep]) -> Iterator[List[ProofStep]]:
+        """
+        Resolve the pending literals of the clause where the remaining literal of the clause is kept
+        """
+        if not pending:
+            yield steps
+            return
+        index = next((index for index, predicate in enumerate(pending) if predicate.is_ground()), 0)
+        predicate, rest_of_pending = pending[index], pending[:index] + pending[index + 1:]
+        for electron, electron_predicate in list(self.find_electrons(predicate)):
+            resolvent, substitutions = clause.resolve_on(electron, predicate, electron_predicate)
+            if self.statistics is not None:
+                self.statistics.count_resolutions([(clause, predicate, electron, electron_predicate)],
+                                                  [(resolvent, substitutions)])
+            if resolvent is None:
+                continue
+            # Variables of the clause are not renamed while resolving, so pending literals are instantiated the same
+            # way as the literals of the resolvent, where the literals which become identical are merged as in the
+            # resolvent
+            bindings = {substitution.variable: substitution.substitute for substitution in substitutions}
+            pending_of_resolvent = list(dict.fromkeys(literal.instantiate(bindings) for literal in rest_of_pending))
+            yield from self._resolve_pending(resolvent, pending_of_resolvent,
+                                             steps + [(clause, electron, resolvent, substitutions)])
+
+
+class UnitResultingResolverUnitTest(unittest.TestCase):
+
+    def test_resolve(self):
+        from .clause_index import LiteralIndexUnitTest
+
+        nucleus = LiteralIndexUnitTest._clause('~p(x), ~q(x, y), r(y)')
+        electrons = [LiteralIndexUnitTest._clause(text) for text in ['p(A)', 'p(B)', 'q(A, C)', 'q(z, D)', 's(A)']]
+        resolver = UnitResultingResolver(electrons)
+
+        steps = list(resolver.resolve(nucleus))
+        resolvents = [chain[-1][2] for chain in steps]
+        self.assertCountEqual([LiteralIndexUnitTest._clause(text) for text in ['r(C)', 'r(D)', 'r(D)']], resolvents)
+        for chain in steps:
+            self.assertEqual(nucleus, chain[0][0])
+            self.assertEqual(2, len(chain))
+            # Each step resolves the resolvent of the previous step
+            self.assertEqual(chain[0][2], chain[1][0])
+
+        # Ground literals are resolved by hash lookup once the other literals bind their variables
+        nucleus = LiteralIndexUnitTest._clause('~p(x), ~q(x, C), ~s(x)')
+        self.assertCountEqual([LiteralIndexUnitTest._clause(text) for text in ['~q(A, C)', '~p(A)', '~s(A)']],
+                              [chain[-1][2] for chain in resolver.resolve(nucleus)])
+
+    def test_merged_pending_literals(self):
+        from .autonomous_theorem_prover import AutonomousTheoremProver, AutonomousTheoremProverUnitTest
+        from .clause_index import LiteralIndexUnitTest
+
+        # Pending literals ~p(x) and ~p(y) become identical once ~a(x, y) is resolved, so they are resolved only once
+        nucleus = LiteralIndexUnitTest._clause('~a(x,y), ~p(x), ~p(y), r(x)')
+        resolver = UnitResultingResolver([LiteralIndexUnitTest._clause(text) for text in ['a(z,z)', 'p(A)']])
+        steps = list(resolver.resolve(nucleus))
+        self.assertEqual([LiteralIndexUnitTest._clause('r(A)')], [chain[-1][2] for chain in steps])
+        self.assertEqual([2], [len(chain) for chain in steps])
+
+        strategy = AutonomousTheoremProver.GIVEN_CLAUSE_STRATEGY
+        self.assertTrue(AutonomousTheoremProverUnitTest._prove(['a(z,z)', 'p(A)', '~a(x,y),~p(x),~p(y),r(x)'],
+                                                               ['~r(A)'], search_strategy=strategy,
+                                                               unit_resulting_resolution=True))
+
+    def test_remove(self):
+        from .clause_index import LiteralIndexUnitTest
+
+        nucleus = LiteralIndexUnitTest._clause('~p(x), r(x)')
+        electrons = [LiteralIndexUnitTest._clause(text) for text in ['p(A)', 'p(y)']]
+        resolver = UnitResultingResolver(electrons)
+        self.assertFalse(resolver.add(nucleus))
+        self.assertEqual(2, len(list(resolver.resolve(nucleus))))
+
+        resolver.remove(electrons[0])
+        resolver.remove(electrons[1])
+        self.assertEqual(0, len(resolver.ground_units))
+        self.assertEqual([], list(resolver.resolve(nucleus)))